@@ -19,6 +19,26 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+from .indexes.media import MediaIndex
+from .indexes.request import RequestIndex
 from .overseerr import Overseerr
+from .utils.breaker import CircuitBreaker
+from .utils.cache import ResponseCache, SqliteResponseCache
+from .utils.metrics import Metrics
+from .utils.ratelimit import RateLimiter
+from .utils.timeouts import TimeoutConfig, deadline
+from .utils.transport import TransportConfig
 
-__all__ = ["Overseerr"]
+__all__ = [
+    "CircuitBreaker",
+    "MediaIndex",
+    "Metrics",
+    "Overseerr",
+    "RateLimiter",
+    "RequestIndex",
+    "ResponseCache",
+    "SqliteResponseCache",
+    "TimeoutConfig",
+    "TransportConfig",
+    "deadline",
+]
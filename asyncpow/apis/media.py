@@ -20,25 +20,35 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 
-from typing import Optional
+from functools import partial
+from typing import AsyncGenerator, Iterable, Optional, cast
 
-from aiohttp import ClientSession, hdrs
+from aiohttp import hdrs
 from yarl import URL
 
-from asyncpow.models.common import SortOptions
-from asyncpow.models.media import MediaFilterOptions, MediaModel, MediaModel2, MediaStatusOptions
-from asyncpow.utils.http import request
+from asyncpow.models.common import PaginatedResponseModel, SortOptions
+from asyncpow.models.lazy import LazyPageModel
+from asyncpow.models.media import (
+    MediaFilterOptions,
+    MediaInfoModel,
+    MediaModel,
+    MediaModel2,
+    MediaStatusOptions,
+)
+from asyncpow.models.projection import projection, projection_page
+from asyncpow.utils.pagination import fetch_all_pages, page_info_pages, paginate
+from asyncpow.utils.transport import Transport
 
 
 class Media:
     """
     Class to interact with media-related endpoints.
 
-    Initialize the Media object with the base URL, API key, and session.
+    Initialize the Media object with the base URL, API key, and transport.
     """
 
     def __init__(
-        self, base_url: URL, api_key: str, session: ClientSession, raw_response: bool
+        self, base_url: URL, api_key: str, transport: Transport, raw_response: bool
     ) -> None:
         """
         Initialize the MediaAPI object with the base URL and API key.
@@ -46,7 +56,7 @@ class Media:
         Args:
             base_url (str): The base URL for the media API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session
+            transport (Transport): HTTP transport.
             raw_response (bool): Return json if True.
 
         Returns:
@@ -54,7 +64,7 @@ class Media:
         """
         self.media_url = base_url.joinpath("media")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
         self.raw_response = raw_response
 
     async def async_get_media(
@@ -64,7 +74,9 @@ class Media:
         filter: MediaFilterOptions | None = None,
         sort: SortOptions | None = None,
         raw_response: bool | None = None,
-    ) -> dict | MediaModel:
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> dict | MediaModel | PaginatedResponseModel:
         """
         Get media items based on specified parameters.
 
@@ -74,9 +86,14 @@ class Media:
             filter (MediaFilterOptions): The filter option for media items (default is None).
             sort (SortOptions): The sorting option for media items (default is None).
             raw_response (bool, optional): return raw json. Defaults to None.
+            lazy (bool): validate each result into a MediaInfoModel on first access
+                (default is False).
+            fields (Iterable[str], optional): only keep these MediaInfoModel fields, see
+                asyncpow.models.projection (default is None).
 
         Returns:
-            dict | MediaModel: The media model object retrieved based on the parameters.
+            dict | MediaModel | PaginatedResponseModel: The media model object retrieved based
+            on the parameters, a LazyPageModel if lazy or a projection page if fields are given.
         """
         if raw_response is None:
             raw_response = self.raw_response
@@ -88,8 +105,134 @@ class Media:
             params["sort"] = sort
 
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, self.media_url, params=params, headers=headers)
-        return response if raw_response else MediaModel(**response)
+        response = await self.transport.request(self.media_url, params=params, headers=headers)
+        if raw_response:
+            return response
+        if lazy:
+            model = projection(MediaInfoModel, fields) if fields else MediaInfoModel
+            return LazyPageModel.from_response(model, response)
+        if fields:
+            return self.transport.parse(projection_page(MediaInfoModel, fields), response)
+        return self.transport.parse(MediaModel, response)
+
+    async def async_iter_media(
+        self,
+        take: int = 100,
+        filter: MediaFilterOptions | None = None,
+        sort: SortOptions | None = None,
+        raw_response: bool | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[dict | MediaInfoModel, None]:
+        """
+        Iterate over all media items, page by page.
+
+        The next page is requested while the current one is consumed.
+
+        Args:
+            take (int): The number of items to retrieve per page (default is 100).
+            filter (MediaFilterOptions): The filter option for media items (default is None).
+            sort (SortOptions): The sorting option for media items (default is None).
+            raw_response (bool, optional): yield raw json. Defaults to None.
+            fields (Iterable[str], optional): only keep these MediaInfoModel fields, see
+                asyncpow.models.projection (default is None).
+
+        Yields:
+            dict | MediaInfoModel: The media items.
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+        model = projection(MediaInfoModel, fields) if fields else MediaInfoModel
+
+        async def fetch_page(skip: int) -> dict:
+            """Fetch the raw page starting at skip."""
+            page = await self.async_get_media(take, skip, filter, sort, raw_response=True)
+            return cast(dict, page)
+
+        async for page in paginate(fetch_page, take):
+            for item in page["results"]:
+                yield item if raw_response else self.transport.parse(model, item)
+
+    async def async_stream_media(
+        self,
+        take: int = 1000,
+        skip: int = 0,
+        filter: MediaFilterOptions | None = None,
+        sort: SortOptions | None = None,
+        raw_response: bool | None = None,
+        fields: Iterable[str] | None = None,
+        envelope: dict | None = None,
+    ) -> AsyncGenerator[dict | MediaInfoModel, None]:
+        """
+        Stream the media items of one large page while it downloads.
+
+        Each item is yielded as soon as it has been received, so memory does not grow with
+        take and the first item arrives before the page is complete. The response is not
+        cached.
+
+        Args:
+            take (int): The number of items to retrieve (default is 1000).
+            skip (int): The number of items to skip (default is 0).
+            filter (MediaFilterOptions): The filter option for media items (default is None).
+            sort (SortOptions): The sorting option for media items (default is None).
+            raw_response (bool, optional): yield raw json. Defaults to None.
+            fields (Iterable[str], optional): only keep these MediaInfoModel fields, see
+                asyncpow.models.projection (default is None).
+            envelope (dict, optional): filled with the pageInfo of the response once the
+                last item has been yielded (default is None).
+
+        Yields:
+            dict | MediaInfoModel: The media items.
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+        model = projection(MediaInfoModel, fields) if fields else MediaInfoModel
+
+        params: dict = {"take": take, "skip": skip}
+        if filter:
+            params["filter"] = filter
+        if sort:
+            params["sort"] = sort
+
+        headers = {"X-Api-Key": self.api_key}
+        async for item in self.transport.stream(
+            self.media_url, params=params, headers=headers, envelope=envelope
+        ):
+            yield item if raw_response else self.transport.parse(model, item)
+
+    async def async_get_all_media(
+        self,
+        take: int = 100,
+        filter: MediaFilterOptions | None = None,
+        sort: SortOptions | None = None,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+        raw_response: bool | None = None,
+    ) -> list[dict | MediaModel | BaseException]:
+        """
+        Get every page of media items, fetching the pages after the first concurrently.
+
+        Args:
+            take (int): The number of items per page (default is 100).
+            filter (MediaFilterOptions): The filter option for media items (default is None).
+            sort (SortOptions): The sorting option for media items (default is None).
+            concurrency (int): The maximum number of pages fetched at once (default is 4).
+            return_exceptions (bool): Return the exception of a failed page in its place
+                instead of raising it (default is False).
+            raw_response (bool, optional): return raw json. Defaults to None.
+
+        Returns:
+            list[dict | MediaModel | BaseException]: The pages, in order.
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+
+        return await fetch_all_pages(
+            lambda index: self.async_get_media(take, index * take, filter, sort, raw_response=True),
+            page_info_pages,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+            parse=None if raw_response else partial(self.transport.parse, MediaModel),
+        )
 
     async def async_post_media_status(
         self,
@@ -116,10 +259,11 @@ class Media:
         url = self.media_url.joinpath(str(mediaId), str(status))
         data = {"is4k": is4k} if is4k else {}
         headers = {"X-Api-Key": self.api_key}
-        response = await request(
-            self.session, url, method=hdrs.METH_POST, data=data, headers=headers
+        response = await self.transport.request(
+            url, method=hdrs.METH_POST, data=data, headers=headers
         )
-        return response if raw_response else MediaModel2(**response)
+        self._invalidate(response.get("tmdbId") if isinstance(response, dict) else None)
+        return response if raw_response else self.transport.parse(MediaModel2, response)
 
     async def async_delete_media(self, mediaId: int) -> None:
         """
@@ -134,4 +278,25 @@ class Media:
 
         url = self.media_url.joinpath(str(mediaId))
         headers = {"X-Api-Key": self.api_key}
-        await request(self.session, url, method=hdrs.METH_DELETE, headers=headers)
+        await self.transport.request(url, method=hdrs.METH_DELETE, headers=headers)
+        self._invalidate()
+
+    def _invalidate(self, tmdb_id: int | None = None) -> None:
+        """Remove the cached responses made stale by a change to a media item.
+
+        The media lists and requests are removed, along with the movie and TV details of
+        tmdb_id as the media type is not known.
+
+        Args:
+            tmdb_id (int, optional): TMDB ID of the media item, if known. Defaults to None.
+
+        Returns:
+            None
+        """
+        api_url = self.media_url.parent
+        details = (
+            [api_url.joinpath(kind, str(tmdb_id)) for kind in ("movie", "tv")]
+            if tmdb_id is not None
+            else []
+        )
+        self.transport.invalidate(*details, endpoints=("media", "request"))
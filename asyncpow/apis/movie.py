@@ -19,11 +19,14 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from aiohttp import ClientSession
+from functools import partial
+from typing import Iterable
+
 from yarl import URL
 
 from asyncpow.models.movie import MovieDetailsModel
-from asyncpow.utils.http import request
+from asyncpow.utils.concurrency import gather_bounded
+from asyncpow.utils.transport import Transport
 
 
 class Movie:
@@ -32,7 +35,7 @@ class Movie:
     """
 
     def __init__(
-        self, base_url: URL, api_key: str, session: ClientSession, raw_response: bool
+        self, base_url: URL, api_key: str, transport: Transport, raw_response: bool
     ) -> None:
         """
         Initialize the MovieAPI object with the base URL and API key.
@@ -40,7 +43,7 @@ class Movie:
         Args:
             base_url (str): The base URL for the media API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session
+            transport (Transport): HTTP transport.
             raw_response (bool): Return json if True.
 
         Returns:
@@ -48,7 +51,7 @@ class Movie:
         """
         self.media_url = base_url.joinpath("movie")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
         self.raw_response = raw_response
 
     async def async_get_movie(
@@ -72,5 +75,39 @@ class Movie:
         url = self.media_url.joinpath(str(id))
 
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, url, params=params, headers=headers)
-        return response if raw_response else MovieDetailsModel(**response)
+        response = await self.transport.request(url, params=params, headers=headers)
+        return response if raw_response else self.transport.parse(MovieDetailsModel, response)
+
+    async def async_get_movies(
+        self,
+        ids: Iterable[int],
+        lang: str = "en",
+        concurrency: int = 8,
+        raw_response: bool | None = None,
+    ) -> dict[int, dict | MovieDetailsModel | BaseException]:
+        """
+        Retrieves the details of many movies by ID asynchronously.
+
+        Duplicate IDs are fetched once and at most concurrency requests are in flight,
+        responses are served from the cache when one is configured.
+
+        Args:
+            ids (Iterable[int]): The IDs of the movies.
+            lang (str): The language for the response (default is "en").
+            concurrency (int): The maximum number of requests in flight (default is 8).
+            raw_response (bool, optional): return raw json. Defaults to None.
+
+        Returns:
+            dict[int, dict | MovieDetailsModel | BaseException]: The details keyed on ID, or the
+            exception raised for that ID.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        results = await gather_bounded(
+            (
+                partial(self.async_get_movie, id, lang=lang, raw_response=raw_response)
+                for id in unique_ids
+            ),
+            concurrency,
+            return_exceptions=True,
+        )
+        return dict(zip(unique_ids, results))
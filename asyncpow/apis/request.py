@@ -19,43 +19,54 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Literal
+from functools import partial
+from typing import AsyncGenerator, Iterable, Literal, cast
 
-from aiohttp import ClientSession, hdrs
+from aiohttp import hdrs
 from yarl import URL
 
 from asyncpow.apis.movie import Movie
 from asyncpow.apis.tv import Tv
 from asyncpow.exceptions import POWException, POWMediaTypeException
-from asyncpow.models.common import SortOptions
+from asyncpow.indexes.media import MediaIndex
+from asyncpow.models.common import PaginatedResponseModel, SortOptions
+from asyncpow.models.lazy import LazyPageModel
 from asyncpow.models.media import MediaRequestModel
-from asyncpow.models.request import RequestFilterOptions, RequestResultsResponseModel
-from asyncpow.models.tv import TvDetailsModel
-from asyncpow.utils.http import request
+from asyncpow.models.projection import projection, projection_page
+from asyncpow.models.request import (
+    BulkRequestResultModel,
+    RequestFilterOptions,
+    RequestItem,
+    RequestResultsResponseModel,
+    SeriesOptions,
+)
+from asyncpow.utils.concurrency import gather_bounded
+from asyncpow.utils.pagination import fetch_all_pages, page_info_pages, paginate
+from asyncpow.utils.transport import Transport
 
 
 class Request:
     """
     Class to interact with request-related endpoints.
 
-    Initialize the Request object with the base URL, API key, and session.
+    Initialize the Request object with the base URL, API key, and transport.
     """
 
     def __init__(
         self,
         base_url: URL,
         api_key: str,
-        session: ClientSession,
+        transport: Transport,
         raw_response: bool,
         tv_instance: Tv,
         movie_instance: Movie,
     ) -> None:
-        """Initialize the RequestAPI object with the base URL, API key, and session.
+        """Initialize the RequestAPI object with the base URL, API key, and transport.
 
         Args:
             base_url (str): The base URL for the media API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session
+            transport (Transport): HTTP transport.
             tv_instance (Search): The Search class instance
 
         Returns:
@@ -63,7 +74,7 @@ class Request:
         """
         self.request_url = base_url.joinpath("request")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
         self.raw_response = raw_response
         self.tv = tv_instance
         self.movie = movie_instance
@@ -75,8 +86,10 @@ class Request:
         skip: int = 0,
         filter: RequestFilterOptions = "all",
         sort: SortOptions = "added",
-        requested_by: int = 1,
-    ) -> dict | RequestResultsResponseModel:
+        requested_by: int | None = 1,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> dict | RequestResultsResponseModel | PaginatedResponseModel:
         """Get a list of requests
 
         Args:
@@ -85,33 +98,169 @@ class Request:
             skip (int, optional): Pages to skip. Defaults to 0.
             filter (RequestFilterOptions, optional): Filter requests. Defaults to "all".
             sort (SortOptions, optional): Sort Requests. Defaults to "added".
-            requested_by (int, optional): Only requests by user. Defaults to 1.
+            requested_by (int, optional): Only requests by user, None for every user.
+                Defaults to 1.
+            lazy (bool, optional): Validate each result into a MediaRequestModel on first
+                access. Defaults to False.
+            fields (Iterable[str], optional): Only keep these MediaRequestModel fields, see
+                asyncpow.models.projection. Defaults to None.
 
         Returns:
-            dict | RequestResultsResponseModel: Returns a request record
+            dict | RequestResultsResponseModel | PaginatedResponseModel: Returns a page of
+            requests, a LazyPageModel if lazy or a projection page if fields are given
         """
         if raw_response is None:
             raw_response = self.raw_response
 
-        url = self.request_url.with_query(
-            {
-                "take": take,
-                "skip": skip,
-                "filter": filter,
-                "sort": sort,
-                "requestedBy": requested_by,
-            }
-        )
+        query: dict = {"take": take, "skip": skip, "filter": filter, "sort": sort}
+        if requested_by is not None:
+            query["requestedBy"] = requested_by
+        url = self.request_url.with_query(query)
+        headers = {"X-Api-Key": self.api_key}
+        response = await self.transport.request(url, headers=headers)
+        if raw_response:
+            return response
+        if lazy:
+            model = projection(MediaRequestModel, fields) if fields else MediaRequestModel
+            return LazyPageModel.from_response(model, response)
+        if fields:
+            return self.transport.parse(projection_page(MediaRequestModel, fields), response)
+        return self.transport.parse(RequestResultsResponseModel, response)
+
+    async def async_iter_requests(
+        self,
+        raw_response: bool | None = None,
+        take: int = 100,
+        filter: RequestFilterOptions = "all",
+        sort: SortOptions = "added",
+        requested_by: int | None = 1,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[dict | MediaRequestModel, None]:
+        """Iterate over all requests, page by page
+
+        The next page is requested while the current one is consumed.
+
+        Args:
+            raw_response (bool, optional): Yield JSON items. Defaults to None.
+            take (int, optional): Number of requests per page. Defaults to 100.
+            filter (RequestFilterOptions, optional): Filter requests. Defaults to "all".
+            sort (SortOptions, optional): Sort Requests. Defaults to "added".
+            requested_by (int, optional): Only requests by user, None for every user.
+                Defaults to 1.
+            fields (Iterable[str], optional): Only keep these MediaRequestModel fields, see
+                asyncpow.models.projection. Defaults to None.
+
+        Yields:
+            dict | MediaRequestModel: The request records
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+        model = projection(MediaRequestModel, fields) if fields else MediaRequestModel
+
+        async def fetch_page(skip: int) -> dict:
+            """Fetch the raw page starting at skip."""
+            page = await self.async_get_requests(True, take, skip, filter, sort, requested_by)
+            return cast(dict, page)
+
+        async for page in paginate(fetch_page, take):
+            for item in page["results"]:
+                yield item if raw_response else self.transport.parse(model, item)
+
+    async def async_stream_requests(
+        self,
+        raw_response: bool | None = None,
+        take: int = 1000,
+        skip: int = 0,
+        filter: RequestFilterOptions = "all",
+        sort: SortOptions = "added",
+        requested_by: int | None = 1,
+        fields: Iterable[str] | None = None,
+        envelope: dict | None = None,
+    ) -> AsyncGenerator[dict | MediaRequestModel, None]:
+        """Stream the requests of one large page while it downloads
+
+        Each request is yielded as soon as it has been received, so memory does not grow
+        with take and the first request arrives before the page is complete. The response
+        is not cached.
+
+        Args:
+            raw_response (bool, optional): Yield JSON items. Defaults to None.
+            take (int, optional): Number of requests to retrieve. Defaults to 1000.
+            skip (int, optional): Requests to skip. Defaults to 0.
+            filter (RequestFilterOptions, optional): Filter requests. Defaults to "all".
+            sort (SortOptions, optional): Sort Requests. Defaults to "added".
+            requested_by (int, optional): Only requests by user, None for every user.
+                Defaults to 1.
+            fields (Iterable[str], optional): Only keep these MediaRequestModel fields, see
+                asyncpow.models.projection. Defaults to None.
+            envelope (dict, optional): Filled with the pageInfo of the response once the
+                last request has been yielded. Defaults to None.
+
+        Yields:
+            dict | MediaRequestModel: The request records
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+        model = projection(MediaRequestModel, fields) if fields else MediaRequestModel
+
+        query: dict = {"take": take, "skip": skip, "filter": filter, "sort": sort}
+        if requested_by is not None:
+            query["requestedBy"] = requested_by
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, url, headers=headers)
-        return response if raw_response else RequestResultsResponseModel(**response)
+        async for item in self.transport.stream(
+            self.request_url, params=query, headers=headers, envelope=envelope
+        ):
+            yield item if raw_response else self.transport.parse(model, item)
+
+    async def async_get_all_requests(
+        self,
+        raw_response: bool | None = None,
+        take: int = 100,
+        filter: RequestFilterOptions = "all",
+        sort: SortOptions = "added",
+        requested_by: int | None = 1,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[dict | RequestResultsResponseModel | BaseException]:
+        """Get every page of requests, fetching the pages after the first concurrently
+
+        Args:
+            raw_response (bool, optional): Return JSON response. Defaults to None.
+            take (int, optional): Number of requests per page. Defaults to 100.
+            filter (RequestFilterOptions, optional): Filter requests. Defaults to "all".
+            sort (SortOptions, optional): Sort Requests. Defaults to "added".
+            requested_by (int, optional): Only requests by user, None for every user.
+                Defaults to 1.
+            concurrency (int, optional): Maximum number of pages fetched at once. Defaults to 4.
+            return_exceptions (bool, optional): Return the exception of a failed page in its
+                place instead of raising it. Defaults to False.
+
+        Returns:
+            list[dict | RequestResultsResponseModel | BaseException]: The pages, in order
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+
+        return await fetch_all_pages(
+            lambda index: self.async_get_requests(
+                True, take, index * take, filter, sort, requested_by
+            ),
+            page_info_pages,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+            parse=(
+                None if raw_response else partial(self.transport.parse, RequestResultsResponseModel)
+            ),
+        )
 
     async def async_post_request(
         self,
         id: int,
         type: Literal["movie", "tv"],
-        series: Literal["all", "latest", "first"] = "all",
+        series: SeriesOptions = "all",
         raw_response: bool | None = None,
+        tvdb_id: int | None = None,
+        seasons: list[int] | None = None,
     ) -> dict | MediaRequestModel:
         """Get a list of requests
 
@@ -120,6 +269,10 @@ class Request:
             type (str): Type of request movie | tv.
             series (str, optional): What series to request - all | latest | first, only aplies to tv. Defautls to all
             raw_response (bool, optional): Return JSON response. Defaults to None.
+            tvdb_id (int, optional): TVDB ID of the show if known, only applies to tv.
+                Defaults to None.
+            seasons (list[int], optional): Season numbers to request instead of series, only
+                applies to tv. The show is not looked up when given. Defaults to None.
 
         Returns:
             dict | MediaRequestModel: Returns a request record
@@ -133,34 +286,96 @@ class Request:
                 "mediaId": id,
             }
         elif type == "tv":
-            data = await self.tv.async_get_tv(id=id)
-            if not isinstance(data, TvDetailsModel):
-                raise POWException(f"Expecting TvDetailsModel, got {type(data)}")
-            if series == "all":
-                seasons_array = [
-                    season.seasonNumber for season in data.seasons if season.seasonNumber != 0
-                ]
-            elif series == "first":
-                seasons_array = [1]
-
-            elif series == "latest":
-                for season in data.seasons:
-                    seasons_array = [season.seasonNumber]
+            if seasons is None:
+                summary = await self.tv.async_get_tv_seasons(id)
+                if tvdb_id is None:
+                    tvdb_id = summary.tvdbId
+                if series == "all":
+                    seasons = [number for number in summary.seasonNumbers if number != 0]
+                elif series == "first":
+                    seasons = [1]
+                elif series == "latest":
+                    seasons = summary.seasonNumbers[-1:]
             req_data = {
                 "mediaType": "tv",
                 "mediaId": id,
-                "tvdbId": data.externalIds.tvdbId,
-                "seasons": seasons_array,
+                "seasons": seasons,
             }
+            if tvdb_id is not None:
+                req_data["tvdbId"] = tvdb_id
         else:
             raise POWMediaTypeException("Unknown media type, use either movie or tv")
 
         headers = {"X-Api-Key": self.api_key, "Content-Type": "application/json"}
-        response = await request(
-            self.session,
+        response = await self.transport.request(
             self.request_url,
             method=hdrs.METH_POST,
             json_data=req_data,
             headers=headers,
         )
-        return response if raw_response else MediaRequestModel(**response)
+        details = self.movie.media_url if type == "movie" else self.tv.media_url
+        self.transport.invalidate(details.joinpath(str(id)), endpoints=("request", "media"))
+        return response if raw_response else self.transport.parse(MediaRequestModel, response)
+
+    async def async_post_requests(
+        self,
+        items: Iterable[RequestItem],
+        concurrency: int = 4,
+        media_index: MediaIndex | None = None,
+        raw_response: bool | None = None,
+    ) -> list[BulkRequestResultModel]:
+        """Request many movies and TV shows, without stopping at the first failure
+
+        Items are submitted with at most concurrency requests in flight. An item is
+        skipped if it repeats an earlier item, if media_index shows the media is already
+        pending, processing or available, or if Overseerr answers 409 because it is
+        already requested. The seasons of a TV show are read from its details, which are
+        not fetched again while they are in the response cache of the client.
+
+        Args:
+            items (Iterable[RequestItem]): (id, type) or (id, type, series) tuples, series
+                defaults to "all".
+            concurrency (int, optional): Maximum number of items submitted at once.
+                Defaults to 4.
+            media_index (MediaIndex, optional): Synced index used to skip media that is
+                already requested or available. Defaults to None.
+            raw_response (bool, optional): Keep the created requests as JSON. Defaults to None.
+
+        Returns:
+            list[BulkRequestResultModel]: The outcome of each item, in order.
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+
+        seen: set[tuple[int, str]] = set()
+        results: list[BulkRequestResultModel] = []
+        pending: list[BulkRequestResultModel] = []
+        for item in items:
+            media_id, media_type = item[0], item[1]
+            series = item[2] if len(item) > 2 else "all"
+            result = BulkRequestResultModel(
+                id=media_id, type=media_type, series=series, outcome="requested"
+            )
+            results.append(result)
+            existing = None if media_index is None else media_index.by_tmdb_id(media_id, media_type)
+            if (media_id, media_type) in seen:
+                result.outcome, result.reason = "skipped", "Duplicate item"
+            elif existing is not None and existing.status in (2, 3, 5):
+                result.outcome, result.reason = "skipped", f"Media status is {existing.status}"
+            else:
+                pending.append(result)
+            seen.add((media_id, media_type))
+
+        async def submit(result: BulkRequestResultModel) -> None:
+            """Submit one item and record its outcome."""
+            try:
+                result.request = await self.async_post_request(
+                    result.id, result.type, result.series, raw_response=raw_response
+                )
+            except Exception as exception:
+                conflict = isinstance(exception, POWException) and exception.args[:1] == (409,)
+                result.outcome = "skipped" if conflict else "failed"
+                result.reason = f"{type(exception).__name__}: {exception}"
+
+        await gather_bounded([partial(submit, result) for result in pending], concurrency)
+        return results
@@ -19,29 +19,31 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from aiohttp import ClientSession
+from functools import partial
+
 from yarl import URL
 
 from asyncpow.models.search import DiscoverWatchlistModel, SearchResultModel
-from asyncpow.utils.http import request
+from asyncpow.utils.pagination import fetch_all_pages, total_pages
+from asyncpow.utils.transport import Transport
 
 
 class Search:
     """
     Class to interact with search-related endpoints.
 
-    Initialize the Search object with the base URL, API key, and session.
+    Initialize the Search object with the base URL, API key, and transport.
     """
 
     def __init__(
-        self, base_url: URL, api_key: str, session: ClientSession, raw_response: bool
+        self, base_url: URL, api_key: str, transport: Transport, raw_response: bool
     ) -> None:
-        """Initialize the SearchAPI object with the base URL, API key, and session.
+        """Initialize the SearchAPI object with the base URL, API key, and transport.
 
         Args:
             base_url (str): The base URL for the media API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session.
+            transport (Transport): HTTP transport.
             raw_response (bool): Return json if True.
 
         Returns:
@@ -49,7 +51,8 @@ class Search:
         """
         self.search_url = base_url.joinpath("search")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
+        self.raw_response = raw_response
 
     async def async_get_search(
         self, query: str, raw_response: bool | None = None, page: int = 1, lang: str = "en"
@@ -70,26 +73,61 @@ class Search:
 
         url = self.search_url.with_query({"query": query, "page": page, "language": lang})
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, url, headers=headers)
-        return response if raw_response else SearchResultModel(**response)
+        response = await self.transport.request(url, headers=headers)
+        return response if raw_response else self.transport.parse(SearchResultModel, response)
+
+    async def async_get_all_search(
+        self,
+        query: str,
+        raw_response: bool | None = None,
+        lang: str = "en",
+        max_pages: int | None = None,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[dict | SearchResultModel | BaseException]:
+        """Get every page of a search, fetching the pages after the first concurrently
+
+        Args:
+            query (str): The search query.
+            raw_response (bool, optional): return raw json. Defaults to None.
+            lang (str): The language for items (default is "en").
+            max_pages (int, optional): Stop after this many pages. Defaults to None, all pages.
+            concurrency (int): The maximum number of pages fetched at once (default is 4).
+            return_exceptions (bool): Return the exception of a failed page in its place
+                instead of raising it (default is False).
+
+        Returns:
+            list[dict | SearchResultModel | BaseException]: The pages, in order.
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+
+        return await fetch_all_pages(
+            lambda index: self.async_get_search(query, True, page=index + 1, lang=lang),
+            total_pages,
+            concurrency=concurrency,
+            max_pages=max_pages,
+            return_exceptions=return_exceptions,
+            parse=None if raw_response else partial(self.transport.parse, SearchResultModel),
+        )
 
 
 class Discover:
     """
     Class to interact with discover-related endpoints.
 
-    Initialize the Discover object with the base URL, API key, and session.
+    Initialize the Discover object with the base URL, API key, and transport.
     """
 
     def __init__(
-        self, base_url: URL, api_key: str, session: ClientSession, raw_response: bool
+        self, base_url: URL, api_key: str, transport: Transport, raw_response: bool
     ) -> None:
-        """Initialize the DiscoverAPI object with the base URL, API key, and session.
+        """Initialize the DiscoverAPI object with the base URL, API key, and transport.
 
         Args:
             base_url (str): The base URL for the media API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session
+            transport (Transport): HTTP transport.
             raw_response (bool): Return json if True.
 
         Returns:
@@ -97,7 +135,7 @@ class Discover:
         """
         self.discover_url = base_url.joinpath("discover")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
         self.raw_response = raw_response
 
     async def async_get_trending(
@@ -119,8 +157,42 @@ class Discover:
 
         url = self.discover_url.joinpath("trending").with_query({"page": page, "language": lang})
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, url, headers=headers)
-        return response if raw_response else SearchResultModel(**response)
+        response = await self.transport.request(url, headers=headers)
+        return response if raw_response else self.transport.parse(SearchResultModel, response)
+
+    async def async_get_all_trending(
+        self,
+        raw_response: bool | None = None,
+        lang: str = "en",
+        max_pages: int | None = None,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[dict | SearchResultModel | BaseException]:
+        """
+        Get every page of trending items, fetching the pages after the first concurrently.
+
+        Args:
+            raw_response (bool, optional): return raw json. Defaults to None.
+            lang (str): The language for the trending items (default is "en").
+            max_pages (int, optional): Stop after this many pages. Defaults to None, all pages.
+            concurrency (int): The maximum number of pages fetched at once (default is 4).
+            return_exceptions (bool): Return the exception of a failed page in its place
+                instead of raising it (default is False).
+
+        Returns:
+            list[dict | SearchResultModel | BaseException]: The pages, in order.
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+
+        return await fetch_all_pages(
+            lambda index: self.async_get_trending(True, page=index + 1, lang=lang),
+            total_pages,
+            concurrency=concurrency,
+            max_pages=max_pages,
+            return_exceptions=return_exceptions,
+            parse=None if raw_response else partial(self.transport.parse, SearchResultModel),
+        )
 
     async def async_get_watchlist(
         self, raw_response: bool | None = None, page: int = 1
@@ -139,5 +211,37 @@ class Discover:
             raw_response = self.raw_response
         url = self.discover_url.joinpath("watchlist").with_query({"page": page})
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, url, headers=headers)
-        return response if raw_response else DiscoverWatchlistModel(**response)
+        response = await self.transport.request(url, headers=headers)
+        return response if raw_response else self.transport.parse(DiscoverWatchlistModel, response)
+
+    async def async_get_all_watchlist(
+        self,
+        raw_response: bool | None = None,
+        max_pages: int | None = None,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[dict | DiscoverWatchlistModel | BaseException]:
+        """
+        Get every page of the watchlist, fetching the pages after the first concurrently.
+
+        Args:
+            raw_response (bool, optional): return raw json. Defaults to None.
+            max_pages (int, optional): Stop after this many pages. Defaults to None, all pages.
+            concurrency (int): The maximum number of pages fetched at once (default is 4).
+            return_exceptions (bool): Return the exception of a failed page in its place
+                instead of raising it (default is False).
+
+        Returns:
+            list[dict | DiscoverWatchlistModel | BaseException]: The pages, in order.
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+
+        return await fetch_all_pages(
+            lambda index: self.async_get_watchlist(True, page=index + 1),
+            total_pages,
+            concurrency=concurrency,
+            max_pages=max_pages,
+            return_exceptions=return_exceptions,
+            parse=None if raw_response else partial(self.transport.parse, DiscoverWatchlistModel),
+        )
@@ -20,30 +20,29 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 
-from aiohttp import ClientSession
 from yarl import URL
 
 from asyncpow.models.status import StatusAppDataModel, StatusModel
-from asyncpow.utils.http import request
+from asyncpow.utils.transport import Transport
 
 
 class Status:
     """
     Class to interact with status-related endpoints.
 
-    Initialize the Status object with the base URL, API key, and session.
+    Initialize the Status object with the base URL, API key, and transport.
     """
 
     def __init__(
-        self, base_url: URL, api_key: str, session: ClientSession, raw_response: bool
+        self, base_url: URL, api_key: str, transport: Transport, raw_response: bool
     ) -> None:
         """
-        Initialize the Status object with the base URL, API key, and session.
+        Initialize the Status object with the base URL, API key, and transport.
 
         Args:
             base_url (str): The base URL for the user API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session.
+            transport (Transport): HTTP transport.
             raw_response (bool): Return json if True.
 
         Returns:
@@ -52,7 +51,7 @@ class Status:
 
         self.base_url = base_url.joinpath("status")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
         self.raw_response = raw_response
 
     async def async_get_status(
@@ -72,8 +71,8 @@ class Status:
         if raw_response is None:
             raw_response = self.raw_response
 
-        response = await request(self.session, self.base_url)
-        return response if raw_response else StatusModel(**response)
+        response = await self.transport.request(self.base_url)
+        return response if raw_response else self.transport.parse(StatusModel, response)
 
     async def async_get_appdata(self, raw_response: bool = None) -> dict | StatusAppDataModel:
         """Retrieves the appdata from the server
@@ -88,5 +87,5 @@ class Status:
             raw_response = self.raw_response
 
         url = self.base_url.joinpath("appdata")
-        response = await request(self.session, url)
-        return response if raw_response else StatusAppDataModel(**response)
+        response = await self.transport.request(url)
+        return response if raw_response else self.transport.parse(StatusAppDataModel, response)
@@ -20,11 +20,14 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 
-from aiohttp import ClientSession
+from functools import partial
+from typing import Iterable, cast
+
 from yarl import URL
 
-from asyncpow.models.tv import TvDetailsModel
-from asyncpow.utils.http import request
+from asyncpow.models.tv import TvDetailsModel, TvSeasonSummaryModel
+from asyncpow.utils.concurrency import gather_bounded
+from asyncpow.utils.transport import Transport
 
 
 class Tv:
@@ -33,7 +36,7 @@ class Tv:
     """
 
     def __init__(
-        self, base_url: URL, api_key: str, session: ClientSession, raw_response: bool
+        self, base_url: URL, api_key: str, transport: Transport, raw_response: bool
     ) -> None:
         """
         Initialize the MovieAPI object with the base URL and API key.
@@ -41,7 +44,7 @@ class Tv:
         Args:
             base_url (str): The base URL for the media API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session.
+            transport (Transport): HTTP transport.
             raw_response (bool): Return json if True.
 
         Returns:
@@ -49,7 +52,7 @@ class Tv:
         """
         self.media_url = base_url.joinpath("tv")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
         self.raw_response = raw_response
 
     async def async_get_tv(
@@ -78,5 +81,61 @@ class Tv:
         url = self.media_url.joinpath(str(id))
 
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, url, params=params, headers=headers)
-        return response if raw_response else TvDetailsModel(**response)
+        response = await self.transport.request(url, params=params, headers=headers)
+        return response if raw_response else self.transport.parse(TvDetailsModel, response)
+
+    async def async_get_tvs(
+        self,
+        ids: Iterable[int],
+        lang: str = "en",
+        concurrency: int = 8,
+        raw_response: bool | None = None,
+    ) -> dict[int, dict | TvDetailsModel | BaseException]:
+        """
+        Retrieves the details of many TV shows by ID asynchronously.
+
+        Duplicate IDs are fetched once and at most concurrency requests are in flight,
+        responses are served from the cache when one is configured.
+
+        Args:
+            ids (Iterable[int]): The IDs of the TV shows.
+            lang (str): The language for the response (default is "en").
+            concurrency (int): The maximum number of requests in flight (default is 8).
+            raw_response (bool, optional): return raw json. Defaults to None.
+
+        Returns:
+            dict[int, dict | TvDetailsModel | BaseException]: The details keyed on ID, or the
+            exception raised for that ID.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        results = await gather_bounded(
+            (
+                partial(self.async_get_tv, id, lang=lang, raw_response=raw_response)
+                for id in unique_ids
+            ),
+            concurrency,
+            return_exceptions=True,
+        )
+        return dict(zip(unique_ids, results))
+
+    async def async_get_tv_seasons(self, id: int, lang: str = "en") -> TvSeasonSummaryModel:
+        """
+        Retrieves the TVDB ID and season numbers of a TV show asynchronously.
+
+        Only these fields are read from the TV details, so requesting a show does not
+        validate its full details. The details go through the response cache of the client,
+        if it has one, under its "tv" policy.
+
+        Args:
+            id (int): The ID of the TV show.
+            lang (str): The language for the response. Default to "en".
+
+        Returns:
+            TvSeasonSummaryModel: The TVDB ID and season numbers.
+        """
+        response = cast(dict, await self.async_get_tv(id, lang, raw_response=True))
+        return TvSeasonSummaryModel(
+            id=response["id"],
+            tvdbId=(response.get("externalIds") or {}).get("tvdbId"),
+            seasonNumbers=[season["seasonNumber"] for season in response.get("seasons", [])],
+        )
@@ -20,12 +20,19 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 
-from aiohttp import ClientSession, hdrs
+from functools import partial
+from typing import AsyncGenerator, Iterable, cast
+
+from aiohttp import hdrs
+from pydantic import BaseModel
 from yarl import URL
 
-from asyncpow.models.common import UserSortOptions
+from asyncpow.models.common import PaginatedResponseModel, UserSortOptions
+from asyncpow.models.lazy import LazyPageModel
+from asyncpow.models.projection import projection, projection_page
 from asyncpow.models.user import UserModel, UserResultsResponseModel
-from asyncpow.utils.http import request
+from asyncpow.utils.pagination import fetch_all_pages, page_info_pages, paginate
+from asyncpow.utils.transport import Transport
 
 
 class User:
@@ -34,7 +41,7 @@ class User:
     """
 
     def __init__(
-        self, base_url: URL, api_key: str, session: ClientSession, raw_response: bool
+        self, base_url: URL, api_key: str, transport: Transport, raw_response: bool
     ) -> None:
         """
         Initialize the UserAPI object with the base URL and API key.
@@ -42,7 +49,7 @@ class User:
         Args:
             base_url (str): The base URL for the user API.
             api_key (str): The API key for authentication.
-            session (ClientSession): HTTP Session.
+            transport (Transport): HTTP transport.
             raw_response (bool): Return json if True.
 
         Returns:
@@ -50,7 +57,7 @@ class User:
         """
         self.user_url = base_url.joinpath("user")
         self.api_key = api_key
-        self.session = session
+        self.transport = transport
         self.raw_response = raw_response
 
     async def async_get_user(
@@ -60,7 +67,9 @@ class User:
         sort: UserSortOptions = "created",
         id: int = None,
         raw_response: bool | None = None,
-    ) -> dict | UserModel | list[UserModel]:
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> dict | UserModel | UserResultsResponseModel | PaginatedResponseModel | BaseModel:
         """Get a user record, or all user records
 
         Args:
@@ -69,9 +78,15 @@ class User:
             sort (_type_): sort records
             id (int, optional): User ID if it is known. Defaults to None.
             raw_response (bool, optional): return raw json. Defaults to None.
+            lazy (bool): validate each user of a list into a UserModel on first access.
+                Defaults to False.
+            fields (Iterable[str], optional): only keep these UserModel fields, see
+                asyncpow.models.projection. Defaults to None.
 
         Returns:
-            dict | UserModel: Returns json dictionary or UserModel
+            dict | UserModel | UserResultsResponseModel | PaginatedResponseModel | BaseModel:
+            Returns json dictionary, UserModel or a page of users. A LazyPageModel if lazy,
+            and projections of the user or the page if fields are given
         """
         if raw_response is None:
             raw_response = self.raw_response
@@ -80,11 +95,83 @@ class User:
         params = {"take": take, "skip": skip, "sort": sort}
 
         headers = {"X-Api-Key": self.api_key}
-        response = await request(self.session, url, params=params, headers=headers)
+        response = await self.transport.request(url, params=params, headers=headers)
         if raw_response:
             return response
-        else:
-            return UserModel(**response) if id else UserResultsResponseModel(**response)
+        model = projection(UserModel, fields) if fields else UserModel
+        if id:
+            return self.transport.parse(model, response)
+        if lazy:
+            return LazyPageModel.from_response(model, response)
+        if fields:
+            return self.transport.parse(projection_page(UserModel, fields), response)
+        return self.transport.parse(UserResultsResponseModel, response)
+
+    async def async_iter_users(
+        self,
+        take: int = 100,
+        sort: UserSortOptions = "created",
+        raw_response: bool | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[dict | UserModel, None]:
+        """Iterate over all user records, page by page
+
+        The next page is requested while the current one is consumed.
+
+        Args:
+            take (int): number of records per page. Defaults to 100.
+            sort (UserSortOptions): sort records. Defaults to "created".
+            raw_response (bool, optional): yield raw json. Defaults to None.
+            fields (Iterable[str], optional): only keep these UserModel fields, see
+                asyncpow.models.projection. Defaults to None.
+
+        Yields:
+            dict | UserModel: The user records
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+        model = projection(UserModel, fields) if fields else UserModel
+
+        async def fetch_page(skip: int) -> dict:
+            """Fetch the raw page starting at skip."""
+            page = await self.async_get_user(take, skip, sort, raw_response=True)
+            return cast(dict, page)
+
+        async for page in paginate(fetch_page, take):
+            for item in page["results"]:
+                yield item if raw_response else self.transport.parse(model, item)
+
+    async def async_get_all_users(
+        self,
+        take: int = 100,
+        sort: UserSortOptions = "created",
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+        raw_response: bool | None = None,
+    ) -> list[dict | UserResultsResponseModel | BaseException]:
+        """Get every page of user records, fetching the pages after the first concurrently
+
+        Args:
+            take (int): number of records per page. Defaults to 100.
+            sort (UserSortOptions): sort records. Defaults to "created".
+            concurrency (int): maximum number of pages fetched at once. Defaults to 4.
+            return_exceptions (bool): return the exception of a failed page in its place
+                instead of raising it. Defaults to False.
+            raw_response (bool, optional): return raw json. Defaults to None.
+
+        Returns:
+            list[dict | UserResultsResponseModel | BaseException]: The pages, in order
+        """
+        if raw_response is None:
+            raw_response = self.raw_response
+
+        return await fetch_all_pages(
+            lambda index: self.async_get_user(take, index * take, sort, raw_response=True),
+            page_info_pages,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+            parse=None if raw_response else partial(self.transport.parse, UserResultsResponseModel),
+        )
 
     async def async_create_user(
         self, email: str, username: str, permissions: int, raw_response: bool | None = None
@@ -106,14 +193,14 @@ class User:
         req_data = {"email": email, "username": username, "permissions": permissions}
 
         headers = {"X-Api-Key": self.api_key, "Content-Type": "application/json"}
-        response = await request(
-            self.session,
+        response = await self.transport.request(
             self.user_url,
             method=hdrs.METH_POST,
             json_data=req_data,
             headers=headers,
         )
-        return response if raw_response else UserModel(**response)
+        self._invalidate()
+        return response if raw_response else self.transport.parse(UserModel, response)
 
     async def async_bulk_update_user(
         self, ids: list[int], permissions: int, raw_response: bool | None = None
@@ -134,11 +221,19 @@ class User:
         req_data = {"ids": ids, "permissions": permissions}
 
         headers = {"X-Api-Key": self.api_key, "Content-Type": "application/json"}
-        response = await request(
-            self.session,
+        response = await self.transport.request(
             self.user_url,
             method=hdrs.METH_POST,
             json_data=req_data,
             headers=headers,
         )
+        self._invalidate()
         return response if raw_response else list[UserModel(**response)]
+
+    def _invalidate(self) -> None:
+        """Remove the cached user lists and details made stale by a change to the users.
+
+        Returns:
+            None
+        """
+        self.transport.invalidate(endpoints=("user",))
@@ -46,3 +46,27 @@ class POWMediaTypeException(POWException):
     """
     Exception raised when media type fails in a AsyncPOW operation.
     """
+
+
+class POWCircuitOpenException(POWException):
+    """
+    Exception raised when a AsyncPOW operation is rejected because the circuit is open.
+    """
+
+
+class POWRateLimitException(POWException):
+    """
+    Exception raised when Overseerr throttles a AsyncPOW operation (HTTP 429 or 503).
+    """
+
+    def __init__(self, status: int, body: dict, retry_after: float | None = None) -> None:
+        """
+        Initialize the exception with the response status, body and Retry-After delay.
+
+        Args:
+            status (int): The HTTP status of the response.
+            body (dict): The decoded response body.
+            retry_after (float, optional): Seconds the server asked to wait before retrying.
+        """
+        super().__init__(status, body)
+        self.retry_after = retry_after
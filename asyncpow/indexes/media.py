@@ -0,0 +1,467 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from array import array
+import asyncio
+from contextlib import aclosing
+from typing import Any, Literal, NamedTuple, cast
+
+from asyncpow.apis.media import Media
+from asyncpow.models.common import MediaType
+from asyncpow.utils.bitset import Bitset
+
+# Media status values, 5 = AVAILABLE
+MEDIA_STATUSES = (1, 2, 3, 4, 5)
+AVAILABLE = 5
+# Stored in the integer columns for a missing ID
+MISSING = -1
+# Stored in an ID column for an ID that is not its prefix and digits
+OTHER = -2
+MEDIA_TYPES: tuple[MediaType, ...] = ("movie", "tv")
+# Timestamp each incremental sort is ordered by, newest first
+SYNC_FIELDS = {"modified": "updatedAt", "mediaAdded": "mediaAddedAt"}
+
+
+class MediaEntry(NamedTuple):
+    """The indexed columns of a media item."""
+
+    id: int
+    mediaType: MediaType
+    tmdbId: int
+    tvdbId: int | None
+    imdbId: str | None
+    ratingKey: str | None
+    status: int
+    status4k: int
+
+
+class _IdColumn:
+    """
+    Column of optional string IDs, such as IMDb IDs, stored as integers.
+
+    An ID that is the prefix of the column followed by its digits, zero padded to width,
+    is stored as the number. Any other ID is kept as a string, keyed on its row.
+    """
+
+    __slots__ = ("prefix", "width", "codes", "others")
+
+    def __init__(self, prefix: str = "", width: int = 0) -> None:
+        """
+        Initialize an empty _IdColumn.
+
+        Args:
+            prefix (str): The prefix of the IDs, such as "tt" (default is "").
+            width (int): The zero padded width of the digits (default is 0).
+
+        Returns:
+            None
+        """
+        self.prefix = prefix
+        self.width = width
+        self.codes = array("q")
+        self.others: dict[int, str] = {}
+
+    def key(self, value: str) -> int | str:
+        """Get the number an ID is stored as, or the ID itself if it has no number.
+
+        Args:
+            value (str): The ID.
+
+        Returns:
+            int | str: The number, or the ID.
+        """
+        digits = value[len(self.prefix) :] if value.startswith(self.prefix) else ""
+        if (
+            0 < len(digits) < 19
+            and digits.isascii()
+            and digits.isdigit()
+            and f"{self.prefix}{int(digits):0{self.width}d}" == value
+        ):
+            return int(digits)
+        return value
+
+    def append(self) -> None:
+        """Add a row without an ID.
+
+        Returns:
+            None
+        """
+        self.codes.append(MISSING)
+
+    def __getitem__(self, row: int) -> str | None:
+        """Get the ID of a row.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            str | None: The ID, None if the row has none.
+        """
+        code = self.codes[row]
+        if code == MISSING:
+            return None
+        if code == OTHER:
+            return self.others[row]
+        return f"{self.prefix}{code:0{self.width}d}"
+
+    def __setitem__(self, row: int, value: str | None) -> None:
+        """Set the ID of a row.
+
+        Args:
+            row (int): The row.
+            value (str | None): The ID, None for none.
+
+        Returns:
+            None
+        """
+        self.others.pop(row, None)
+        key = None if value is None else self.key(value)
+        if key is None:
+            self.codes[row] = MISSING
+        elif isinstance(key, int):
+            self.codes[row] = key
+        else:
+            self.codes[row] = OTHER
+            self.others[row] = key
+
+
+class MediaIndex:
+    """
+    In memory index of the media library of an Overseerr instance.
+
+    Each media item is a row of typed arrays, which keeps millions of rows within a few
+    hundred megabytes. IMDb IDs and rating keys are stored as numbers when they are
+    digits after their prefix, as they are in practice. Rows are found by Overseerr ID,
+    tmdbId, tvdbId, imdbId or ratingKey through dictionaries, which hold the numbers and
+    not the strings, and selected by status or status4k through one bitset per status.
+
+    sync pages through /media newest first, ordered by modification or by the date the
+    media was added, and stops at the first item older than the previous sync with the
+    same order. Deleted media is only dropped by rebuild.
+
+    Examples:
+        index = MediaIndex(api.media)
+        await index.sync()
+        index.is_available(27205, "movie", is4k=True)
+    """
+
+    def __init__(self, api: Media, take: int = 100) -> None:
+        """
+        Initialize an empty MediaIndex.
+
+        Args:
+            api (Media): The media API used to sync, such as Overseerr.media.
+            take (int): Number of media items per page when syncing (default is 100).
+
+        Returns:
+            None
+        """
+        self.api = api
+        self.take = take
+        self._lock = asyncio.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every media item and forget the previous syncs.
+
+        Returns:
+            None
+        """
+        # Newest timestamp seen by each sort, see SYNC_FIELDS
+        self.cursors: dict[str, str | None] = {sort: None for sort in SYNC_FIELDS}
+        self._ids = array("q")
+        self._media_types = array("b")
+        self._tmdb_ids = array("q")
+        self._tvdb_ids = array("q")
+        self._statuses = array("b")
+        self._statuses4k = array("b")
+        self._imdb_ids = _IdColumn("tt", 7)
+        self._rating_keys = _IdColumn()
+        self._rows: dict[int, int] = {}
+        self._by_tmdb_id: tuple[dict[int, int], ...] = tuple({} for _ in MEDIA_TYPES)
+        self._by_tvdb_id: dict[int, int] = {}
+        self._by_imdb_id: dict[int | str, int] = {}
+        self._by_rating_key: dict[int | str, int] = {}
+        self._status: dict[int, Bitset] = {status: Bitset() for status in MEDIA_STATUSES}
+        self._status4k: dict[int, Bitset] = {status: Bitset() for status in MEDIA_STATUSES}
+
+    def __len__(self) -> int:
+        """Number of media items in the index.
+
+        Returns:
+            int: The number of media items.
+        """
+        return len(self._rows)
+
+    def add(self, media: dict[str, Any]) -> None:
+        """Add or update a media item.
+
+        Args:
+            media (dict[str, Any]): The raw media item, as returned by /media.
+
+        Returns:
+            None
+        """
+        row = self._rows.get(media["id"])
+        if row is None:
+            row = self._rows[media["id"]] = len(self._ids)
+            for column in (
+                self._ids,
+                self._media_types,
+                self._tmdb_ids,
+                self._tvdb_ids,
+                self._statuses,
+                self._statuses4k,
+            ):
+                column.append(0)
+            self._imdb_ids.append()
+            self._rating_keys.append()
+        else:
+            self._unlink(row)
+
+        media_type = MEDIA_TYPES.index(media["mediaType"])
+        tvdb_id, imdb_id, rating_key = (
+            media.get("tvdbId"),
+            media.get("imdbId"),
+            media.get("ratingKey"),
+        )
+        self._ids[row] = media["id"]
+        self._media_types[row] = media_type
+        self._tmdb_ids[row] = media["tmdbId"]
+        self._tvdb_ids[row] = MISSING if tvdb_id is None else tvdb_id
+        self._statuses[row] = media["status"]
+        self._statuses4k[row] = media["status4k"]
+        self._imdb_ids[row] = imdb_id
+        self._rating_keys[row] = rating_key
+
+        self._by_tmdb_id[media_type][media["tmdbId"]] = row
+        if tvdb_id is not None:
+            self._by_tvdb_id[tvdb_id] = row
+        if imdb_id is not None:
+            self._by_imdb_id[self._imdb_ids.key(imdb_id)] = row
+        if rating_key is not None:
+            self._by_rating_key[self._rating_keys.key(rating_key)] = row
+        self._status.setdefault(media["status"], Bitset()).add(row)
+        self._status4k.setdefault(media["status4k"], Bitset()).add(row)
+
+    def _unlink(self, row: int) -> None:
+        """Remove a row from the lookups and bitsets before it is overwritten.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            None
+        """
+        imdb_id, rating_key = self._imdb_ids[row], self._rating_keys[row]
+        lookups: list[tuple[dict[Any, int], Any]] = [
+            (self._by_tmdb_id[self._media_types[row]], self._tmdb_ids[row]),
+            (self._by_tvdb_id, self._tvdb_ids[row]),
+            (self._by_imdb_id, None if imdb_id is None else self._imdb_ids.key(imdb_id)),
+            (
+                self._by_rating_key,
+                None if rating_key is None else self._rating_keys.key(rating_key),
+            ),
+        ]
+        for lookup, key in lookups:
+            if lookup.get(key) == row:
+                del lookup[key]
+        self._status[self._statuses[row]].discard(row)
+        self._status4k[self._statuses4k[row]].discard(row)
+
+    def _entry(self, row: int) -> MediaEntry:
+        """Build the entry of a row.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            MediaEntry: The entry.
+        """
+        tvdb_id = self._tvdb_ids[row]
+        return MediaEntry(
+            id=self._ids[row],
+            mediaType=MEDIA_TYPES[self._media_types[row]],
+            tmdbId=self._tmdb_ids[row],
+            tvdbId=None if tvdb_id == MISSING else tvdb_id,
+            imdbId=self._imdb_ids[row],
+            ratingKey=self._rating_keys[row],
+            status=self._statuses[row],
+            status4k=self._statuses4k[row],
+        )
+
+    def get(self, id: int) -> MediaEntry | None:
+        """Get a media item by its Overseerr ID.
+
+        Args:
+            id (int): The media ID.
+
+        Returns:
+            MediaEntry | None: The media item, None if it is not indexed.
+        """
+        return self._find(self._rows, id)
+
+    def by_tmdb_id(self, tmdb_id: int, media_type: MediaType = "movie") -> MediaEntry | None:
+        """Get a media item by TMDB ID.
+
+        Args:
+            tmdb_id (int): The TMDB ID.
+            media_type (MediaType): "movie" or "tv", TMDB IDs are per type
+                (default is "movie").
+
+        Returns:
+            MediaEntry | None: The media item, None if it is not indexed.
+        """
+        return self._find(self._by_tmdb_id[MEDIA_TYPES.index(media_type)], tmdb_id)
+
+    def by_tvdb_id(self, tvdb_id: int) -> MediaEntry | None:
+        """Get a media item by TVDB ID.
+
+        Args:
+            tvdb_id (int): The TVDB ID.
+
+        Returns:
+            MediaEntry | None: The media item, None if it is not indexed.
+        """
+        return self._find(self._by_tvdb_id, tvdb_id)
+
+    def by_imdb_id(self, imdb_id: str) -> MediaEntry | None:
+        """Get a media item by IMDb ID.
+
+        Args:
+            imdb_id (str): The IMDb ID, such as "tt1375666".
+
+        Returns:
+            MediaEntry | None: The media item, None if it is not indexed.
+        """
+        return self._find(self._by_imdb_id, self._imdb_ids.key(imdb_id))
+
+    def by_rating_key(self, rating_key: str) -> MediaEntry | None:
+        """Get a media item by Plex rating key.
+
+        Args:
+            rating_key (str): The rating key.
+
+        Returns:
+            MediaEntry | None: The media item, None if it is not indexed.
+        """
+        return self._find(self._by_rating_key, self._rating_keys.key(rating_key))
+
+    def is_available(
+        self, tmdb_id: int, media_type: MediaType = "movie", is4k: bool = False
+    ) -> bool:
+        """Check if a media item is available.
+
+        Args:
+            tmdb_id (int): The TMDB ID.
+            media_type (MediaType): "movie" or "tv" (default is "movie").
+            is4k (bool): Check the 4K status (default is False).
+
+        Returns:
+            bool: True if the media item is indexed and available.
+        """
+        row = self._by_tmdb_id[MEDIA_TYPES.index(media_type)].get(tmdb_id)
+        if row is None:
+            return False
+        return (self._statuses4k if is4k else self._statuses)[row] == AVAILABLE
+
+    def with_status(self, status: int, is4k: bool = False) -> Bitset:
+        """Get the rows with a status, combine them with & and | before reading them.
+
+        Args:
+            status (int): The status, 1 = UNKNOWN, 2 = PENDING, 3 = PROCESSING,
+                4 = PARTIALLY_AVAILABLE, 5 = AVAILABLE.
+            is4k (bool): Select on the 4K status (default is False).
+
+        Returns:
+            Bitset: The rows, see entries.
+        """
+        return (self._status4k if is4k else self._status).get(status, Bitset())
+
+    def entries(self, rows: Bitset) -> list[MediaEntry]:
+        """Get the media items of rows.
+
+        Args:
+            rows (Bitset): The rows, such as a result of with_status.
+
+        Returns:
+            list[MediaEntry]: The media items, in row order.
+        """
+        return [self._entry(row) for row in rows]
+
+    def _find(self, lookup: dict[Any, int], key: Any) -> MediaEntry | None:
+        """Get the entry a lookup points to.
+
+        Args:
+            lookup (dict[Any, int]): Rows keyed on an ID.
+            key (Any): The ID.
+
+        Returns:
+            MediaEntry | None: The entry, None if the ID is not indexed.
+        """
+        row = lookup.get(key)
+        return None if row is None else self._entry(row)
+
+    async def sync(self, sort: Literal["modified", "mediaAdded"] = "modified") -> int:
+        """Fetch the media modified, or added, since the last sync in that order.
+
+        The first sync fetches the whole library and sets the starting point of both
+        orders.
+
+        Args:
+            sort (Literal["modified", "mediaAdded"]): Order to page through
+                (default is "modified").
+
+        Returns:
+            int: The number of media items added or updated.
+        """
+        field = SYNC_FIELDS[sort]
+        async with self._lock:
+            since = self.cursors[sort]
+            newest = dict(self.cursors)
+            count = 0
+            items = self.api.async_iter_media(take=self.take, sort=sort, raw_response=True)
+            async with aclosing(items):
+                async for item in items:
+                    media = cast(dict, item)
+                    # ISO 8601 timestamps in UTC, ordered as strings
+                    if since is not None and (media.get(field) or "") < since:
+                        break
+                    for order, name in SYNC_FIELDS.items():
+                        stamp = media.get(name)
+                        if stamp is not None and (newest[order] or "") < stamp:
+                            newest[order] = stamp
+                    self.add(media)
+                    count += 1
+            # Only a pass over the whole library moves the starting point of the other order
+            self.cursors = newest if since is None else {**self.cursors, sort: newest[sort]}
+            return count
+
+    async def rebuild(self) -> int:
+        """Drop the index and fetch the whole library again, removing deleted media.
+
+        Returns:
+            int: The number of media items indexed.
+        """
+        async with self._lock:
+            self.clear()
+        return await self.sync()
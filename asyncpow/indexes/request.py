@@ -0,0 +1,259 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import asyncio
+from contextlib import aclosing
+import os
+from typing import Any, Iterable, cast
+
+from asyncpow.apis.request import Request
+from asyncpow.models.media import MediaRequestModel
+from asyncpow.utils.codec import DEFAULT_CODEC, JsonCodec
+
+
+class RequestIndex:
+    """
+    In memory mirror of the requests of an Overseerr instance, indexed for lookups.
+
+    Requests are indexed by id, status, media tmdbId and requesting user, so queries such
+    as the pending requests of a user are answered locally. sync pages through the
+    requests most recently modified first and stops at the first one not modified since
+    the previous sync, so only the changes are downloaded. Deleted requests are only
+    dropped by rebuild.
+
+    Examples:
+        index = RequestIndex(api.request)
+        await index.sync()
+        pending = index.query(status=1, user_id=4)
+    """
+
+    def __init__(self, api: Request, take: int = 100, codec: JsonCodec = DEFAULT_CODEC) -> None:
+        """
+        Initialize an empty RequestIndex.
+
+        Args:
+            api (Request): The request API used to sync, such as Overseerr.request.
+            take (int): Number of requests per page when syncing (default is 100).
+            codec (JsonCodec): Codec used by save and load, defaults to the fastest installed.
+
+        Returns:
+            None
+        """
+        self.api = api
+        self.take = take
+        self.codec = codec
+        self.synced_at: str | None = None  # updatedAt of the most recently modified request
+        self._requests: dict[int, MediaRequestModel] = {}
+        self._by_status: dict[int, set[int]] = {}
+        self._by_tmdb_id: dict[int, set[int]] = {}
+        self._by_user: dict[int, set[int]] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        """Number of requests in the index.
+
+        Returns:
+            int: The number of requests.
+        """
+        return len(self._requests)
+
+    def __contains__(self, id: object) -> bool:
+        """Check if a request is in the index.
+
+        Args:
+            id (object): The request ID.
+
+        Returns:
+            bool: True if the request is indexed.
+        """
+        return id in self._requests
+
+    def _keys(self, request: MediaRequestModel) -> Iterable[tuple[dict[int, set[int]], int]]:
+        """Secondary index entries of a request.
+
+        Args:
+            request (MediaRequestModel): The request.
+
+        Yields:
+            tuple[dict[int, set[int]], int]: Pairs of index and key.
+        """
+        yield self._by_status, request.status
+        yield self._by_tmdb_id, request.media.tmdbId
+        user_id = request.requestedBy.get("id")
+        if user_id is not None:
+            yield self._by_user, user_id
+
+    def _remove(self, id: int) -> None:
+        """Remove a request from all indexes.
+
+        Args:
+            id (int): The request ID.
+
+        Returns:
+            None
+        """
+        request = self._requests.pop(id, None)
+        if request is None:
+            return
+        for index, key in self._keys(request):
+            ids = index[key]
+            ids.discard(id)
+            if not ids:
+                del index[key]
+
+    def add(self, request: MediaRequestModel) -> None:
+        """Add or replace a request.
+
+        Args:
+            request (MediaRequestModel): The request.
+
+        Returns:
+            None
+        """
+        self._remove(request.id)
+        self._requests[request.id] = request
+        for index, key in self._keys(request):
+            index.setdefault(key, set()).add(request.id)
+
+    def get(self, id: int) -> MediaRequestModel | None:
+        """Get a request by ID.
+
+        Args:
+            id (int): The request ID.
+
+        Returns:
+            MediaRequestModel | None: The request, None if it is not indexed.
+        """
+        return self._requests.get(id)
+
+    def query(
+        self,
+        status: int | None = None,
+        tmdb_id: int | None = None,
+        user_id: int | None = None,
+    ) -> list[MediaRequestModel]:
+        """Get the requests matching every given criterion, ordered by ID.
+
+        Args:
+            status (int, optional): Request status, 1 = PENDING APPROVAL, 2 = APPROVED,
+                3 = DECLINED. Defaults to None.
+            tmdb_id (int, optional): TMDB ID of the requested media. Defaults to None.
+            user_id (int, optional): ID of the requesting user. Defaults to None.
+
+        Returns:
+            list[MediaRequestModel]: The matching requests, every request if no criterion
+            is given.
+        """
+        criteria = [
+            index.get(key, set())
+            for index, key in (
+                (self._by_status, status),
+                (self._by_tmdb_id, tmdb_id),
+                (self._by_user, user_id),
+            )
+            if key is not None
+        ]
+        if not criteria:
+            return [self._requests[id] for id in sorted(self._requests)]
+        ids = set.intersection(*sorted(criteria, key=len))
+        return [self._requests[id] for id in sorted(ids)]
+
+    async def sync(self) -> int:
+        """Fetch the requests modified since the last sync, all of them the first time.
+
+        Returns:
+            int: The number of requests added or updated.
+        """
+        async with self._lock:
+            since = self.synced_at
+            count = 0
+            requests = self.api.async_iter_requests(
+                raw_response=False, take=self.take, sort="modified", requested_by=None
+            )
+            async with aclosing(requests):
+                async for item in requests:
+                    request = cast(MediaRequestModel, item)
+                    # ISO 8601 timestamps in UTC, ordered as strings
+                    if since is not None and request.updatedAt < since:
+                        break
+                    if self.synced_at is None or request.updatedAt > self.synced_at:
+                        self.synced_at = request.updatedAt
+                    self.add(request)
+                    count += 1
+            return count
+
+    async def rebuild(self) -> int:
+        """Drop the index and fetch every request again, removing deleted requests.
+
+        Returns:
+            int: The number of requests indexed.
+        """
+        async with self._lock:
+            self.clear()
+        return await self.sync()
+
+    def clear(self) -> None:
+        """Remove every request and forget the last sync.
+
+        Returns:
+            None
+        """
+        self._requests.clear()
+        self._by_status.clear()
+        self._by_tmdb_id.clear()
+        self._by_user.clear()
+        self.synced_at = None
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the index to a JSON file, replacing it atomically.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the file.
+
+        Returns:
+            None
+        """
+        snapshot: dict[str, Any] = {
+            "synced_at": self.synced_at,
+            "requests": [request.model_dump() for request in self._requests.values()],
+        }
+        partial = f"{os.fspath(path)}.tmp"
+        with open(partial, "wb") as file:
+            file.write(self.codec.dumps(snapshot))
+        os.replace(partial, path)
+
+    def load(self, path: str | os.PathLike[str]) -> int:
+        """Replace the index with a file written by save, the next sync continues from it.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the file.
+
+        Returns:
+            int: The number of requests loaded.
+        """
+        with open(path, "rb") as file:
+            snapshot = self.codec.loads(file.read())
+        self.clear()
+        for request in snapshot["requests"]:
+            self.add(MediaRequestModel.model_validate(request))
+        self.synced_at = snapshot["synced_at"]
+        return len(self._requests)
@@ -0,0 +1,457 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import argparse
+import asyncio
+import base64
+from collections import Counter
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+import uuid
+
+from pydantic import BaseModel
+
+from asyncpow.overseerr import Overseerr
+from asyncpow.testing.mock_server import FaultConfig, MockOverseerr, fault_arguments, fault_config
+from asyncpow.utils.metrics import Metrics
+from asyncpow.utils.transport import TransportConfig
+
+Operation = Callable[[Overseerr, int, int], Awaitable[Any]]
+
+# Read only calls, safe to run against a production instance. Each is given a call number,
+# used to vary the parameters so identical requests are not coalesced, and the page size.
+OPERATIONS: dict[str, Operation] = {
+    "status": lambda client, n, take: client.status.async_get_status(),
+    "search": lambda client, n, take: client.search.async_get_search(f"query {n % 1000}"),
+    "discover": lambda client, n, take: client.discover.async_get_trending(page=1 + n % 5),
+    "media": lambda client, n, take: client.media.async_get_media(take=take, skip=n % 10 * take),
+    "request": lambda client, n, take: client.request.async_get_requests(
+        take=take, skip=n % 10 * take, requested_by=None
+    ),
+    "user": lambda client, n, take: client.user.async_get_user(take=take, skip=n % 10 * take),
+}
+DEFAULT_MIX = "status=1,search=2,discover=1,media=3,request=2,user=1"
+
+
+class LatencyReport(BaseModel):
+    """
+    Data class representing the outcome and latency percentiles of a set of calls.
+
+    Latencies are in milliseconds. When driven at a target rate, they are measured from
+    the time each call was scheduled, so a client falling behind shows in the latency.
+    """
+
+    calls: int
+    errors: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_latencies(cls, latencies: list[float], errors: int) -> "LatencyReport":
+        """Summarise the latencies of a set of calls.
+
+        Args:
+            latencies (list[float]): Latency of every call, in seconds.
+            errors (int): Number of failed calls.
+
+        Returns:
+            LatencyReport: The summary.
+        """
+        if len(latencies) < 2:
+            quantiles = latencies * 99 or [0.0] * 99
+        else:
+            quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        return cls(
+            calls=len(latencies),
+            errors=errors,
+            p50=round(quantiles[49] * 1000, 3),
+            p90=round(quantiles[89] * 1000, 3),
+            p99=round(quantiles[98] * 1000, 3),
+            max=round(max(latencies, default=0.0) * 1000, 3),
+        )
+
+
+class LoadReport(BaseModel):
+    """
+    Data class representing the result of a load test.
+    """
+
+    duration: float  # Wall clock seconds from the first call to the last response
+    completed: int
+    throughput: float  # Completed calls per second
+    target_rate: float | None
+    concurrency: int | None
+    dropped: int  # Calls not started because max_in_flight calls were outstanding
+    retries: int
+    cpu_seconds: float  # Client process CPU time, user and system
+    cpu_per_call_ms: float
+    cpu_utilisation: float  # CPU seconds per wall clock second
+    latency: LatencyReport
+    operations: dict[str, LatencyReport]
+    errors: dict[str, int]
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """Parse an operation mix such as "search=2,media=1".
+
+    Args:
+        text (str): Comma separated operation names, each with an optional weight.
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is negative.
+
+    Returns:
+        dict[str, float]: Weight by operation.
+    """
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}, expected one of {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+        if mix[name] < 0:
+            raise ValueError(f"Negative weight for {name!r}")
+    return mix
+
+
+def error_name(exception: BaseException) -> str:
+    """Name an error for the breakdown, with the HTTP status when there is one.
+
+    Args:
+        exception (BaseException): The error.
+
+    Returns:
+        str: The name, e.g. "POWRateLimitException 429".
+    """
+    name = type(exception).__name__
+    if exception.args and isinstance(exception.args[0], int):
+        return f"{name} {exception.args[0]}"
+    return name
+
+
+async def run_load(
+    client: Overseerr,
+    mix: dict[str, float],
+    duration: float,
+    rate: float | None = None,
+    concurrency: int | None = None,
+    take: int = 20,
+    max_in_flight: int = 1000,
+    seed: int | None = None,
+    metrics: Metrics | None = None,
+) -> LoadReport:
+    """Drive a mix of calls at a target rate or with a fixed number of workers.
+
+    Args:
+        client (Overseerr): The client.
+        mix (dict[str, float]): Weight by operation name, see OPERATIONS.
+        duration (float): Seconds to start calls for.
+        rate (float, optional): Calls started per second, regardless of how long they
+            take. Exclusive with concurrency.
+        concurrency (int, optional): Number of workers, each starting a call as soon as
+            its previous call completes. Defaults to 10 when rate is not given.
+        take (int): Page size of the list calls (default is 20).
+        max_in_flight (int): Outstanding calls at a target rate above which new calls are
+            dropped instead of started (default is 1000).
+        seed (int, optional): Seed of the operation draws.
+        metrics (Metrics, optional): The metrics of the client, to count retries.
+
+    Raises:
+        ValueError: If both rate and concurrency are given.
+
+    Returns:
+        LoadReport: The result.
+    """
+    if rate is not None and concurrency is not None:
+        raise ValueError("Give either a rate or a concurrency, not both")
+    if rate is None and concurrency is None:
+        concurrency = 10
+
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies: dict[str, list[float]] = {name: [] for name in names}
+    failures: Counter[str] = Counter()
+    errors: Counter[str] = Counter()
+    loop = asyncio.get_running_loop()
+    retries_before = _retries(metrics)
+
+    async def call(name: str, n: int, scheduled: float) -> None:
+        """Make a call and record its outcome.
+
+        Args:
+            name (str): The operation.
+            n (int): The call number.
+            scheduled (float): Loop time the call was due to start.
+
+        Returns:
+            None
+        """
+        try:
+            await OPERATIONS[name](client, n, take)
+        except Exception as exception:
+            failures[name] += 1
+            errors[error_name(exception)] += 1
+        latencies[name].append(loop.time() - scheduled)
+
+    cpu_start = time.process_time()
+    start = loop.time()
+    end = start + duration
+    dropped = 0
+    if rate is not None:
+        in_flight: set[asyncio.Task] = set()
+        n = 0
+        while (scheduled := start + n / rate) < end:
+            if (delay := scheduled - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            name = rng.choices(names, weights)[0]
+            if len(in_flight) >= max_in_flight:
+                dropped += 1
+            else:
+                task = asyncio.create_task(call(name, n, scheduled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            n += 1
+        await asyncio.gather(*in_flight)
+    else:
+        counter = iter(range(sys.maxsize))
+
+        async def worker() -> None:
+            """Make calls until the duration has passed."""
+            while loop.time() < end:
+                await call(rng.choices(names, weights)[0], next(counter), loop.time())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency or 0)))
+    elapsed = loop.time() - start
+    cpu = time.process_time() - cpu_start
+
+    every = [latency for values in latencies.values() for latency in values]
+    completed = len(every)
+    return LoadReport(
+        duration=round(elapsed, 3),
+        completed=completed,
+        throughput=round(completed / elapsed, 1),
+        target_rate=rate,
+        concurrency=concurrency,
+        dropped=dropped,
+        retries=_retries(metrics) - retries_before,
+        cpu_seconds=round(cpu, 3),
+        cpu_per_call_ms=round(cpu / completed * 1000, 3) if completed else 0.0,
+        cpu_utilisation=round(cpu / elapsed, 3),
+        latency=LatencyReport.from_latencies(every, sum(failures.values())),
+        operations={
+            name: LatencyReport.from_latencies(values, failures[name])
+            for name, values in latencies.items()
+        },
+        errors=dict(errors.most_common()),
+    )
+
+
+def _retries(metrics: Metrics | None) -> int:
+    """Count the retries recorded so far.
+
+    Args:
+        metrics (Metrics, optional): The metrics of the client.
+
+    Returns:
+        int: The number of retries, 0 without metrics.
+    """
+    if metrics is None:
+        return 0
+    return sum(endpoint.retries for endpoint in metrics.snapshot().endpoints.values())
+
+
+def format_report(report: LoadReport) -> str:
+    """Render a report as a table.
+
+    Args:
+        report (LoadReport): The report.
+
+    Returns:
+        str: The table.
+    """
+    mode = (
+        f"target {report.target_rate:g}/s"
+        if report.target_rate is not None
+        else f"concurrency {report.concurrency}"
+    )
+    lines = [
+        f"{report.completed} calls in {report.duration:.1f}s ({mode}): "
+        f"{report.throughput:.1f}/s, {report.dropped} dropped, {report.retries} retries",
+        f"client CPU {report.cpu_seconds:.2f}s, {report.cpu_per_call_ms:.3f}ms per call, "
+        f"{report.cpu_utilisation:.0%} of one core",
+        "",
+        f"{'operation':<10} {'calls':>7} {'errors':>7} {'p50':>10} {'p90':>10} {'p99':>10} "
+        f"{'max':>10}",
+    ]
+    rows = [*report.operations.items(), ("all", report.latency)]
+    for name, latency in rows:
+        lines.append(
+            f"{name:<10} {latency.calls:>7} {latency.errors:>7} {latency.p50:>8.1f}ms "
+            f"{latency.p90:>8.1f}ms {latency.p99:>8.1f}ms {latency.max:>8.1f}ms"
+        )
+    if report.errors:
+        lines += ["", "errors:"]
+        lines += [f"  {count:>7} {name}" for name, count in report.errors.items()]
+    return "\n".join(lines)
+
+
+def _serve_mock(queue: Any, faults: FaultConfig, total_results: int, seed: int | None) -> None:
+    """Run a mock server in a child process until it is terminated.
+
+    Args:
+        queue (multiprocessing.Queue): Queue to put the bound port on.
+        faults (FaultConfig): The faults to inject.
+        total_results (int): Number of items behind the paginated endpoints.
+        seed (int, optional): Seed of the latency and fault draws.
+
+    Returns:
+        None
+    """
+
+    async def serve() -> None:
+        """Start the server, report its port and wait."""
+        mock = MockOverseerr(faults, total_results=total_results, seed=seed)
+        await mock.start()
+        queue.put(mock.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+def _mock_key() -> str:
+    """Build an API key in the format Overseerr issues, for the mock server.
+
+    Returns:
+        str: The key.
+    """
+    return base64.b64encode(f"{int(time.time() * 1000)}{uuid.uuid4()}".encode()).decode()
+
+
+async def _main(args: argparse.Namespace, port: int | None) -> LoadReport:
+    """Run the load test described by the command line options.
+
+    Args:
+        args (argparse.Namespace): The options.
+        port (int, optional): The port to connect to.
+
+    Returns:
+        LoadReport: The result.
+    """
+    metrics = Metrics()
+    async with Overseerr(
+        args.host,
+        args.api_key,
+        port=port,
+        tls=args.tls,
+        base_path=args.base_path,
+        transport_config=TransportConfig(limit=args.connections),
+        coalesce_requests=False,
+        metrics=metrics,
+    ) as client:
+        if args.warmup:
+            await run_load(client, parse_mix(args.mix), args.warmup, concurrency=1, take=args.take)
+        return await run_load(
+            client,
+            parse_mix(args.mix),
+            args.duration,
+            rate=args.rate,
+            concurrency=args.concurrency,
+            take=args.take,
+            max_in_flight=args.max_in_flight,
+            seed=args.seed,
+            metrics=metrics,
+        )
+
+
+def main() -> None:
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m asyncpow.loadtest",
+        description="Drive a mix of read only API calls against Overseerr and report "
+        "throughput, latency, errors and client CPU time.",
+    )
+    target = parser.add_argument_group("target")
+    target.add_argument("--host", default="127.0.0.1")
+    target.add_argument("--port", type=int)
+    target.add_argument("--tls", action=argparse.BooleanOptionalAction, default=False)
+    target.add_argument("--base-path", default="")
+    target.add_argument(
+        "--api-key", default=os.environ.get("OVERSEERR_API_KEY"), help="or OVERSEERR_API_KEY"
+    )
+    target.add_argument(
+        "--mock", action="store_true", help="start a local mock server and ignore --host"
+    )
+    target.add_argument("--total-results", type=int, default=1000, help="mock items per list")
+    load = parser.add_argument_group("load")
+    load.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted operations ({DEFAULT_MIX})")
+    mode = load.add_mutually_exclusive_group()
+    mode.add_argument("--rate", type=float, help="calls started per second")
+    mode.add_argument("--concurrency", type=int, help="closed loop workers (10)")
+    load.add_argument("--duration", type=float, default=30.0, help="seconds (30)")
+    load.add_argument("--warmup", type=float, default=2.0, help="seconds before measuring (2)")
+    load.add_argument("--take", type=int, default=20, help="page size of list calls (20)")
+    load.add_argument("--connections", type=int, default=100, help="connection pool size (100)")
+    load.add_argument("--max-in-flight", type=int, default=1000)
+    load.add_argument("--seed", type=int)
+    load.add_argument("--json", help="also write the report to this file")
+    fault_arguments(parser)
+    args = parser.parse_args()
+    parse_mix(args.mix)
+
+    process = None
+    port = args.port
+    if args.mock:
+        queue: multiprocessing.Queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=_serve_mock,
+            args=(queue, fault_config(args), args.total_results, args.seed),
+            daemon=True,
+        )
+        process.start()
+        args.host, port, args.tls, args.base_path = "127.0.0.1", queue.get(timeout=30), False, ""
+        args.api_key = args.api_key or _mock_key()
+    elif not args.api_key:
+        parser.error("--api-key or OVERSEERR_API_KEY is required unless --mock is given")
+
+    try:
+        report = asyncio.run(_main(args, port))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.join()
+
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            file.write(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
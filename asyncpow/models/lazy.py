@@ -0,0 +1,140 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from typing import Any, Generic, Iterator, Sequence, TypeVar, overload
+
+from pydantic import BaseModel, ConfigDict
+
+from asyncpow.models.common import PaginatedResponseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class LazyList(Sequence[ModelT], Generic[ModelT]):
+    """
+    List of raw rows that are validated into models on first access.
+
+    Validated models are kept, so each row is validated at most once. Use iter_models to
+    walk the rows without keeping the models, or raw to read the rows directly.
+    """
+
+    __slots__ = ("model", "raw", "_items")
+
+    def __init__(self, model: type[ModelT], raw: list[dict[str, Any]]) -> None:
+        """
+        Initialize the LazyList with the model and the raw rows.
+
+        Args:
+            model (type[ModelT]): The model each row is validated into.
+            raw (list[dict[str, Any]]): The raw rows.
+
+        Returns:
+            None
+        """
+        self.model = model
+        self.raw = raw
+        self._items: list[ModelT | None] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        """Number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> ModelT:
+        """Get the model of a row."""
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ModelT]:
+        """Get the models of a slice of rows."""
+
+    def __getitem__(self, index: int | slice) -> ModelT | list[ModelT]:
+        """Get the model of a row, validating it on first access.
+
+        Args:
+            index (int | slice): The row index, or a slice of rows.
+
+        Returns:
+            ModelT | list[ModelT]: The model, or the models of the slice.
+        """
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self.raw)))]
+
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self.model.model_validate(self.raw[index])
+        return item
+
+    def __iter__(self) -> Iterator[ModelT]:
+        """Iterate over the models, validating and keeping them as they are reached.
+
+        Yields:
+            ModelT: The models.
+        """
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def iter_models(self) -> Iterator[ModelT]:
+        """Iterate over the models without keeping them.
+
+        Rows that were already accessed are not validated again.
+
+        Yields:
+            ModelT: The models.
+        """
+        for item, row in zip(self._items, self.raw):
+            yield item if item is not None else self.model.model_validate(row)
+
+    def __repr__(self) -> str:
+        """Summary of the list.
+
+        Returns:
+            str: The model name and the number of validated rows.
+        """
+        validated = sum(item is not None for item in self._items)
+        return f"LazyList[{self.model.__name__}]({validated}/{len(self.raw)} validated)"
+
+
+class LazyPageModel(PaginatedResponseModel):
+    """
+    Data class representing a page whose results are validated on first access.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    results: LazyList[Any]
+
+    @classmethod
+    def from_response(cls, model: type[BaseModel], response: dict[str, Any]) -> "LazyPageModel":
+        """Build a lazy page from a raw response.
+
+        Args:
+            model (type[BaseModel]): The model each result is validated into.
+            response (dict[str, Any]): The raw response, with pageInfo and results.
+
+        Returns:
+            LazyPageModel: The page, only pageInfo is validated.
+        """
+        return cls(pageInfo=response["pageInfo"], results=LazyList(model, response["results"]))
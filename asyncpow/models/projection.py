@@ -0,0 +1,116 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+from pydantic import BaseModel, create_model
+
+from asyncpow.models.common import PaginatedResponseModel
+
+
+def projection(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """
+    Get a compact model that keeps only the given fields of a model.
+
+    Fields keep their type, default and alias, every other key of the input is ignored and
+    never validated. Models are built once per model and field list and then reused.
+
+    Args:
+        model (type[BaseModel]): The full model, e.g. MediaInfoModel.
+        fields (Iterable[str]): The fields to keep, in order.
+
+    Returns:
+        type[BaseModel]: The compact model.
+
+    Raises:
+        ValueError: If a field is not a field of the model.
+
+    Examples:
+        >>> MediaIds = projection(MediaInfoModel, ["id", "tmdbId", "status"])
+        >>> MediaIds(**item)
+        MediaInfoModelProjection(id=1, tmdbId=27205, status=5)
+    """
+    return _projection(model, tuple(dict.fromkeys(fields)))
+
+
+def projection_page(model: type[BaseModel], fields: Iterable[str]) -> type[PaginatedResponseModel]:
+    """
+    Get a page model whose results are the compact model of the given fields.
+
+    Args:
+        model (type[BaseModel]): The full model of a result, e.g. MediaInfoModel.
+        fields (Iterable[str]): The fields to keep, in order.
+
+    Returns:
+        type[PaginatedResponseModel]: The page model.
+
+    Raises:
+        ValueError: If a field is not a field of the model.
+    """
+    return _projection_page(model, tuple(dict.fromkeys(fields)))
+
+
+@lru_cache(maxsize=128)
+def _projection(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """Build the compact model of a model and a field list.
+
+    Args:
+        model (type[BaseModel]): The full model.
+        fields (tuple[str, ...]): The fields to keep, without duplicates.
+
+    Returns:
+        type[BaseModel]: The compact model.
+
+    Raises:
+        ValueError: If a field is not a field of the model.
+    """
+    unknown = [name for name in fields if name not in model.model_fields]
+    if unknown:
+        raise ValueError(f"{model.__name__} has no field {', '.join(unknown)}")
+
+    definitions: dict[str, Any] = {
+        name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields
+    }
+    return create_model(f"{model.__name__}Projection", __module__=__name__, **definitions)
+
+
+@lru_cache(maxsize=128)
+def _projection_page(
+    model: type[BaseModel], fields: tuple[str, ...]
+) -> type[PaginatedResponseModel]:
+    """Build the page model of a model and a field list.
+
+    Args:
+        model (type[BaseModel]): The full model of a result.
+        fields (tuple[str, ...]): The fields to keep, without duplicates.
+
+    Returns:
+        type[PaginatedResponseModel]: The page model.
+    """
+    results: Any = list[_projection(model, fields)]
+    return create_model(
+        f"{model.__name__}ProjectionPage",
+        __base__=PaginatedResponseModel,
+        __module__=__name__,
+        results=(results, ...),
+    )
@@ -22,13 +22,22 @@
 
 from typing import Literal
 
-from asyncpow.models.common import PaginatedResponseModel
+from pydantic import BaseModel
+
+from asyncpow.models.common import MediaType, PaginatedResponseModel
 from asyncpow.models.media import MediaRequestModel
 
 RequestFilterOptions = Literal[
     "all", "approved", "available", "pending", "processing", "unavailable", "failed"
 ]
 
+SeriesOptions = Literal["all", "latest", "first"]
+
+# A media to request: (id, type) or (id, type, series)
+RequestItem = tuple[int, MediaType] | tuple[int, MediaType, SeriesOptions]
+
+BulkRequestOutcome = Literal["requested", "skipped", "failed"]
+
 
 class RequestResultsResponseModel(PaginatedResponseModel):
     """
@@ -36,3 +45,16 @@ class RequestResultsResponseModel(PaginatedResponseModel):
     """
 
     results: list[MediaRequestModel]
+
+
+class BulkRequestResultModel(BaseModel):
+    """
+    Data class representing the outcome of one item of a bulk request.
+    """
+
+    id: int
+    type: MediaType
+    series: SeriesOptions
+    outcome: BulkRequestOutcome
+    request: MediaRequestModel | dict | None = None  # The created request, if requested
+    reason: str | None = None  # Why the item was skipped or failed
@@ -20,19 +20,42 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 
-from pydantic import BaseModel, field_validator
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, Field, field_validator
 
 from asyncpow.exceptions import POWMediaTypeException
 from asyncpow.models.media import MediaInfoModel
 
 
+def _check_media_types(items: Any, media_types: tuple[str, ...]) -> Any:
+    """
+    Check the mediaType of each raw item before the tagged union validates it.
+
+    Args:
+        items (Any): The raw items.
+        media_types (tuple[str, ...]): The supported media types.
+
+    Returns:
+        Any: The items, unchanged.
+
+    Raises:
+        POWMediaTypeException: If an item has an unsupported media type.
+    """
+    if isinstance(items, list):
+        for item in items:
+            if isinstance(item, dict) and item.get("mediaType") not in media_types:
+                raise POWMediaTypeException(f"Unsupported Media Type: {item.get('mediaType')}")
+    return items
+
+
 class MovieResultModel(BaseModel):
     """
     Data class representing a movie search result.
     """
 
     id: int
-    mediaType: str
+    mediaType: Literal["movie"]
     popularity: float
     voteCount: int
     voteAverage: float
@@ -55,7 +78,7 @@ class TvResultModel(BaseModel):
     """
 
     id: int
-    mediaType: str
+    mediaType: Literal["tv"]
     popularity: float
     voteCount: int
     voteAverage: float
@@ -71,6 +94,10 @@ class TvResultModel(BaseModel):
     mediaInfo: MediaInfoModel | None = None
 
 
+# A movie or TV show, selected by its mediaType.
+KnownForResult = Annotated[MovieResultModel | TvResultModel, Field(discriminator="mediaType")]
+
+
 class PersonResultModel(BaseModel):
     """
     Data class representing a person search result.
@@ -80,77 +107,63 @@ class PersonResultModel(BaseModel):
     name: str
     popularity: float
     adult: bool
-    mediaType: str
-    knownFor: list[MovieResultModel | TvResultModel]
+    mediaType: Literal["person"]
+    knownFor: list[KnownForResult]
     profilePath: str | None = None
 
-    @field_validator("knownFor")
-    def validate_knownfor(cls, v):
+    @field_validator("knownFor", mode="before")
+    @classmethod
+    def validate_knownfor(cls, v: Any) -> Any:
         """
-        Validate the 'knownFor' field by creating and returning a list of validated known for items.
+        Reject known for items with an unsupported media type.
 
         Args:
-            v: The value to be validated.
+            v (Any): The raw known for items.
 
         Returns:
-            list: A list of validated known for items.
+            Any: The items, unchanged.
 
         Raises:
             POWMediaTypeException: If the media type is unsupported.
-
-        Examples:
-            validated_known_for = validate_knownfor(v)
         """
+        return _check_media_types(v, ("movie", "tv"))
+
 
-        validated_known_for = []
-        for item in v:
-            media_type = item.get("mediaType")
-            if media_type == "movie":
-                validated_known_for.append(MovieResultModel(**item))
-            elif media_type == "tv":
-                validated_known_for.append(TvResultModel(**item))
-            else:
-                raise POWMediaTypeException(f"Unsupported Media Type: {media_type}")
-        return validated_known_for
+# A movie, TV show or person, selected by its mediaType.
+SearchResult = Annotated[
+    MovieResultModel | TvResultModel | PersonResultModel, Field(discriminator="mediaType")
+]
 
 
 class SearchResultModel(BaseModel):
     """
     Data class representing search items in search.
+
+    Each result is validated once, as the model named by its mediaType. A result with any
+    other mediaType raises POWMediaTypeException.
     """
 
     page: int
     totalPages: int
     totalResults: int
-    results: list[MovieResultModel | TvResultModel | PersonResultModel]
+    results: list[SearchResult]
 
-    @field_validator("results")
-    def validate_results(cls, v):
+    @field_validator("results", mode="before")
+    @classmethod
+    def validate_results(cls, v: Any) -> Any:
         """
-        Validate the 'results' field by creating and returning a list of validated result items.
+        Reject results with an unsupported media type.
 
         Args:
-            v: The value to be validated.
+            v (Any): The raw results.
 
         Returns:
-            list: A list of validated result items.
+            Any: The results, unchanged.
 
         Raises:
             POWMediaTypeException: If the media type is unsupported.
         """
-
-        validated_results = []
-        for item in v:
-            media_type = item.get("mediaType")
-            if media_type == "movie":
-                validated_results.append(MovieResultModel(**item))
-            elif media_type == "tv":
-                validated_results.append(TvResultModel(**item))
-            elif media_type == "person":
-                validated_results.append(PersonResultModel(**item))
-            else:
-                raise POWMediaTypeException(f"Unsupported Media Type: {media_type}")
-        return validated_results
+        return _check_media_types(v, ("movie", "tv", "person"))
 
 
 class WatchlistModel(BaseModel):
@@ -103,3 +103,13 @@ class TvDetailsModel(BaseModel):
     externalIds: ExternalIdsModel
     keywords: list[KeywordModel]
     watchProviders: list[WatchProviderModel]
+
+
+class TvSeasonSummaryModel(BaseModel):
+    """
+    Data class representing the TV details needed to request a show.
+    """
+
+    id: int
+    tvdbId: int | None = None
+    seasonNumbers: list[int]
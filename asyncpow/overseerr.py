@@ -20,8 +20,7 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 
-import aiohttp
-from cachetools import TTLCache
+from aiohttp import BaseConnector, ClientSession
 from yarl import URL
 
 from asyncpow.apis.media import Media
@@ -33,8 +32,13 @@ from asyncpow.apis.tv import Tv
 from asyncpow.apis.user import User
 from asyncpow.const import API_URI
 from asyncpow.utils.api_key import is_valid_api_key
-
-VERSION_CACHE: TTLCache[str, str | None] = TTLCache(maxsize=16, ttl=7200)
+from asyncpow.utils.breaker import CircuitBreaker
+from asyncpow.utils.cache import ResponseCache
+from asyncpow.utils.codec import CodecName, get_codec
+from asyncpow.utils.metrics import Metrics
+from asyncpow.utils.ratelimit import RateLimiter
+from asyncpow.utils.timeouts import TimeoutConfig
+from asyncpow.utils.transport import Transport, TransportConfig
 
 
 class Overseerr:
@@ -53,11 +57,17 @@ class Overseerr:
             port=5055,
             tls=True,
             base_url="overseerr/",
+            transport_config=TransportConfig(limit_per_host=20, keepalive_timeout=30),
+            cache=ResponseCache(maxsize=2048, policies={"movie": 3600, "tv": 3600}),
         ) as api:
             # Inside the context, you can use the API wrapper as needed
             status = await api.status.get_status()
             print("Status:", status)
 
+            # Bound a call, retries and nested requests included, by a shared budget
+            with deadline(2.0):
+                await api.request.async_post_request(id=1399, type="tv")
+
     """
 
     raw_response = False  # Default value for raw_response
@@ -74,6 +84,16 @@ class Overseerr:
         port: int | None = None,
         tls: bool = True,
         base_path: str = "",
+        transport_config: TransportConfig | None = None,
+        session: ClientSession | None = None,
+        connector: BaseConnector | None = None,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        timeouts: TimeoutConfig | None = None,
+        json_codec: CodecName | None = None,
+        metrics: Metrics | None = None,
     ):
         """
         Initialize the Overseerr API client with the host, API key, and optional port, SSL, and base URL.
@@ -84,6 +104,25 @@ class Overseerr:
             port (int, Optional): The port of the Overseerr instance (default is None).
             tls (bool): Flag indicating whether SSL is enabled (default is True).
             base_path (str): The base URL for the API (default is "").
+            transport_config (TransportConfig, Optional): Connection pool settings (default is None).
+            session (ClientSession, Optional): Existing session to use, it is not closed on exit.
+            connector (BaseConnector, Optional): Connector to share between clients, it is not
+                closed on exit.
+            cache (ResponseCache, Optional): Cache for slow changing GET responses, such as
+                movie and TV details (default is None, no caching).
+            coalesce_requests (bool): Send a single request for identical GET requests that
+                are in flight at the same time, each caller still gets its own result
+                (default is True).
+            rate_limiter (RateLimiter, Optional): Client side rate limit, can be shared between
+                clients talking to the same instance (default is None, no limit).
+            circuit_breaker (CircuitBreaker, Optional): Fails fast while the instance is
+                unhealthy and probes it with status.async_get_status (default is None).
+            timeouts (TimeoutConfig, Optional): Connect, read and total timeouts per request,
+                with per-endpoint overrides (default is None, 10 seconds in total).
+            json_codec (CodecName, Optional): "orjson", "msgspec" or "json" (default is None,
+                the fastest codec installed).
+            metrics (Metrics, Optional): Records latency, status codes, retries, sizes and
+                parse times (default is None, no metrics).
 
         Returns:
             None
@@ -103,19 +142,33 @@ class Overseerr:
         else:
             raise ValueError("API Key is not valid")
 
-        # Initialize a single instance of ClientSession
-        self._session = aiohttp.ClientSession()
+        # Initialize a single transport shared by all API classes
+        self._transport = Transport(
+            transport_config,
+            session=session,
+            connector=connector,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            timeouts=timeouts,
+            codec=get_codec(json_codec),
+            metrics=metrics,
+        )
         # Initialize instances of API classes
-        self.status = Status(self.url, self.api_key, self._session, self.raw_response)
-        self.search = Search(self.url, self.api_key, self._session, self.raw_response)
-        self.discover = Discover(self.url, self.api_key, self._session, self.raw_response)
-        self.media = Media(self.url, self.api_key, self._session, self.raw_response)
-        self.movie = Movie(self.url, self.api_key, self._session, self.raw_response)
-        self.tv = Tv(self.url, self.api_key, self._session, self.raw_response)
+        self.status = Status(self.url, self.api_key, self._transport, self.raw_response)
+        self.search = Search(self.url, self.api_key, self._transport, self.raw_response)
+        self.discover = Discover(self.url, self.api_key, self._transport, self.raw_response)
+        self.media = Media(self.url, self.api_key, self._transport, self.raw_response)
+        self.movie = Movie(self.url, self.api_key, self._transport, self.raw_response)
+        self.tv = Tv(self.url, self.api_key, self._transport, self.raw_response)
         self.request = Request(
-            self.url, self.api_key, self._session, self.raw_response, self.tv, self.movie
+            self.url, self.api_key, self._transport, self.raw_response, self.tv, self.movie
         )
-        self.user = User(self.url, self.api_key, self._session, self.raw_response)
+        self.user = User(self.url, self.api_key, self._transport, self.raw_response)
+
+        if circuit_breaker is not None and circuit_breaker.probe is None:
+            circuit_breaker.probe = self.status.async_get_status
 
     async def __aenter__(self):
         """
@@ -142,5 +195,5 @@ class Overseerr:
             Any exceptions raised during the session close operation.
         """
 
-        # Close the session when exiting the context manager
-        await self._session.close()
+        # Close the session when exiting the context manager, unless it was passed in
+        await self._transport.close()
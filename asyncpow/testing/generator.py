@@ -0,0 +1,284 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections import Counter
+from functools import cached_property
+from importlib import resources
+from importlib.abc import Traversable
+import itertools
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None  # type: ignore[assignment]
+
+# The OpenAPI spec of Overseerr, shipped with the package
+SPEC_PATH: Traversable = resources.files("asyncpow") / "testing" / "overseerr.yml"
+DATE = "2020-09-12T10:00:27.000Z"
+
+# Fields the API returns but the spec does not describe, or describes differently, keyed by
+# "<Schema>.<property>". Properties missing from the spec are added to the schema.
+OVERRIDES: dict[str, Callable[[int], Any]] = {
+    "PageInfo.pageSize": lambda n: 20,
+    "MediaInfo.mediaType": lambda n: ("movie", "tv")[n % 2],
+    "MediaInfo.status": lambda n: 1 + n % 5,
+    "MediaInfo.status4k": lambda n: 1 + n % 5,
+    "MediaInfo.lastSeasonChange": lambda n: DATE,
+    "MediaRequest.type": lambda n: ("movie", "tv")[n % 2],
+    "MediaRequest.status": lambda n: 1 + n % 3,
+    "User.displayName": lambda n: f"User {n}",
+    "MovieResult.mediaType": lambda n: "movie",
+    "TvResult.mediaType": lambda n: "tv",
+    "PersonResult.name": lambda n: f"Person {n}",
+    "PersonResult.popularity": lambda n: 12.5,
+    # The spec nests WatchProviders, itself an array, in another array.
+    "MovieDetails.watchProviders": lambda n: [],
+    "TvDetails.watchProviders": lambda n: [],
+    # The movie endpoint passes TMDB's snake case spoken languages through.
+    "MovieDetails.spokenLanguages": lambda n: [
+        {"english_name": "English", "iso_639_1": "en", "name": "English"}
+    ],
+    "MovieDetails.keywords": lambda n: [{"id": n, "name": f"keyword {n}"}],
+    "TvDetails.numberOfSeasons": lambda n: 8,
+    "/discover/watchlist.results.mediaType": lambda n: ("movie", "tv")[n % 2],
+}
+
+
+class PayloadGenerator:
+    """
+    Build synthetic payloads from the OpenAPI schemas of the Overseerr API.
+
+    Values come from the schema defaults, examples and enums where there are any, otherwise
+    they are derived from the property type and a counter, so the same arguments always
+    build the same payload. The alternatives of an anyOf or oneOf are used in turn at each
+    path, so the results of a search cycle through movies, shows and people. Requires
+    PyYAML, install the testing extra, and reads the spec shipped with the package unless
+    given another one.
+
+    Array lengths are looked up by the path of the array, which starts at the closest
+    named schema, e.g. ``MediaInfo.requests`` or ``TvDetails.credits.cast``, or at the
+    API path for inline response schemas, e.g. ``/media.results``. Schemas reached through
+    an array count as one level of nesting, arrays that would go deeper than ``depth``
+    are left empty.
+
+    Examples:
+        generator = PayloadGenerator(depth=3, lengths={"MediaInfo.requests": 5})
+        page = generator.response("/request", items=1000)
+    """
+
+    def __init__(
+        self,
+        spec_path: Path | Traversable = SPEC_PATH,
+        depth: int = 1,
+        items: int = 2,
+        lengths: Mapping[str, int] | None = None,
+        overrides: Mapping[str, Callable[[int], Any]] | None = None,
+    ) -> None:
+        """
+        Initialize the PayloadGenerator.
+
+        Args:
+            spec_path (Path | Traversable): The OpenAPI spec (default is SPEC_PATH).
+            depth (int): Levels of schemas nested through arrays, 1 expands the results of
+                a page but not the arrays of schemas inside them (default is 1).
+            items (int): Length of arrays not listed in lengths (default is 2).
+            lengths (Mapping[str, int], optional): Array lengths by path.
+            overrides (Mapping[str, Callable[[int], Any]], optional): Value factories by
+                "<Schema>.<property>", called with a counter. Defaults to OVERRIDES.
+
+        Returns:
+            None
+        """
+        self.spec_path = spec_path
+        self.depth = depth
+        self.items = items
+        self.lengths = dict(lengths or {})
+        self.overrides = OVERRIDES if overrides is None else overrides
+        self._counter = itertools.count(1)
+        self._variants: Counter[str] = Counter()
+        self._added: dict[str, list[str]] = {}
+        for key in self.overrides:
+            parent, prop = key.rsplit(".", 1)
+            self._added.setdefault(parent, []).append(prop)
+
+    @cached_property
+    def spec(self) -> dict[str, Any]:
+        """The parsed OpenAPI spec.
+
+        Raises:
+            ImportError: If PyYAML is not installed.
+
+        Returns:
+            dict[str, Any]: The spec.
+        """
+        if yaml is None:
+            raise ImportError("pyyaml is not installed, install asyncpow[testing]")
+        with self.spec_path.open("r", encoding="utf-8") as file:
+            return yaml.safe_load(file)
+
+    def schema(self, name: str) -> dict[str, Any]:
+        """Build an instance of a named schema.
+
+        Args:
+            name (str): The schema name, e.g. "TvDetails".
+
+        Returns:
+            dict[str, Any]: The instance.
+        """
+        self._reset()
+        return self._value(self.spec["components"]["schemas"][name], name, 0)
+
+    def response(self, path: str, items: int | None = None, method: str = "get") -> Any:
+        """Build the successful response of an API path.
+
+        Args:
+            path (str): The API path as written in the spec, e.g. "/media".
+            items (int, optional): Number of results, the length of the top level
+                ``results`` array. Defaults to the configured length.
+            method (str): The HTTP method (default is "get").
+
+        Returns:
+            Any: The response body.
+        """
+        responses = self.spec["paths"][path][method]["responses"]
+        status = next(code for code in responses if str(code).startswith("2"))
+        schema = responses[status]["content"]["application/json"]["schema"]
+        self._reset()
+        if items is None:
+            return self._value(schema, path, 0)
+        lengths = self.lengths
+        self.lengths = lengths | {f"{path}.results": items}
+        try:
+            return self._value(schema, path, 0)
+        finally:
+            self.lengths = lengths
+
+    def _reset(self) -> None:
+        """Restart the counter and the alternatives, so a payload does not depend on the last.
+
+        Returns:
+            None
+        """
+        self._counter = itertools.count(1)
+        self._variants.clear()
+
+    def _resolve(self, schema: dict[str, Any]) -> tuple[dict[str, Any], str | None]:
+        """Follow a $ref.
+
+        Args:
+            schema (dict[str, Any]): A schema that may be a reference.
+
+        Returns:
+            tuple[dict[str, Any], str | None]: The schema and its name, if it is a reference.
+        """
+        ref = schema.get("$ref")
+        if ref is None:
+            return schema, None
+        name = ref.rsplit("/", 1)[-1]
+        return self.spec["components"]["schemas"][name], name
+
+    def _value(self, schema: dict[str, Any], path: str, depth: int) -> Any:
+        """Build a value for a schema.
+
+        Args:
+            schema (dict[str, Any]): The schema.
+            path (str): Path of the value, used to look up array lengths and overrides.
+            depth (int): Levels of schemas nested through arrays above the value.
+
+        Returns:
+            Any: The value.
+        """
+        if schema.get("type") == "array" and "$ref" in schema:
+            # The spec sometimes puts the reference to the items on the array itself
+            schema = {"type": "array", "items": {"$ref": schema["$ref"]}}
+        schema, name = self._resolve(schema)
+        if name is not None:
+            path = name
+        counter = next(self._counter)
+
+        for key in ("anyOf", "oneOf"):
+            if key in schema:
+                # Cycle through the referenced schemas, skipping inline fallbacks like null.
+                variants = [variant for variant in schema[key] if "$ref" in variant]
+                variants = variants or schema[key]
+                turn = self._variants[path]
+                self._variants[path] += 1
+                return self._value(variants[turn % len(variants)], path, depth)
+        if "allOf" in schema:
+            merged: dict[str, Any] = {}
+            for part in schema["allOf"]:
+                merged |= self._value(part, path, depth)
+            return merged
+
+        if "enum" in schema:
+            return schema["enum"][counter % len(schema["enum"])]
+        kind = schema.get("type", "object" if "properties" in schema else None)
+        if kind == "object":
+            return self._object(schema, path, depth)
+        if kind == "array":
+            length = self.lengths.get(path, self.items)
+            items = schema["items"]
+            variants = items.get("anyOf", items.get("oneOf", [items]))
+            nested = any("$ref" in variant for variant in variants)
+            if nested and depth >= self.depth:
+                return []
+            return [self._value(items, path, depth + nested) for _ in range(length)]
+        if "default" in schema:
+            return schema["default"]
+        if "example" in schema:
+            return schema["example"]
+        if kind in ("number", "integer"):
+            return counter
+        if kind == "boolean":
+            return counter % 2 == 0
+        if kind == "string":
+            return DATE if schema.get("format") == "date-time" else f"{path} {counter}"
+        return None
+
+    def _object(self, schema: dict[str, Any], path: str, depth: int) -> dict[str, Any]:
+        """Build an object with every property of a schema.
+
+        Args:
+            schema (dict[str, Any]): The object schema.
+            path (str): Path of the object.
+            depth (int): Levels of schemas nested through arrays above the object.
+
+        Returns:
+            dict[str, Any]: The object.
+        """
+        properties = schema.get("properties", {})
+        value = {
+            prop: self.overrides[f"{path}.{prop}"](next(self._counter))
+            for prop in self._added.get(path, ())
+            if prop not in properties
+        }
+        for prop, prop_schema in properties.items():
+            prop_path = f"{path}.{prop}"
+            override = self.overrides.get(prop_path)
+            if override is not None:
+                value[prop] = override(next(self._counter))
+            elif prop == "id" and prop_schema.get("type") in ("number", "integer"):
+                value[prop] = next(self._counter)
+            else:
+                value[prop] = self._value(prop_schema, prop_path, depth)
+        return value
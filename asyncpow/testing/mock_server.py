@@ -0,0 +1,502 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import argparse
+import asyncio
+from collections import Counter
+import json
+import math
+from pathlib import Path
+import random
+from typing import Any, Literal, Mapping, get_args
+
+from aiohttp import web
+from pydantic import BaseModel, Field
+from yarl import URL
+
+from asyncpow.const import API_URI
+from asyncpow.testing.generator import SPEC_PATH, PayloadGenerator
+from asyncpow.utils.endpoint import endpoint_name, match_endpoint
+
+# The endpoints asyncpow calls, as written in the spec
+ROUTES: tuple[tuple[str, str], ...] = (
+    ("GET", "/status"),
+    ("GET", "/status/appdata"),
+    ("GET", "/search"),
+    ("GET", "/discover/trending"),
+    ("GET", "/discover/watchlist"),
+    ("GET", "/media"),
+    ("POST", "/media/{mediaId}/{status}"),
+    ("DELETE", "/media/{mediaId}"),
+    ("GET", "/movie/{movieId}"),
+    ("GET", "/tv/{tvId}"),
+    ("GET", "/request"),
+    ("POST", "/request"),
+    ("GET", "/user"),
+    ("POST", "/user"),
+    ("GET", "/user/{userId}"),
+)
+
+# Top level fields that vary with the request, kept out of the cached bodies
+PATCHED = ("pageInfo", "page", "id")
+
+Distribution = Literal["fixed", "uniform", "normal", "lognormal", "exponential"]
+
+
+class LatencyConfig(BaseModel):
+    """
+    Data class representing the delay added before each response, in seconds.
+
+    "fixed" always waits mean, "uniform" draws between mean - spread and mean + spread,
+    "normal" uses spread as the standard deviation, "lognormal" keeps the mean and uses
+    spread as the sigma of the underlying normal for a long tail, and "exponential"
+    draws with the given mean. Delays are clipped to between 0 and maximum.
+    """
+
+    distribution: Distribution = "fixed"
+    mean: float = Field(default=0.0, ge=0)
+    spread: float = Field(default=0.0, ge=0)
+    maximum: float = Field(default=30.0, ge=0)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a delay.
+
+        Args:
+            rng (random.Random): The random number generator.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.mean == 0:
+            return 0.0
+        if self.distribution == "uniform":
+            delay = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "normal":
+            delay = rng.gauss(self.mean, self.spread)
+        elif self.distribution == "lognormal":
+            delay = rng.lognormvariate(math.log(self.mean) - self.spread**2 / 2, self.spread)
+        elif self.distribution == "exponential":
+            delay = rng.expovariate(1 / self.mean)
+        else:
+            delay = self.mean
+        return min(max(delay, 0.0), self.maximum)
+
+
+class FaultConfig(BaseModel):
+    """
+    Data class representing the faults injected into responses.
+
+    Each request is reset, throttled or failed with the given probabilities, checked in
+    that order, after the latency delay. Successful responses are streamed slowly with
+    probability slow_body_rate, in chunks of slow_body_chunk bytes slow_body_delay seconds
+    apart.
+    """
+
+    latency: LatencyConfig = LatencyConfig()
+    reset_rate: float = Field(default=0.0, ge=0, le=1)
+    throttle_rate: float = Field(default=0.0, ge=0, le=1)
+    throttle_status: int = 429
+    retry_after: float | None = 1.0
+    error_rate: float = Field(default=0.0, ge=0, le=1)
+    error_statuses: list[int] = [500, 502]
+    slow_body_rate: float = Field(default=0.0, ge=0, le=1)
+    slow_body_chunk: int = Field(default=1024, gt=0)
+    slow_body_delay: float = Field(default=0.01, ge=0)
+
+
+class MockOverseerr:
+    """
+    Mock Overseerr server for load and resilience testing without a real instance.
+
+    Serves the endpoints asyncpow calls with payloads generated from the OpenAPI spec,
+    see PayloadGenerator, and injects the configured latency and faults. Pages honour
+    take and skip over total_results items. Counts of each outcome are kept in stats and
+    of each route in hits.
+
+    Examples:
+        faults = FaultConfig(latency=LatencyConfig(distribution="lognormal", mean=0.05,
+            spread=1.0), throttle_rate=0.05)
+        async with MockOverseerr(faults) as mock:
+            async with Overseerr(mock.host, api_key, port=mock.port, tls=False) as client:
+                ...
+    """
+
+    def __init__(
+        self,
+        faults: FaultConfig | None = None,
+        endpoints: Mapping[str, FaultConfig] | None = None,
+        api_key: str | None = None,
+        total_results: int = 1000,
+        generator: PayloadGenerator | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialize the MockOverseerr.
+
+        Args:
+            faults (FaultConfig, optional): Faults of every endpoint. Defaults to none.
+            endpoints (Mapping[str, FaultConfig], optional): Faults overriding the default
+                for the endpoints matching a prefix, such as "search" or "tv".
+            api_key (str, optional): Reject requests without this X-Api-Key with a 403.
+                Defaults to accepting any key.
+            total_results (int): Number of items behind the paginated endpoints
+                (default is 1000).
+            generator (PayloadGenerator, optional): Builds the payloads. Defaults to a
+                generator reading the spec shipped with the package.
+            seed (int, optional): Seed of the latency and fault draws.
+
+        Returns:
+            None
+        """
+        self.faults = faults or FaultConfig()
+        self.endpoints = dict(endpoints or {})
+        self.api_key = api_key
+        self.total_results = total_results
+        self.generator = generator or PayloadGenerator()
+        self.stats: Counter[str] = Counter()
+        self.hits: Counter[str] = Counter()
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._random = random.Random(seed)
+        self._bodies: dict[tuple[str, str, int | None], tuple[dict[str, Any], bytes]] = {}
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> URL:
+        """The base URL of the API.
+
+        Returns:
+            URL: The URL, e.g. http://127.0.0.1:8080/api/v1
+        """
+        return URL.build(scheme="http", host=self.host, port=self.port, path=f"/{API_URI}")
+
+    def create_app(self) -> web.Application:
+        """Create the application serving the mocked routes.
+
+        Returns:
+            web.Application: The application.
+        """
+        app = web.Application()
+        for method, path in ROUTES:
+            operation = self.generator.spec["paths"][path][method.lower()]
+            responses = {str(code): response for code, response in operation["responses"].items()}
+            status = int(next(code for code in responses if code.startswith("2")))
+            has_body = "content" in responses[str(status)]
+            # Operations with an empty security list are public
+            public = operation.get("security") == []
+
+            async def handle(
+                request: web.Request,
+                method: str = method,
+                path: str = path,
+                status: int = status,
+                has_body: bool = has_body,
+                public: bool = public,
+            ) -> web.StreamResponse:
+                """Serve a route.
+
+                Args:
+                    request (web.Request): The incoming request.
+                    method (str): The HTTP method of the route.
+                    path (str): The path of the route in the spec.
+                    status (int): The status of a successful response.
+                    has_body (bool): Whether a successful response has a body.
+                    public (bool): Whether the route is served without an API key.
+
+                Returns:
+                    web.StreamResponse: The response.
+                """
+                return await self._handle(request, method, path, status, has_body, public)
+
+            app.router.add_route(method, f"/{API_URI}{path}", handle)
+        return app
+
+    async def _handle(
+        self,
+        request: web.Request,
+        method: str,
+        path: str,
+        status: int,
+        has_body: bool,
+        public: bool,
+    ) -> web.StreamResponse:
+        """Serve a request, injecting the configured latency and faults.
+
+        Args:
+            request (web.Request): The incoming request.
+            method (str): The HTTP method of the route.
+            path (str): The path of the route in the spec.
+            status (int): The status of a successful response.
+            has_body (bool): Whether a successful response has a body.
+            public (bool): Whether the route is served without an API key.
+
+        Returns:
+            web.StreamResponse: The response.
+        """
+        self.hits[f"{method} {path}"] += 1
+        self.stats["requests"] += 1
+        if request.can_read_body:
+            await request.read()
+        if (
+            not public
+            and self.api_key is not None
+            and request.headers.get("X-Api-Key") != self.api_key
+        ):
+            self.stats["unauthorized"] += 1
+            return web.json_response({"message": "You do not have permission"}, status=403)
+
+        faults = match_endpoint(self.endpoints, endpoint_name(request.url)) or self.faults
+        delay = faults.latency.sample(self._random)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < faults.reset_rate:
+            self.stats["reset"] += 1
+            if request.transport is not None:
+                request.transport.abort()
+            return web.Response(status=499)
+        roll -= faults.reset_rate
+        if roll < faults.throttle_rate:
+            self.stats["throttled"] += 1
+            headers = {}
+            if faults.retry_after is not None:
+                headers["Retry-After"] = f"{faults.retry_after:g}"
+            return web.json_response(
+                {"message": "Too many requests"}, status=faults.throttle_status, headers=headers
+            )
+        roll -= faults.throttle_rate
+        if roll < faults.error_rate:
+            self.stats["error"] += 1
+            error = faults.error_statuses[
+                int(roll / faults.error_rate * len(faults.error_statuses))
+            ]
+            return web.json_response({"message": "Internal server error"}, status=error)
+
+        self.stats["ok"] += 1
+        if not has_body:
+            return web.Response(status=status)
+        body = self._body(request, method, path)
+        if self._random.random() >= faults.slow_body_rate:
+            return web.Response(body=body, status=status, content_type="application/json")
+
+        self.stats["slow"] += 1
+        response = web.StreamResponse(status=status)
+        response.content_type = "application/json"
+        response.content_length = len(body)
+        await response.prepare(request)
+        for start in range(0, len(body), faults.slow_body_chunk):
+            await response.write(body[start : start + faults.slow_body_chunk])
+            await asyncio.sleep(faults.slow_body_delay)
+        await response.write_eof()
+        return response
+
+    def _body(self, request: web.Request, method: str, path: str) -> bytes:
+        """Build the body of a successful response.
+
+        Bodies are generated and encoded once per route and page size. The fields that
+        change with each request, the pageInfo or page of a page and the ID of a detail
+        route, are encoded on their own and put in front of the cached body.
+
+        Args:
+            request (web.Request): The incoming request.
+            method (str): The HTTP method of the route.
+            path (str): The path of the route in the spec.
+
+        Returns:
+            bytes: The encoded body.
+        """
+        take = items = None
+        skip = 0
+        if "take" in request.query:
+            take = int(request.query["take"])
+            skip = int(request.query.get("skip", 0))
+            items = max(0, min(take, self.total_results - skip))
+        key = (method, path, items)
+        cached = self._bodies.get(key)
+        if cached is None:
+            value = self.generator.response(path, items, method.lower())
+            if not isinstance(value, dict):
+                cached = self._bodies[key] = ({}, json.dumps(value).encode())
+            else:
+                fields = {name: value.pop(name) for name in PATCHED if name in value}
+                cached = self._bodies[key] = (fields, json.dumps(value).encode())
+        fields, body = cached
+        if not fields:
+            return body
+
+        fields = dict(fields)
+        if take is not None and "pageInfo" in fields:
+            fields["pageInfo"] = {
+                "page": skip // take + 1 if take else 1,
+                "pages": math.ceil(self.total_results / take) if take else 0,
+                "results": self.total_results,
+                "pageSize": take,
+            }
+        if "page" in request.query and "page" in fields:
+            fields["page"] = int(request.query["page"])
+        ids = [int(part) for part in request.match_info.values() if part.isdigit()]
+        if ids and "id" in fields:
+            fields["id"] = ids[0]
+        head = json.dumps(fields).encode()
+        return head if body == b"{}" else head[:-1] + b", " + body[1:]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> URL:
+        """Start serving.
+
+        Args:
+            host (str): Interface to listen on (default is 127.0.0.1).
+            port (int): Port to listen on, 0 picks a free one (default is 0).
+
+        Returns:
+            URL: The base URL of the API.
+        """
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        self.host, self.port = self._runner.addresses[0][:2]
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving.
+
+        Returns:
+            None
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockOverseerr":
+        """Start serving on a free port.
+
+        Returns:
+            MockOverseerr: The running server.
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop serving.
+
+        Args:
+            *exc_info: The exception raised in the block, if any.
+
+        Returns:
+            None
+        """
+        await self.stop()
+
+
+def fault_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the latency and fault options to a command line parser.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser.
+
+    Returns:
+        None
+    """
+    group = parser.add_argument_group("faults")
+    group.add_argument("--latency", choices=get_args(Distribution), default="fixed")
+    group.add_argument("--latency-mean", type=float, default=0.0, help="seconds")
+    group.add_argument("--latency-spread", type=float, default=0.0, help="seconds or sigma")
+    group.add_argument("--reset-rate", type=float, default=0.0)
+    group.add_argument("--throttle-rate", type=float, default=0.0)
+    group.add_argument("--retry-after", type=float, default=1.0, help="seconds")
+    group.add_argument("--error-rate", type=float, default=0.0)
+    group.add_argument("--slow-body-rate", type=float, default=0.0)
+    group.add_argument("--slow-body-delay", type=float, default=0.01, help="seconds per chunk")
+
+
+def fault_config(args: argparse.Namespace) -> FaultConfig:
+    """Build the fault config from parsed command line options.
+
+    Args:
+        args (argparse.Namespace): Options added by fault_arguments.
+
+    Returns:
+        FaultConfig: The faults.
+    """
+    return FaultConfig(
+        latency=LatencyConfig(
+            distribution=args.latency, mean=args.latency_mean, spread=args.latency_spread
+        ),
+        reset_rate=args.reset_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        slow_body_rate=args.slow_body_rate,
+        slow_body_delay=args.slow_body_delay,
+    )
+
+
+async def _serve(mock: MockOverseerr, host: str, port: int) -> None:
+    """Serve until cancelled.
+
+    Args:
+        mock (MockOverseerr): The server.
+        host (str): Interface to listen on.
+        port (int): Port to listen on.
+
+    Returns:
+        None
+    """
+    url = await mock.start(host, port)
+    print(f"Serving a mock Overseerr API on {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await mock.stop()
+        print(dict(mock.stats))
+
+
+def main() -> None:
+    """Run the mock server from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m asyncpow.testing.mock_server",
+        description="Serve a mock Overseerr API with injected latency and faults.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--spec", type=Path, default=SPEC_PATH, help="OpenAPI spec of Overseerr")
+    parser.add_argument("--total-results", type=int, default=1000)
+    parser.add_argument("--api-key", help="reject requests without this key")
+    parser.add_argument("--seed", type=int)
+    fault_arguments(parser)
+    args = parser.parse_args()
+
+    mock = MockOverseerr(
+        fault_config(args),
+        api_key=args.api_key,
+        total_results=args.total_results,
+        generator=PayloadGenerator(args.spec),
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(_serve(mock, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
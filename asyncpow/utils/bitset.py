@@ -0,0 +1,169 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from typing import Iterator
+
+
+class Bitset:
+    """
+    Growable set of non-negative integers stored as one bit each.
+
+    Adding and removing are O(1), counting and combining work a machine word at a time,
+    so a set over millions of rows takes a few hundred kilobytes.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, bits: bytes | bytearray = b"") -> None:
+        """
+        Initialize the Bitset from its little-endian bytes, empty by default.
+
+        Args:
+            bits (bytes | bytearray): The bits, bit i of byte j is member j * 8 + i.
+
+        Returns:
+            None
+        """
+        self._bits = bytearray(bits)
+
+    def add(self, index: int) -> None:
+        """Add a member.
+
+        Args:
+            index (int): The member.
+
+        Returns:
+            None
+        """
+        byte = index >> 3
+        if byte >= len(self._bits):
+            self._bits.extend(bytes(max(byte + 1 - len(self._bits), len(self._bits))))
+        self._bits[byte] |= 1 << (index & 7)
+
+    def discard(self, index: int) -> None:
+        """Remove a member if present.
+
+        Args:
+            index (int): The member.
+
+        Returns:
+            None
+        """
+        byte = index >> 3
+        if byte < len(self._bits):
+            self._bits[byte] &= ~(1 << (index & 7)) & 0xFF
+
+    def __contains__(self, index: object) -> bool:
+        """Check if a member is present.
+
+        Args:
+            index (object): The member.
+
+        Returns:
+            bool: True if present.
+        """
+        if not isinstance(index, int) or index < 0:
+            return False
+        byte = index >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] >> (index & 7) & 1)
+
+    def __len__(self) -> int:
+        """Number of members.
+
+        Returns:
+            int: The number of members.
+        """
+        return int.from_bytes(self._bits, "little").bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the members in ascending order.
+
+        Yields:
+            int: The members.
+        """
+        for byte_index, byte in enumerate(self._bits):
+            while byte:
+                low = byte & -byte
+                yield byte_index * 8 + low.bit_length() - 1
+                byte ^= low
+
+    def _combine(self, other: "Bitset", value: int) -> "Bitset":
+        """Build a Bitset from the integer form of a combination with another Bitset.
+
+        Args:
+            other (Bitset): The other operand.
+            value (int): The combined bits.
+
+        Returns:
+            Bitset: The combination.
+        """
+        size = max(len(self._bits), len(other._bits))
+        return Bitset(value.to_bytes(size, "little"))
+
+    def __and__(self, other: "Bitset") -> "Bitset":
+        """Members present in both sets.
+
+        Args:
+            other (Bitset): The other set.
+
+        Returns:
+            Bitset: The intersection.
+        """
+        return self._combine(other, int(self) & int(other))
+
+    def __or__(self, other: "Bitset") -> "Bitset":
+        """Members present in either set.
+
+        Args:
+            other (Bitset): The other set.
+
+        Returns:
+            Bitset: The union.
+        """
+        return self._combine(other, int(self) | int(other))
+
+    def __sub__(self, other: "Bitset") -> "Bitset":
+        """Members of this set that are not in the other.
+
+        Args:
+            other (Bitset): The other set.
+
+        Returns:
+            Bitset: The difference.
+        """
+        return self._combine(other, int(self) & ~int(other))
+
+    def __int__(self) -> int:
+        """Integer whose set bits are the members.
+
+        Returns:
+            int: The bits as an integer.
+        """
+        return int.from_bytes(self._bits, "little")
+
+    def __repr__(self) -> str:
+        """Summary of the set.
+
+        Returns:
+            str: The number of members.
+        """
+        return f"Bitset({len(self)} members)"
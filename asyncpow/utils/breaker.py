@@ -0,0 +1,250 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import asyncio
+from contextvars import ContextVar
+import time
+from typing import Any, Awaitable, Callable, Literal
+
+from asyncpow.exceptions import (
+    POWCircuitOpenException,
+    POWConnectionException,
+    POWException,
+    POWTimeoutException,
+)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+# Set while the probe runs, so that its own request is let through the open circuit
+_probing: ContextVar[bool] = ContextVar("asyncpow_breaker_probing", default=False)
+
+
+def probing() -> bool:
+    """Check if the current request is the health probe of a circuit breaker.
+
+    The probe is sent once, without retries, so that it answers quickly.
+
+    Returns:
+        bool: True while a probe runs.
+    """
+    return _probing.get()
+
+
+def is_failure(exception: BaseException) -> bool:
+    """Check if an exception means the Overseerr instance is unhealthy.
+
+    Args:
+        exception (BaseException): The exception raised by a request.
+
+    Returns:
+        bool: True for connection errors, timeouts and 5xx responses.
+    """
+    if isinstance(exception, (POWConnectionException, POWTimeoutException)):
+        return True
+    if isinstance(exception, POWException) and exception.args:
+        status = exception.args[0]
+        return isinstance(status, int) and status >= 500
+    return False
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that fails fast while an Overseerr instance is unhealthy.
+
+    The circuit opens after failure_threshold consecutive failures, requests are then
+    rejected with POWCircuitOpenException without touching the network. Once
+    recovery_timeout has passed the circuit is half-open and a single probe is sent,
+    the circuit closes if it succeeds and opens again if it fails or is cancelled. A
+    probe, or a trial request, that has not finished after trial_timeout counts as failed.
+
+    .. code-block:: python
+
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=15)
+        breaker.add_listener(lambda old, new: print(f"circuit {old} -> {new}"))
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        probe: Callable[[], Awaitable[Any]] | None = None,
+        trial_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the CircuitBreaker in the closed state.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit (default is 5).
+            recovery_timeout (float): Seconds the circuit stays open before probing
+                (default is 30).
+            probe (Callable[[], Awaitable[Any]], optional): Health check run when
+                half-open. The Overseerr client uses status.async_get_status if None, without
+                a probe the next request is used as the trial.
+            trial_timeout (float): Seconds the probe may take, and after which a trial
+                request without an outcome is replaced by the next request (default is 30).
+
+        Returns:
+            None
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.probe = probe
+        self.trial_timeout = trial_timeout
+        self.state: CircuitState = "closed"
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._trial_started = 0.0
+        self._listeners: list[Callable[[CircuitState, CircuitState], None]] = []
+        self._lock = asyncio.Lock()
+
+    def add_listener(self, listener: Callable[[CircuitState, CircuitState], None]) -> None:
+        """Register a callback for state transitions.
+
+        Args:
+            listener (Callable[[CircuitState, CircuitState], None]): Called with the old and
+                the new state on every transition.
+
+        Returns:
+            None
+        """
+        self._listeners.append(listener)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state and notify the listeners.
+
+        Args:
+            state (CircuitState): The new state.
+
+        Returns:
+            None
+        """
+        old, self.state = self.state, state
+        if state == "open":
+            self._opened_at = time.monotonic()
+        elif state == "half_open":
+            self._trial_started = time.monotonic()
+        if old != state:
+            for listener in self._listeners:
+                listener(old, state)
+
+    def _reject(self) -> POWCircuitOpenException:
+        """Count a rejected request and build its exception.
+
+        Returns:
+            POWCircuitOpenException: The exception to raise.
+        """
+        self.rejected += 1
+        return POWCircuitOpenException("Circuit open, Overseerr instance is unhealthy.")
+
+    async def before_request(self) -> None:
+        """Check if a request may be sent, probing the instance when half-open.
+
+        Raises:
+            POWCircuitOpenException: If the circuit is open.
+
+        Returns:
+            None
+        """
+        if self.state == "closed" or _probing.get():
+            return
+        now = time.monotonic()
+        if self.state == "open" and now - self._opened_at < self.recovery_timeout:
+            raise self._reject()
+        # Rejected rather than queued behind the lock while the probe or trial is running
+        if self.state == "half_open" and now - self._trial_started < self.trial_timeout:
+            raise self._reject()
+
+        async with self._lock:
+            now = time.monotonic()
+            if self.state == "closed":
+                return
+            if self.state == "half_open" and now - self._trial_started < self.trial_timeout:
+                raise self._reject()
+            if self.state == "open" and now - self._opened_at < self.recovery_timeout:
+                raise self._reject()
+
+            # A trial that never reported an outcome is replaced by this request
+            self._transition("half_open")
+            if self.probe is None:
+                # This request is the trial, its outcome closes or opens the circuit
+                return
+
+            token = _probing.set(True)
+            try:
+                async with asyncio.timeout(self.trial_timeout):
+                    await self.probe()
+            except Exception as exception:
+                self._transition("open")
+                raise self._reject() from exception
+            except BaseException:
+                # Cancelled while probing, the next request probes again
+                self._transition("open")
+                raise
+            finally:
+                _probing.reset(token)
+            self.failures = 0
+            self._transition("closed")
+
+    def release(self) -> None:
+        """Record a request that ended without an outcome, such as a cancelled one.
+
+        The request says nothing about the health of the instance, but if it was the
+        half-open trial the circuit opens again so that a new trial can be made.
+
+        Returns:
+            None
+        """
+        if self.state == "half_open" and self.probe is None and not _probing.get():
+            self._transition("open")
+
+    def record_success(self) -> None:
+        """Record a successful request.
+
+        Returns:
+            None
+        """
+        if _probing.get():
+            return
+        self.failures = 0
+        if self.state != "closed":
+            self._transition("closed")
+
+    def record_failure(self, exception: BaseException) -> None:
+        """Record a failed request, opening the circuit when needed.
+
+        Args:
+            exception (BaseException): The exception raised by the request, only failures
+                that mean the instance is unhealthy are counted.
+
+        Returns:
+            None
+        """
+        if not is_failure(exception):
+            # The instance answered, so it is healthy
+            self.record_success()
+            return
+        if _probing.get():
+            return
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self._transition("open")
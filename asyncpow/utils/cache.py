@@ -0,0 +1,876 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Mapping, NamedTuple, TypeVar
+
+from aiohttp import hdrs
+from cachetools import TLRUCache
+from pydantic import BaseModel
+from yarl import URL
+
+from asyncpow.utils.codec import DEFAULT_CODEC, JsonCodec
+from asyncpow.utils.endpoint import endpoint_name, match_endpoint
+
+T = TypeVar("T")
+
+# Time to live in seconds for the slow changing endpoints, keyed on endpoint prefix
+DEFAULT_CACHE_POLICIES: dict[str, float] = {
+    "movie": 3600,
+    "tv": 3600,
+    "discover/trending": 600,
+    "search": 300,
+    "status/appdata": 300,
+}
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body along with the endpoint and validators it belongs to."""
+
+    value: Any
+    endpoint: str
+    ttl: float
+    expires: float  # Timer value of the cache at which the entry goes stale
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that revalidate the entry with the server.
+
+        Returns:
+            dict[str, str]: If-None-Match and If-Modified-Since, for the validators known.
+        """
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = self.etag
+        if self.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = self.last_modified
+        return headers
+
+
+class CacheStats(BaseModel):
+    """
+    Data class representing the counters of a response cache.
+    """
+
+    hits: int
+    misses: int
+    revalidations: int
+    not_modified: int
+    currsize: int
+    maxsize: int
+
+
+class ResponseCache:
+    """
+    In memory cache of decoded GET responses with per-endpoint TTLs and LRU eviction.
+
+    Responses are keyed on method, URL and query string, the ``language`` of a request
+    is part of its query. Only endpoints with a TTL greater than zero are cached.
+    Bodies are copied when stored and when served, so a caller changing a response
+    never changes what the next caller gets.
+
+    Responses that came with an ETag or Last-Modified header are kept for stale_ttl
+    seconds after they expire, so they can be revalidated with a conditional request
+    and served again on a 304 instead of being downloaded in full.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 0,
+        policies: Mapping[str, float] | None = None,
+        stale_ttl: float = 86400,
+        codec: JsonCodec = DEFAULT_CODEC,
+    ) -> None:
+        """
+        Initialize the ResponseCache with a size bound and TTL policies.
+
+        Args:
+            maxsize (int): Maximum number of responses to hold (default is 1024).
+            ttl (float): TTL in seconds for endpoints without a policy, 0 disables caching
+                them (default is 0).
+            policies (Mapping[str, float], optional): TTL in seconds keyed on endpoint
+                prefix, such as "movie" or "discover/trending". Defaults to
+                DEFAULT_CACHE_POLICIES.
+            stale_ttl (float): Seconds an expired response with validators is kept for
+                revalidation, 0 disables revalidation (default is 86400).
+            codec (JsonCodec): Codec used to copy the responses, defaults to the fastest
+                installed.
+
+        Returns:
+            None
+        """
+        self.ttl = ttl
+        self.codec = codec
+        self.policies = dict(DEFAULT_CACHE_POLICIES if policies is None else policies)
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self._cache: TLRUCache[str, CacheEntry] = TLRUCache(maxsize=maxsize, ttu=self._ttu)
+
+    def _ttu(self, _key: str, entry: CacheEntry, now: float) -> float:
+        """Time at which an entry is dropped, after the stale window if it has validators.
+
+        Args:
+            _key (str): The request key.
+            entry (CacheEntry): The entry.
+            now (float): The current timer value.
+
+        Returns:
+            float: The timer value at which the entry is dropped.
+        """
+        if entry.etag is None and entry.last_modified is None:
+            return now + entry.ttl
+        return now + entry.ttl + self.stale_ttl
+
+    def _entry(
+        self,
+        value: Any,
+        endpoint: str,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry:
+        """Build an entry that goes stale in ttl seconds.
+
+        Args:
+            value (Any): The decoded response body.
+            endpoint (str): The endpoint name of the request.
+            ttl (float): TTL in seconds.
+            etag (str, optional): The ETag of the response. Defaults to None.
+            last_modified (str, optional): The Last-Modified of the response. Defaults to None.
+
+        Returns:
+            CacheEntry: The entry.
+        """
+        return CacheEntry(value, endpoint, ttl, self._cache.timer() + ttl, etag, last_modified)
+
+    def ttl_for(self, method: str, url: URL) -> float:
+        """Get the TTL that applies to a request.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (URL): The URL of the request.
+
+        Returns:
+            float: TTL in seconds, 0 if the request is not cacheable.
+        """
+        if method != hdrs.METH_GET:
+            return 0
+        ttl = match_endpoint(self.policies, endpoint_name(url))
+        return self.ttl if ttl is None else ttl
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached response and count the hit or miss.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+
+        Returns:
+            Any | None: The cached response body, None on a miss.
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.codec.copy(entry.value)
+
+    async def async_get(self, key: str) -> Any | None:
+        """Get a cached response from the event loop and count the hit or miss.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+
+        Returns:
+            Any | None: The cached response body, None on a miss.
+        """
+        return self.get(key)
+
+    def _lookup(self, key: str) -> CacheEntry | None:
+        """Find a live entry.
+
+        Args:
+            key (str): The request key.
+
+        Returns:
+            CacheEntry | None: The entry, None if it is missing or expired.
+        """
+        entry = self._cache.get(key)
+        if entry is None or entry.expires <= self._cache.timer():
+            return None
+        return entry
+
+    def get_stale(self, key: str) -> CacheEntry | None:
+        """Get an expired response that can be revalidated, and count the revalidation.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+
+        Returns:
+            CacheEntry | None: The entry, None if there is no response with validators.
+        """
+        entry = self._find_stale(key)
+        if entry is not None:
+            self.revalidations += 1
+        return entry
+
+    async def async_get_stale(self, key: str) -> CacheEntry | None:
+        """Get an expired response that can be revalidated from the event loop.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+
+        Returns:
+            CacheEntry | None: The entry, None if there is no response with validators.
+        """
+        return self.get_stale(key)
+
+    def _find_stale(self, key: str) -> CacheEntry | None:
+        """Find an entry with validators, expired or not.
+
+        Args:
+            key (str): The request key.
+
+        Returns:
+            CacheEntry | None: The entry, None if there is none.
+        """
+        entry = self._cache.get(key)
+        if entry is None or (entry.etag is None and entry.last_modified is None):
+            return None
+        return entry
+
+    def set(
+        self,
+        key: str,
+        url: URL,
+        value: Any,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+            url (URL): The URL of the request.
+            value (Any): The decoded response body.
+            ttl (float): TTL in seconds.
+            etag (str, optional): The ETag of the response. Defaults to None.
+            last_modified (str, optional): The Last-Modified of the response. Defaults to None.
+
+        Returns:
+            None
+        """
+        if ttl > 0:
+            self._store(key, url, self.codec.copy(value), ttl, etag, last_modified)
+
+    def _store(
+        self,
+        key: str,
+        url: URL,
+        value: Any,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response body owned by the cache, without copying it.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+            url (URL): The URL of the request.
+            value (Any): The decoded response body.
+            ttl (float): TTL in seconds.
+            etag (str, optional): The ETag of the response. Defaults to None.
+            last_modified (str, optional): The Last-Modified of the response. Defaults to None.
+
+        Returns:
+            None
+        """
+        self._cache[key] = self._entry(value, endpoint_name(url), ttl, etag, last_modified)
+
+    def revalidated(self, key: str, url: URL, entry: CacheEntry, ttl: float) -> Any:
+        """Store a stale response again after the server answered 304 Not Modified.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+            url (URL): The URL of the request.
+            entry (CacheEntry): The stale entry, see get_stale.
+            ttl (float): TTL in seconds.
+
+        Returns:
+            Any: A copy of the cached response body.
+        """
+        self.not_modified += 1
+        if ttl > 0:
+            self._store(key, url, entry.value, ttl, entry.etag, entry.last_modified)
+        return self.codec.copy(entry.value)
+
+    def invalidate(self, endpoint: str | None = None) -> int:
+        """Remove cached responses.
+
+        Args:
+            endpoint (str, optional): Endpoint prefix to remove, such as "movie" or
+                "tv/{id}". Removes everything if None.
+
+        Returns:
+            int: The number of responses removed.
+        """
+        if endpoint is None:
+            count = len(self._cache)
+            self._cache.clear()
+            return count
+
+        keys = [
+            key
+            for key, entry in list(self._cache.items())
+            if match_endpoint({endpoint: True}, entry.endpoint)
+        ]
+        for key in keys:
+            self._cache.pop(key, None)
+        return len(keys)
+
+    def invalidate_url(self, url: URL) -> int:
+        """Remove the cached responses of a URL, whatever their query.
+
+        Args:
+            url (URL): The URL to remove.
+
+        Returns:
+            int: The number of responses removed.
+        """
+        prefix = f"{url.with_query(None)}"
+        keys = [key for key in list(self._cache) if key.split(" ", 1)[1].split("?")[0] == prefix]
+        for key in keys:
+            self._cache.pop(key, None)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the counters.
+
+        Returns:
+            None
+        """
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of the cache.
+
+        Returns:
+            CacheStats: Hits, misses, revalidations and size of the cache.
+        """
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            revalidations=self.revalidations,
+            not_modified=self.not_modified,
+            currsize=len(self._cache),
+            maxsize=int(self._cache.maxsize),
+        )
+
+
+class SqliteResponseCache(ResponseCache):
+    """
+    Response cache that keeps its responses in a SQLite file as well as in memory.
+
+    Responses are written through to the file and served from memory. On start the
+    most recent live responses are loaded back into memory, and a miss in memory falls
+    back to the file, so a restarted worker does not refetch every movie and show.
+
+    The file is only touched from a single worker thread, so the event loop never waits
+    on SQLite. Writes, evictions and invalidations are queued to it without waiting, and
+    the reads of async_get and async_get_stale are queued behind them, so a read never
+    sees a response that was already replaced or invalidated. The sync get and get_stale
+    wait for the worker, they are meant for code outside the event loop.
+
+    The file holds at most max_entries responses. Once it is over, dead responses and
+    then the oldest are removed in one batch, down to evict_ratio of max_entries, so the
+    cost of eviction is spread over the writes in between.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        maxsize: int = 1024,
+        ttl: float = 0,
+        policies: Mapping[str, float] | None = None,
+        stale_ttl: float = 86400,
+        max_entries: int = 100_000,
+        warm_start: bool = True,
+        codec: JsonCodec = DEFAULT_CODEC,
+        evict_ratio: float = 0.9,
+    ) -> None:
+        """
+        Initialize the SqliteResponseCache, creating the file if needed.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the SQLite file.
+            maxsize (int): Maximum number of responses held in memory (default is 1024).
+            ttl (float): TTL in seconds for endpoints without a policy, 0 disables caching
+                them (default is 0).
+            policies (Mapping[str, float], optional): TTL in seconds keyed on endpoint
+                prefix. Defaults to DEFAULT_CACHE_POLICIES.
+            stale_ttl (float): Seconds an expired response with validators is kept for
+                revalidation, 0 disables revalidation (default is 86400).
+            max_entries (int): Maximum number of responses kept in the file
+                (default is 100000).
+            warm_start (bool): Load the live responses of the file into memory
+                (default is True).
+            codec (JsonCodec): Codec used to store the responses, defaults to the fastest
+                installed.
+            evict_ratio (float): Share of max_entries left in the file after an eviction
+                (default is 0.9).
+
+        Returns:
+            None
+        """
+        super().__init__(
+            maxsize=maxsize, ttl=ttl, policies=policies, stale_ttl=stale_ttl, codec=codec
+        )
+        self.max_entries = max_entries
+        self._keep = min(max_entries, max(0, int(max_entries * evict_ratio)))
+        self._count = 0
+        self._generation = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asyncpow-sqlite")
+        self._db: sqlite3.Connection
+        self._executor.submit(self._open, path).result()
+        if warm_start:
+            self.load()
+
+    def _open(self, path: str | os.PathLike[str]) -> None:
+        """Open the file and count its responses, on the worker thread.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the SQLite file.
+
+        Returns:
+            None
+        """
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, value BLOB NOT NULL, "
+            "stored_at REAL NOT NULL, expires_at REAL NOT NULL, etag TEXT, last_modified TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_stored ON responses (stored_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires_at)")
+        (self._count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+
+    def _submit(self, func: Callable[..., T], *args: Any) -> Future[T]:
+        """Queue a call on the worker thread that owns the file.
+
+        Args:
+            func (Callable[..., T]): The call.
+            *args (Any): Its arguments.
+
+        Returns:
+            Future[T]: The result of the call.
+        """
+        return self._executor.submit(func, *args)
+
+    def load(self) -> int:
+        """Load the most recent live responses of the file into memory.
+
+        Returns:
+            int: The number of responses loaded.
+        """
+        now = time.time()
+        rows = self._submit(self._read_recent, now, int(self._cache.maxsize)).result()
+        # Oldest first, so the most recent responses are the last to be evicted
+        for key, *row in reversed(rows):
+            self._cache[key] = self._row_entry(now, *row)
+        return len(rows)
+
+    def _read_recent(self, now: float, limit: int) -> list[tuple]:
+        """Read the most recent live rows, on the worker thread.
+
+        Args:
+            now (float): The current wall clock time.
+            limit (int): Maximum number of rows.
+
+        Returns:
+            list[tuple]: The rows, most recent first, with decoded values.
+        """
+        rows = self._db.execute(
+            "SELECT key, endpoint, value, expires_at, etag, last_modified FROM responses "
+            "WHERE expires_at > ? ORDER BY stored_at DESC LIMIT ?",
+            (now, limit),
+        ).fetchall()
+        return [(key, name, self.codec.loads(value), *rest) for key, name, value, *rest in rows]
+
+    def _row_entry(
+        self,
+        now: float,
+        endpoint: str,
+        value: Any,
+        expires_at: float,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> CacheEntry:
+        """Build the entry of a row of the file.
+
+        Args:
+            now (float): The current wall clock time.
+            endpoint (str): The endpoint name of the request.
+            value (Any): The decoded response body.
+            expires_at (float): Wall clock time at which the response goes stale.
+            etag (str | None): The ETag of the response.
+            last_modified (str | None): The Last-Modified of the response.
+
+        Returns:
+            CacheEntry: The entry.
+        """
+        return self._entry(value, endpoint, expires_at - now, etag, last_modified)
+
+    def _read(self, key: str, now: float, stale: bool) -> tuple | None:
+        """Read the row of a key, on the worker thread.
+
+        Args:
+            key (str): The request key.
+            now (float): The current wall clock time.
+            stale (bool): Read a row with validators within its stale window instead of
+                a live row.
+
+        Returns:
+            tuple | None: The row with its value decoded, None if there is none.
+        """
+        if stale:
+            row = self._db.execute(
+                "SELECT endpoint, value, expires_at, etag, last_modified FROM responses "
+                "WHERE key = ? AND (etag IS NOT NULL OR last_modified IS NOT NULL) "
+                "AND expires_at + ? > ?",
+                (key, self.stale_ttl, now),
+            ).fetchone()
+        else:
+            row = self._db.execute(
+                "SELECT endpoint, value, expires_at, etag, last_modified FROM responses "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        if row is None:
+            return None
+        endpoint, value, *rest = row
+        return (endpoint, self.codec.loads(value), *rest)
+
+    def _live_entry(
+        self, key: str, now: float, row: tuple | None, generation: int
+    ) -> CacheEntry | None:
+        """Keep a live row of the file in memory.
+
+        The row is not kept if the key was stored, or anything invalidated, while it was
+        read, as it may be older than the file by then.
+
+        Args:
+            key (str): The request key.
+            now (float): The wall clock time the row was read at.
+            row (tuple | None): The row, see _read.
+            generation (int): The invalidation generation the read started in.
+
+        Returns:
+            CacheEntry | None: The entry, None if there was no row.
+        """
+        if row is None:
+            return None
+        entry = self._row_entry(now, *row)
+        if generation == self._generation and key not in self._cache:
+            self._cache[key] = entry
+        return entry
+
+    def _lookup(self, key: str) -> CacheEntry | None:
+        """Find a live entry in memory, then in the file, waiting for the worker.
+
+        Args:
+            key (str): The request key.
+
+        Returns:
+            CacheEntry | None: The entry, None if it is missing or expired.
+        """
+        entry = super()._lookup(key)
+        if entry is not None:
+            return entry
+        now, generation = time.time(), self._generation
+        row = self._submit(self._read, key, now, False).result()
+        return self._live_entry(key, now, row, generation)
+
+    async def async_get(self, key: str) -> Any | None:
+        """Get a cached response, reading the file on the worker thread on a memory miss.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+
+        Returns:
+            Any | None: The cached response body, None on a miss.
+        """
+        entry = super()._lookup(key)
+        if entry is None:
+            now, generation = time.time(), self._generation
+            row = await asyncio.wrap_future(self._submit(self._read, key, now, False))
+            entry = self._live_entry(key, now, row, generation)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.codec.copy(entry.value)
+
+    def _find_stale(self, key: str) -> CacheEntry | None:
+        """Find an entry with validators in memory, then in the file, waiting for the worker.
+
+        Args:
+            key (str): The request key.
+
+        Returns:
+            CacheEntry | None: The entry, None if there is none.
+        """
+        entry = super()._find_stale(key)
+        if entry is not None:
+            return entry
+        now = time.time()
+        row = self._submit(self._read, key, now, True).result()
+        return None if row is None else self._row_entry(now, *row)
+
+    async def async_get_stale(self, key: str) -> CacheEntry | None:
+        """Get an expired response that can be revalidated, reading the file on the worker.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+
+        Returns:
+            CacheEntry | None: The entry, None if there is no response with validators.
+        """
+        entry = super()._find_stale(key)
+        if entry is None:
+            now = time.time()
+            row = await asyncio.wrap_future(self._submit(self._read, key, now, True))
+            entry = None if row is None else self._row_entry(now, *row)
+        if entry is not None:
+            self.revalidations += 1
+        return entry
+
+    def _store(
+        self,
+        key: str,
+        url: URL,
+        value: Any,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response in memory, and queue its write to the file.
+
+        Args:
+            key (str): The request key, see endpoint.request_key.
+            url (URL): The URL of the request.
+            value (Any): The decoded response body, owned by the cache.
+            ttl (float): TTL in seconds.
+            etag (str, optional): The ETag of the response. Defaults to None.
+            last_modified (str, optional): The Last-Modified of the response. Defaults to None.
+
+        Returns:
+            None
+        """
+        super()._store(key, url, value, ttl, etag, last_modified)
+        now = time.time()
+        row = (key, endpoint_name(url), value, now, now + ttl, etag, last_modified)
+        self._submit(self._write, row)
+
+    def _write(self, row: tuple) -> None:
+        """Write a response to the file, then evict if it is over max_entries.
+
+        Runs on the worker thread.
+
+        Args:
+            row (tuple): Key, endpoint, decoded body, stored_at, expires_at, ETag and
+                Last-Modified of the response.
+
+        Returns:
+            None
+        """
+        key, endpoint, value, stored_at, *rest = row
+        exists = self._db.execute("SELECT 1 FROM responses WHERE key = ?", (key,)).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, endpoint, self.codec.dumps(value), stored_at, *rest),
+        )
+        if exists is None:
+            self._count += 1
+        if self._count > self.max_entries:
+            self._evict(stored_at)
+
+    def _evict(self, now: float) -> None:
+        """Remove dead responses, then the oldest, down to evict_ratio of max_entries.
+
+        A response is dead once it has expired, or once its stale window has passed if it
+        has validators. Runs on the worker thread.
+
+        Args:
+            now (float): The current wall clock time.
+
+        Returns:
+            None
+        """
+        self._count -= self._db.execute(
+            "DELETE FROM responses WHERE expires_at <= ? AND "
+            "((etag IS NULL AND last_modified IS NULL) OR expires_at <= ?)",
+            (now, now - self.stale_ttl),
+        ).rowcount
+        if self._count > self._keep:
+            self._count -= self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY stored_at LIMIT ?)",
+                (self._count - self._keep,),
+            ).rowcount
+
+    def _delete(self, keys: list[str]) -> None:
+        """Remove responses from the file, on the worker thread.
+
+        Args:
+            keys (list[str]): The request keys to remove.
+
+        Returns:
+            None
+        """
+        for key in keys:
+            self._count -= self._db.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+
+    def _delete_all(self) -> None:
+        """Remove every response from the file, on the worker thread.
+
+        Returns:
+            None
+        """
+        self._db.execute("DELETE FROM responses")
+        self._count = 0
+
+    def _delete_endpoint(self, endpoint: str) -> None:
+        """Remove the responses of an endpoint prefix from the file, on the worker thread.
+
+        Args:
+            endpoint (str): Endpoint prefix, such as "movie" or "tv/{id}".
+
+        Returns:
+            None
+        """
+        self._delete(
+            [
+                key
+                for key, name in self._db.execute("SELECT key, endpoint FROM responses")
+                if match_endpoint({endpoint: True}, name)
+            ]
+        )
+
+    def _delete_url(self, url: URL) -> None:
+        """Remove the responses of a URL from the file, whatever their query.
+
+        Runs on the worker thread.
+
+        Args:
+            url (URL): The URL to remove.
+
+        Returns:
+            None
+        """
+        prefix = f"{url.with_query(None)}"
+        self._delete(
+            [
+                key
+                for (key,) in self._db.execute(
+                    "SELECT key FROM responses WHERE endpoint = ?", (endpoint_name(url),)
+                )
+                if key.split(" ", 1)[1].split("?")[0] == prefix
+            ]
+        )
+
+    def invalidate(self, endpoint: str | None = None) -> int:
+        """Remove cached responses from memory, and queue their removal from the file.
+
+        Args:
+            endpoint (str, optional): Endpoint prefix to remove, such as "movie" or
+                "tv/{id}". Removes everything if None.
+
+        Returns:
+            int: The number of responses removed from memory.
+        """
+        count = super().invalidate(endpoint)
+        self._generation += 1
+        if endpoint is None:
+            self._submit(self._delete_all)
+        else:
+            self._submit(self._delete_endpoint, endpoint)
+        return count
+
+    def invalidate_url(self, url: URL) -> int:
+        """Remove the cached responses of a URL, whatever their query.
+
+        Their removal from the file is queued.
+
+        Args:
+            url (URL): The URL to remove.
+
+        Returns:
+            int: The number of responses removed from memory.
+        """
+        count = super().invalidate_url(url)
+        self._generation += 1
+        self._submit(self._delete_url, url)
+        return count
+
+    def clear(self) -> None:
+        """Remove all cached responses, in memory and in the file, and reset the counters.
+
+        Returns:
+            None
+        """
+        super().clear()
+        self._generation += 1
+        self._submit(self._delete_all)
+
+    def flush(self) -> None:
+        """Wait for the queued writes to reach the file.
+
+        Returns:
+            None
+        """
+        self._submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Finish the queued writes and close the SQLite file.
+
+        Returns:
+            None
+        """
+        self._submit(self._db.close)
+        self._executor.shutdown(wait=True)
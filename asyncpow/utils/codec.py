@@ -0,0 +1,203 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import json
+from typing import Any, Literal
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+CodecName = Literal["orjson", "msgspec", "json"]
+
+
+class JsonCodec:
+    """
+    JSON codec backed by the standard library.
+
+    The faster codecs below share this interface, use get_codec to pick the fastest
+    one installed.
+    """
+
+    name: CodecName = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data (bytes | str): The JSON document.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as a compact JSON document.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def dumps_str(self, value: Any) -> str:
+        """Encode a value as a JSON string, as expected by aiohttp's json_serialize.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            str: The JSON document.
+        """
+        return self.dumps(value).decode()
+
+    def copy(self, value: Any) -> Any:
+        """Copy a decoded value, so changes to the copy do not affect the original.
+
+        Re-encoding is much faster than copy.deepcopy with the faster codecs.
+
+        Args:
+            value (Any): A value decoded from JSON, or the text of a response.
+
+        Returns:
+            Any: An independent copy, or the value itself if it is immutable.
+        """
+        if isinstance(value, (dict, list)):
+            return self.loads(self.dumps(value))
+        return value
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name: CodecName = "orjson"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data (bytes | str): The JSON document.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as a compact JSON document.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        return orjson.dumps(value)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec."""
+
+    name: CodecName = "msgspec"
+
+    def __init__(self) -> None:
+        """
+        Initialize the codec with reusable msgspec encoder and decoder instances.
+
+        Returns:
+            None
+        """
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data (bytes | str): The JSON document.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return self._decoder.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as a compact JSON document.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        return self._encoder.encode(value)
+
+
+def available_codecs() -> list[CodecName]:
+    """List the codecs that can be used, fastest first.
+
+    Returns:
+        list[CodecName]: Names of the installed codecs.
+    """
+    names: list[CodecName] = []
+    if orjson is not None:
+        names.append("orjson")
+    if msgspec is not None:
+        names.append("msgspec")
+    names.append("json")
+    return names
+
+
+def get_codec(name: CodecName | None = None) -> JsonCodec:
+    """Get a JSON codec by name, or the fastest one installed.
+
+    Args:
+        name (CodecName, optional): "orjson", "msgspec" or "json". Defaults to None, the
+            fastest installed codec.
+
+    Raises:
+        ValueError: If the requested codec is not installed.
+
+    Returns:
+        JsonCodec: The codec.
+    """
+    if name is None:
+        name = available_codecs()[0]
+    if name not in available_codecs():
+        raise ValueError(f"JSON codec {name} is not installed")
+    if name == "orjson":
+        return OrjsonCodec()
+    if name == "msgspec":
+        return MsgspecCodec()
+    return JsonCodec()
+
+
+DEFAULT_CODEC = get_codec()
@@ -0,0 +1,63 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable
+
+
+async def gather_bounded(
+    funcs: Iterable[Callable[[], Awaitable[Any]]],
+    limit: int,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Run awaitables with at most limit of them in flight, keeping results in order.
+
+    Args:
+        funcs (Iterable[Callable[[], Awaitable[Any]]]): Factories of the awaitables to run,
+            an awaitable is only created once a slot is free.
+        limit (int): The maximum number of awaitables in flight.
+        return_exceptions (bool): Return exceptions in place of results instead of
+            raising the first one (default is False).
+
+    Raises:
+        ValueError: If limit is lower than 1.
+
+    Returns:
+        list[Any]: The results, in the order of funcs.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func once a slot is free."""
+        async with semaphore:
+            return await func()
+
+    tasks = [asyncio.ensure_future(run(func)) for func in funcs]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
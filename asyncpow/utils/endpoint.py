@@ -0,0 +1,80 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from typing import Mapping, TypeVar
+
+from yarl import URL
+
+from asyncpow.const import API_URI
+
+T = TypeVar("T")
+
+
+def endpoint_name(url: URL) -> str:
+    """Get the endpoint of an API URL, with IDs in the path replaced by {id}
+
+    Args:
+        url (URL): The URL of the request, e.g. https://host/api/v1/movie/603
+
+    Returns:
+        str: The endpoint, e.g. movie/{id}
+    """
+    _, sep, path = url.path.partition(f"/{API_URI}/")
+    if not sep:
+        path = url.path
+    return "/".join("{id}" if part.isdigit() else part for part in path.split("/") if part)
+
+
+def match_endpoint(options: Mapping[str, T], endpoint: str) -> T | None:
+    """Find the option with the longest endpoint prefix matching an endpoint
+
+    Prefixes match on whole path segments, "movie" matches "movie/{id}" but not
+    "movies".
+
+    Args:
+        options (Mapping[str, T]): Options keyed on endpoint prefix.
+        endpoint (str): The endpoint, as returned by endpoint_name.
+
+    Returns:
+        T | None: The matching option, None if there is no match.
+    """
+    while endpoint:
+        if endpoint in options:
+            return options[endpoint]
+        endpoint = endpoint.rpartition("/")[0]
+    return None
+
+
+def request_key(method: str, url: URL, params: Mapping[str, str] | None = None) -> str:
+    """Build the key identifying identical requests
+
+    Args:
+        method (str): The HTTP method of the request.
+        url (URL): The URL of the request.
+        params (Mapping[str, str], optional): Query parameters of the request.
+
+    Returns:
+        str: The request key, e.g. GET https://host/api/v1/movie/603?language=en
+    """
+    if params:
+        url = url.update_query(params)
+    return f"{method} {url}"
@@ -21,17 +21,40 @@
 
 
 import asyncio
-import json
-from typing import Any, Mapping, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import time
+from typing import Any, AsyncGenerator, Generator, Mapping, Optional
 
-from aiohttp import ClientError, ClientSession, hdrs
+from aiohttp import ClientError, ClientResponse, ClientSession, hdrs
 import backoff
+from backoff.types import Details
 from yarl import URL
 
-from asyncpow.exceptions import POWConnectionException, POWException, POWTimeoutException
+from asyncpow.exceptions import (
+    POWConnectionException,
+    POWException,
+    POWRateLimitException,
+    POWTimeoutException,
+)
+from asyncpow.utils.breaker import CircuitBreaker, probing
+from asyncpow.utils.cache import ResponseCache
+from asyncpow.utils.codec import DEFAULT_CODEC, JsonCodec
+from asyncpow.utils.endpoint import request_key
+from asyncpow.utils.metrics import Metrics
+from asyncpow.utils.ratelimit import RateLimiter
+from asyncpow.utils.singleflight import SingleFlight
+from asyncpow.utils.stream import ResultsParser
+from asyncpow.utils.timeouts import TimeoutConfig, budget, remaining
+
+THROTTLE_STATUSES = (429, 503)
+# Longest Retry-After honoured, a throttled request asking for more is not retried
+MAX_RETRY_AFTER = 60.0
+VALIDATOR_HEADERS = (hdrs.ETAG, hdrs.LAST_MODIFIED)
+# Returned instead of a body when a conditional request is answered with 304
+NOT_MODIFIED: Any = object()
 
 
-@backoff.on_exception(backoff.expo, POWConnectionException, max_tries=5, logger=None)
 async def request(
     session: ClientSession,
     url: URL,
@@ -41,8 +64,21 @@ async def request(
     json_data: dict[str, Any] | None = None,
     params: Mapping[str, str] | None = None,
     headers: Optional[dict] = None,
+    cache: ResponseCache | None = None,
+    singleflight: SingleFlight | None = None,
+    rate_limiter: RateLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    timeouts: TimeoutConfig | None = None,
+    codec: JsonCodec = DEFAULT_CODEC,
+    metrics: Metrics | None = None,
 ) -> Any:
-    """Make an HTTP request with backoff and retry logic.
+    """Make an HTTP request, served from the cache when possible.
+
+    Identical GET requests that are in flight at the same time are coalesced into a
+    single upstream request when a SingleFlight is provided. An expired cached response
+    with an ETag or Last-Modified is revalidated with a conditional request, and served
+    again when the server answers 304 Not Modified. The health probe of a circuit breaker
+    bypasses both.
 
 
     Args:
@@ -54,48 +90,643 @@ async def request(
         json_data (dict[str, Any] | None, optional): JSON data to include in the request. Defaults to None.
         params (Mapping[str, str] | None, optional): parameters required for the request. Defaults to None.
         headers (Optional[dict], optional): headers required for the request. Defaults to None.
+        cache (ResponseCache | None, optional): cache for GET responses. Defaults to None.
+        singleflight (SingleFlight | None, optional): coalesces identical GET requests.
+            Defaults to None.
+        rate_limiter (RateLimiter | None, optional): limits the rate of requests sent.
+            Defaults to None.
+        circuit_breaker (CircuitBreaker | None, optional): fails fast while the instance is
+            unhealthy. Defaults to None.
+        timeouts (TimeoutConfig | None, optional): timeouts per attempt, overrides
+            request_timeout. Defaults to None.
+        codec (JsonCodec, optional): encodes json_data and decodes responses. Defaults to
+            the fastest codec installed.
+        metrics (Metrics | None, optional): records every attempt and retry. Defaults to
+            None.
 
     Raises:
-        POWTimeoutException: Request timeout error
+        POWTimeoutException: Request timeout error or deadline exceeded
         POWConnectionException: Connection issue error
+        POWRateLimitException: Still throttled after retrying
+        POWCircuitOpenException: Circuit open, request not sent
         POWException: Generic exception
 
     Returns:
         Any: Response in JSON or text
     """
     if params:
-        for key, value in params.items():
-            if isinstance(value, bool):
-                params[key] = str(value).lower()
+        params = {
+            key: str(value).lower() if isinstance(value, bool) else value
+            for key, value in params.items()
+        }
+
+    async def send(
+        request_headers: Optional[dict] = headers, validators: dict[str, str] | None = None
+    ) -> Any:
+        """Send the request through the retry, rate limit and circuit breaker layers."""
+        return await _request(
+            session,
+            url,
+            method,
+            request_timeout,
+            data,
+            json_data,
+            params,
+            request_headers,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            timeouts=timeouts,
+            codec=codec,
+            validators=validators,
+            metrics=metrics,
+        )
+
+    if probing():
+        # The probe must reach the instance, and must not join a shared request that is
+        # itself waiting for the probe
+        return await send()
+
+    ttl = cache.ttl_for(method, url) if cache is not None else 0
+    coalesce = singleflight is not None and method == hdrs.METH_GET
+    if ttl <= 0 and not coalesce:
+        return await send()
+
+    key = request_key(method, url, params)
+    if cache is not None and ttl > 0:
+        cached = await cache.async_get(key)
+        if cached is not None:
+            return cached
+
+    async def fetch() -> Any:
+        """Send the request, revalidating a stale response, and store it in the cache."""
+        if cache is None or ttl <= 0:
+            return await send()
+
+        stale = await cache.async_get_stale(key)
+        request_headers = {**(headers or {}), **stale.conditional_headers} if stale else headers
+        validators: dict[str, str] = {}
+        response = await send(request_headers, validators)
+        if response is NOT_MODIFIED and stale is not None:
+            return cache.revalidated(key, url, stale, ttl)
+        etag, last_modified = (validators.get(name) for name in VALIDATOR_HEADERS)
+        cache.set(key, url, response, ttl, etag, last_modified)
+        return response
+
+    if singleflight is not None and coalesce:
+        try:
+            # A caller joining a shared request still gives up at its own deadline
+            async with asyncio.timeout(budget(None)):
+                return await singleflight.do(key, fetch, copy=codec.copy)
+        except asyncio.TimeoutError as exception:
+            msg = "Deadline exceeded while waiting for a shared request."
+            raise POWTimeoutException(msg) from exception
+    return await fetch()
+
+
+def _deadline_exceeded() -> bool:
+    """Check if the deadline of the current call has passed.
+
+    Returns:
+        bool: True if there is a deadline and no time is left.
+    """
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def _expo_within_deadline() -> Generator[float, Any, None]:
+    """Exponential backoff waits, cut to the time left before the deadline of the call.
+
+    Yields:
+        float: Seconds to wait before the next attempt.
+    """
+    for wait in backoff.expo():
+        left = remaining()
+        # The first value of a backoff generator is None, it only starts the generator
+        yield wait if wait is None or left is None else max(0.0, min(wait, left))
+
+
+def _giveup_throttled(exception: Exception) -> bool:
+    """Check if a throttled request should not be retried.
+
+    Args:
+        exception (Exception): The POWRateLimitException raised by the request.
+
+    Returns:
+        bool: True when probing, or when Retry-After is too long or past the deadline.
+    """
+    retry_after = 0.0
+    if isinstance(exception, POWRateLimitException):
+        retry_after = exception.retry_after or 0.0
+    left = remaining()
+    return probing() or retry_after > MAX_RETRY_AFTER or (left is not None and retry_after >= left)
+
+
+def _record_retry(details: Details) -> None:
+    """Count a retry in the metrics of the request, if any.
+
+    Args:
+        details (Details): The backoff details of the failed attempt.
+
+    Returns:
+        None
+    """
+    metrics = details["kwargs"].get("metrics")
+    if metrics is not None:
+        metrics.record_retry(details["args"][1])
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header, given either in seconds or as an HTTP date.
+
+    Args:
+        value (str | None): The header value.
+
+    Returns:
+        float | None: Seconds to wait, None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Retry throttled requests after the Retry-After delay
+_retry_throttled = backoff.on_exception(
+    backoff.runtime,
+    POWRateLimitException,
+    value=lambda exception: exception.retry_after or 1.0,
+    giveup=_giveup_throttled,
+    max_tries=4,
+    jitter=None,
+    on_backoff=_record_retry,
+    logger=None,
+)
+# Retry connection errors with exponential backoff
+_retry_connection = backoff.on_exception(
+    _expo_within_deadline,
+    POWConnectionException,
+    max_tries=5,
+    giveup=lambda exception: probing() or _deadline_exceeded(),
+    on_backoff=_record_retry,
+    logger=None,
+)
+
+
+@_retry_throttled
+@_retry_connection
+async def _request(
+    session: ClientSession,
+    url: URL,
+    method: str = hdrs.METH_GET,
+    request_timeout: int = 10,
+    data: Any | None = None,
+    json_data: dict[str, Any] | None = None,
+    params: Mapping[str, str] | None = None,
+    headers: Optional[dict] = None,
+    rate_limiter: RateLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    timeouts: TimeoutConfig | None = None,
+    codec: JsonCodec = DEFAULT_CODEC,
+    validators: dict[str, str] | None = None,
+    metrics: Metrics | None = None,
+) -> Any:
+    """Make an HTTP request with backoff and retry logic.
+
+    Throttled requests (429 or 503) are retried after the Retry-After delay. Every
+    attempt goes through the rate limiter and circuit breaker, so retries stop as soon
+    as the circuit opens. Attempts and retries share the deadline of the current call.
+
+
+    Args:
+        session (ClientSession): The aiohttp ClientSession to use for the request
+        url (URL): The URL to sent the request to
+        method (str, optional): The HTTP method to use fir the request. Defaults to hdrs.METH_GET.
+        request_timeout (int, optional): Timeout for the request in seconds. Defaults to 10.
+        data (Any | None, optional): data to include in the request. Defaults to None.
+        json_data (dict[str, Any] | None, optional): JSON data to include in the request. Defaults to None.
+        params (Mapping[str, str] | None, optional): parameters required for the request. Defaults to None.
+        headers (Optional[dict], optional): headers required for the request. Defaults to None.
+        rate_limiter (RateLimiter | None, optional): limits the rate of requests sent.
+            Defaults to None.
+        circuit_breaker (CircuitBreaker | None, optional): fails fast while the instance is
+            unhealthy. Defaults to None.
+        timeouts (TimeoutConfig | None, optional): timeouts per attempt, overrides
+            request_timeout. Defaults to None.
+        codec (JsonCodec, optional): encodes json_data and decodes responses. Defaults to
+            the fastest codec installed.
+        validators (dict[str, str] | None, optional): filled with the ETag and
+            Last-Modified of the response. Defaults to None.
+        metrics (Metrics | None, optional): records every attempt and retry. Defaults to
+            None.
+
+    Raises:
+        POWTimeoutException: Request timeout error or deadline exceeded
+        POWConnectionException: Connection issue error
+        POWRateLimitException: Request throttled by the server
+        POWCircuitOpenException: Circuit open, request not sent
+        POWException: Generic exception
+
+    Returns:
+        Any: Response in JSON or text, NOT_MODIFIED if a conditional request was answered
+        with 304
+    """
+    if timeouts is None:
+        timeouts = TimeoutConfig(total=request_timeout)
+    else:
+        timeouts = timeouts.for_url(url)
+
+    if json_data is not None:
+        data = codec.dumps(json_data)
+        headers = {**(headers or {}), hdrs.CONTENT_TYPE: "application/json"}
+
+    await _acquire(url, rate_limiter, circuit_breaker)
 
     try:
-        async with asyncio.timeout(request_timeout):
+        response = await _send(
+            session, url, method, timeouts, data, params, headers, codec, validators, metrics
+        )
+    except POWException as exception:
+        if rate_limiter is not None and isinstance(exception, POWRateLimitException):
+            rate_limiter.throttle(url, exception.retry_after)
+        if circuit_breaker is not None:
+            circuit_breaker.record_failure(exception)
+        raise
+    except BaseException:
+        if circuit_breaker is not None:
+            circuit_breaker.release()
+        raise
+
+    if rate_limiter is not None:
+        rate_limiter.success(url)
+    if circuit_breaker is not None:
+        circuit_breaker.record_success()
+    return response
+
+
+async def _acquire(
+    url: URL, rate_limiter: RateLimiter | None, circuit_breaker: CircuitBreaker | None
+) -> None:
+    """Wait until the circuit breaker and the rate limiter let a request through.
+
+    Args:
+        url (URL): The URL of the request.
+        rate_limiter (RateLimiter | None): limits the rate of requests sent.
+        circuit_breaker (CircuitBreaker | None): fails fast while the instance is unhealthy.
+
+    Raises:
+        POWTimeoutException: Deadline exceeded while waiting for the rate limiter
+        POWCircuitOpenException: Circuit open, request not sent
+
+    Returns:
+        None
+    """
+    if circuit_breaker is not None:
+        await circuit_breaker.before_request()
+    if rate_limiter is None:
+        return
+    try:
+        async with asyncio.timeout(budget(None)):
+            await rate_limiter.acquire(url)
+    except BaseException as exception:
+        # The request is not sent, so it tells nothing about the health of the instance
+        if circuit_breaker is not None:
+            circuit_breaker.release()
+        if isinstance(exception, asyncio.TimeoutError):
+            msg = "Deadline exceeded while waiting for the rate limiter."
+            raise POWTimeoutException(msg) from exception
+        raise
+
+
+async def _send(
+    session: ClientSession,
+    url: URL,
+    method: str,
+    timeouts: TimeoutConfig,
+    data: Any | None,
+    params: Mapping[str, str] | None,
+    headers: Optional[dict],
+    codec: JsonCodec,
+    validators: dict[str, str] | None = None,
+    metrics: Metrics | None = None,
+) -> Any:
+    """Send a single HTTP request and decode the response.
+
+    Args:
+        session (ClientSession): The aiohttp ClientSession to use for the request
+        url (URL): The URL to sent the request to
+        method (str): The HTTP method to use for the request.
+        timeouts (TimeoutConfig): Timeouts of the request, the total is clamped to the
+            deadline of the current call.
+        data (Any | None): data to include in the request.
+        params (Mapping[str, str] | None): parameters required for the request.
+        headers (Optional[dict]): headers required for the request.
+        codec (JsonCodec): decodes the response.
+        validators (dict[str, str] | None, optional): filled with the ETag and
+            Last-Modified of the response. Defaults to None.
+        metrics (Metrics | None, optional): records the attempt. Defaults to None.
+
+    Raises:
+        POWTimeoutException: Request timeout error
+        POWConnectionException: Connection issue error
+        POWRateLimitException: Request throttled by the server
+        POWException: Generic exception
+
+    Returns:
+        Any: Response in JSON or text, or NOT_MODIFIED
+    """
+    started = time.perf_counter() if metrics is not None else 0.0
+    response: ClientResponse | None = None
+    error = None
+    try:
+        async with asyncio.timeout(budget(timeouts.total)):
             response = await session.request(
                 method,
                 url,
                 data=data,
-                json=json_data,
                 params=params,
                 headers=headers,
+                timeout=timeouts.client_timeout(),
             )
+            return await _read(response, codec, validators)
     except asyncio.TimeoutError as exception:
+        error = "timeout"
         msg = "Timeout occurred while connecting to Overseerr instance."
         raise POWTimeoutException(msg) from exception
     except ClientError as exception:
+        error = "connection"
         msg = "Error occurred while communicating with Overseerr."
         raise POWConnectionException(msg) from exception
+    finally:
+        if metrics is not None:
+            metrics.record_request(
+                url,
+                method,
+                time.perf_counter() - started,
+                status=None if response is None else response.status,
+                error=error,
+                bytes_in=0 if response is None else response.content.total_bytes,
+                bytes_out=len(data) if isinstance(data, (bytes, str)) else 0,
+            )
+
 
+async def stream(
+    session: ClientSession,
+    url: URL,
+    params: Mapping[str, str] | None = None,
+    headers: Optional[dict] = None,
+    key: str = "results",
+    envelope: dict[str, Any] | None = None,
+    request_timeout: int = 10,
+    rate_limiter: RateLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    timeouts: TimeoutConfig | None = None,
+    codec: JsonCodec = DEFAULT_CODEC,
+    metrics: Metrics | None = None,
+) -> AsyncGenerator[Any, None]:
+    """Make a GET request and yield the items of an array in the response as they arrive.
+
+    The body is parsed as it is received instead of being read whole, so the first items
+    are available before the download finishes and memory does not grow with the size of
+    the array. Streamed responses bypass the cache and are never coalesced. Sending the
+    request is retried like any other, but once the first chunk of the body has been
+    received a failure is raised to the caller. The total timeout bounds receiving the
+    response headers, sock_read or else total bounds each read of the body.
+
+    Args:
+        session (ClientSession): The aiohttp ClientSession to use for the request
+        url (URL): The URL to sent the request to
+        params (Mapping[str, str] | None, optional): parameters required for the request. Defaults to None.
+        headers (Optional[dict], optional): headers required for the request. Defaults to None.
+        key (str, optional): Member of the response holding the array. Defaults to "results".
+        envelope (dict[str, Any] | None, optional): filled with the other members of the
+            response, such as pageInfo, once it has been read. Defaults to None.
+        request_timeout (int, optional): Timeout in seconds. Defaults to 10.
+        rate_limiter (RateLimiter | None, optional): limits the rate of requests sent.
+            Defaults to None.
+        circuit_breaker (CircuitBreaker | None, optional): fails fast while the instance is
+            unhealthy. Defaults to None.
+        timeouts (TimeoutConfig | None, optional): timeouts of the request, overrides
+            request_timeout. Defaults to None.
+        codec (JsonCodec, optional): decodes error responses. Defaults to the fastest codec
+            installed.
+        metrics (Metrics | None, optional): records the request and retries. Defaults to
+            None.
+
+    Raises:
+        POWTimeoutException: Request timeout error or deadline exceeded
+        POWConnectionException: Connection issue error
+        POWRateLimitException: Still throttled after retrying
+        POWCircuitOpenException: Circuit open, request not sent
+        POWException: Generic exception, or a response that is not a JSON object
+
+    Yields:
+        Any: The decoded items of the array.
+    """
+    if params:
+        params = {
+            name: str(value).lower() if isinstance(value, bool) else value
+            for name, value in params.items()
+        }
+    if timeouts is None:
+        timeouts = TimeoutConfig(total=request_timeout)
+    else:
+        timeouts = timeouts.for_url(url)
+
+    response, started = await _open(
+        session,
+        url,
+        params,
+        headers,
+        timeouts,
+        codec,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        metrics=metrics,
+    )
+    parser = ResultsParser(key)
+    error = None
+    try:
+        while not parser.done:
+            try:
+                async with asyncio.timeout(budget(timeouts.sock_read or timeouts.total)):
+                    chunk = await response.content.readany()
+                items = parser.feed(chunk, final=not chunk)
+            except asyncio.TimeoutError as exception:
+                error = "timeout"
+                msg = "Timeout occurred while reading from Overseerr instance."
+                raise POWTimeoutException(msg) from exception
+            except ClientError as exception:
+                error = "connection"
+                msg = "Error occurred while communicating with Overseerr."
+                raise POWConnectionException(msg) from exception
+            except ValueError as exception:
+                raise POWException(response.status, {"message": str(exception)}) from exception
+            for item in items:
+                yield item
+        if envelope is not None:
+            envelope.update(parser.envelope)
+    except POWException as exception:
+        if circuit_breaker is not None:
+            circuit_breaker.record_failure(exception)
+        raise
+    finally:
+        response.close()
+        if metrics is not None:
+            metrics.record_request(
+                url,
+                hdrs.METH_GET,
+                time.perf_counter() - started,
+                status=response.status,
+                error=error,
+                bytes_in=response.content.total_bytes,
+            )
+
+
+@_retry_throttled
+@_retry_connection
+async def _open(
+    session: ClientSession,
+    url: URL,
+    params: Mapping[str, str] | None,
+    headers: Optional[dict],
+    timeouts: TimeoutConfig,
+    codec: JsonCodec,
+    rate_limiter: RateLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    metrics: Metrics | None = None,
+) -> tuple[ClientResponse, float]:
+    """Send a GET request and wait for the response headers, with backoff and retry logic.
+
+    Args:
+        session (ClientSession): The aiohttp ClientSession to use for the request
+        url (URL): The URL to sent the request to
+        params (Mapping[str, str] | None): parameters required for the request.
+        headers (Optional[dict]): headers required for the request.
+        timeouts (TimeoutConfig): Timeouts of the request, the total bounds receiving the
+            headers and is clamped to the deadline of the current call.
+        codec (JsonCodec): decodes error responses.
+        rate_limiter (RateLimiter | None, optional): limits the rate of requests sent.
+            Defaults to None.
+        circuit_breaker (CircuitBreaker | None, optional): fails fast while the instance is
+            unhealthy. Defaults to None.
+        metrics (Metrics | None, optional): records failed attempts and retries. Defaults
+            to None.
+
+    Raises:
+        POWTimeoutException: Request timeout error or deadline exceeded
+        POWConnectionException: Connection issue error
+        POWRateLimitException: Request throttled by the server
+        POWCircuitOpenException: Circuit open, request not sent
+        POWException: Generic exception
+
+    Returns:
+        tuple[ClientResponse, float]: The response, with its body still to be read, and the
+        time the attempt was sent, to be recorded once the body has been read.
+    """
+    await _acquire(url, rate_limiter, circuit_breaker)
+
+    started = time.perf_counter() if metrics is not None else 0.0
+    response: ClientResponse | None = None
+    error = None
+    try:
+        try:
+            async with asyncio.timeout(budget(timeouts.total)):
+                response = await session.get(
+                    url, params=params, headers=headers, timeout=timeouts.client_timeout()
+                )
+                if response.status // 100 in [4, 5]:
+                    await _read(response, codec)
+        except asyncio.TimeoutError as exception:
+            error = "timeout"
+            msg = "Timeout occurred while connecting to Overseerr instance."
+            raise POWTimeoutException(msg) from exception
+        except ClientError as exception:
+            error = "connection"
+            msg = "Error occurred while communicating with Overseerr."
+            raise POWConnectionException(msg) from exception
+    except POWException as exception:
+        if rate_limiter is not None and isinstance(exception, POWRateLimitException):
+            rate_limiter.throttle(url, exception.retry_after)
+        if circuit_breaker is not None:
+            circuit_breaker.record_failure(exception)
+        if metrics is not None:
+            metrics.record_request(
+                url,
+                hdrs.METH_GET,
+                time.perf_counter() - started,
+                status=None if response is None else response.status,
+                error=error,
+                bytes_in=0 if response is None else response.content.total_bytes,
+            )
+        raise
+    except BaseException:
+        if response is not None:
+            response.close()
+        if circuit_breaker is not None:
+            circuit_breaker.release()
+        raise
+
+    if rate_limiter is not None:
+        rate_limiter.success(url)
+    if circuit_breaker is not None:
+        circuit_breaker.record_success()
+    return response, started
+
+
+async def _read(
+    response: ClientResponse, codec: JsonCodec, validators: dict[str, str] | None = None
+) -> Any:
+    """Decode a response, raising for error statuses.
+
+    Args:
+        response (ClientResponse): The response to read.
+        codec (JsonCodec): decodes JSON bodies.
+        validators (dict[str, str] | None, optional): filled with the ETag and
+            Last-Modified of the response. Defaults to None.
+
+    Raises:
+        POWRateLimitException: Request throttled by the server
+        POWException: Generic exception
+
+    Returns:
+        Any: Response in JSON or text, NOT_MODIFIED if a conditional request was answered
+        with 304
+    """
     content_type = response.headers.get("Content-Type", "")
     if response.status // 100 in [4, 5]:
         contents = await response.read()
         response.close()
 
-        if content_type == "application/json":
-            raise POWException(response.status, json.loads(contents.decode("utf8")))
-        raise POWException(response.status, {"message": contents.decode("utf8")})
+        if "application/json" in content_type:
+            body = codec.loads(contents)
+        else:
+            body = {"message": contents.decode("utf8")}
+
+        if response.status in THROTTLE_STATUSES:
+            retry_after = _parse_retry_after(response.headers.get(hdrs.RETRY_AFTER))
+            raise POWRateLimitException(response.status, body, retry_after)
+        raise POWException(response.status, body)
+
+    if validators is not None:
+        validators.update(
+            (name, response.headers[name]) for name in VALIDATOR_HEADERS if name in response.headers
+        )
+    request_headers = response.request_info.headers
+    if response.status == 304 and (
+        hdrs.IF_NONE_MATCH in request_headers or hdrs.IF_MODIFIED_SINCE in request_headers
+    ):
+        response.release()
+        return NOT_MODIFIED
 
     if "application/json" in content_type:
-        return await response.json()
+        return codec.loads(await response.read())
 
     text = await response.text()
     return {"message": text}
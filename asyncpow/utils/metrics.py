@@ -0,0 +1,428 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from bisect import bisect_left
+from typing import Callable, Literal, NamedTuple
+
+from pydantic import BaseModel
+from yarl import URL
+
+from asyncpow.utils.endpoint import endpoint_name
+
+# Upper bounds in seconds of the latency and parse time buckets
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MetricKind = Literal["request", "retry", "parse"]
+
+
+class MetricEvent(NamedTuple):
+    """A measurement passed to the hooks of Metrics."""
+
+    kind: MetricKind
+    name: str  # Endpoint for requests and retries, model for parses
+    duration: float = 0.0
+    method: str | None = None
+    status: int | None = None  # None when no response was received
+    error: str | None = None  # "timeout" or "connection" when no response was received
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+MetricsHook = Callable[[MetricEvent], None]
+
+
+class HistogramSnapshot(BaseModel):
+    """
+    Data class representing the buckets of a histogram.
+    """
+
+    buckets: list[float]  # Upper bounds, the last count is for values above them all
+    counts: list[int]
+    count: int
+    sum: float
+
+
+class EndpointSnapshot(BaseModel):
+    """
+    Data class representing the counters of an endpoint.
+    """
+
+    requests: int
+    statuses: dict[int, int]
+    errors: dict[str, int]
+    retries: int
+    timeouts: int
+    bytes_in: int
+    bytes_out: int
+    latency: HistogramSnapshot
+
+
+class MetricsSnapshot(BaseModel):
+    """
+    Data class representing the counters of a client.
+    """
+
+    endpoints: dict[str, EndpointSnapshot]
+    parse: dict[str, HistogramSnapshot]
+
+
+class Histogram:
+    """
+    Fixed bucket histogram of durations in seconds.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize an empty Histogram.
+
+        Args:
+            buckets (tuple[float, ...]): Ascending upper bounds of the buckets
+                (default is DEFAULT_BUCKETS).
+
+        Returns:
+            None
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value (float): The value, in seconds.
+
+        Returns:
+            None
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Copy of the buckets.
+
+        Returns:
+            HistogramSnapshot: The buckets, count and sum.
+        """
+        return HistogramSnapshot(
+            buckets=list(self.buckets), counts=list(self.counts), count=self.count, sum=self.sum
+        )
+
+
+class EndpointMetrics:
+    """
+    Counters and latency histogram of one endpoint.
+    """
+
+    __slots__ = (
+        "requests",
+        "statuses",
+        "errors",
+        "retries",
+        "bytes_in",
+        "bytes_out",
+        "latency",
+    )
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """
+        Initialize the EndpointMetrics with zero counters.
+
+        Args:
+            buckets (tuple[float, ...]): Upper bounds of the latency buckets.
+
+        Returns:
+            None
+        """
+        self.requests = 0
+        self.statuses: dict[int, int] = {}
+        self.errors: dict[str, int] = {}
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = Histogram(buckets)
+
+    def snapshot(self) -> EndpointSnapshot:
+        """Copy of the counters.
+
+        Returns:
+            EndpointSnapshot: The counters.
+        """
+        return EndpointSnapshot(
+            requests=self.requests,
+            statuses=dict(self.statuses),
+            errors=dict(self.errors),
+            retries=self.retries,
+            timeouts=self.errors.get("timeout", 0),
+            bytes_in=self.bytes_in,
+            bytes_out=self.bytes_out,
+            latency=self.latency.snapshot(),
+        )
+
+
+class Metrics:
+    """
+    Collects per-endpoint latency, status, retry and size counters, and parse times.
+
+    Every attempt sent to Overseerr is recorded, retries included, under the endpoint
+    name of its URL such as "tv/{id}". Parse times are recorded per model. Hooks receive
+    every measurement as a MetricEvent, to forward them to another metrics system.
+
+    Examples:
+        metrics = Metrics()
+        async with Overseerr(..., metrics=metrics) as api:
+            ...
+        print(to_prometheus(metrics.snapshot()))
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize empty Metrics.
+
+        Args:
+            buckets (tuple[float, ...]): Upper bounds in seconds of the latency and parse
+                time buckets (default is DEFAULT_BUCKETS).
+
+        Returns:
+            None
+        """
+        self.buckets = buckets
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.parse: dict[str, Histogram] = {}
+        self._hooks: list[MetricsHook] = []
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """Call hook with every measurement.
+
+        Args:
+            hook (MetricsHook): Called with a MetricEvent, it must not block.
+
+        Returns:
+            None
+        """
+        self._hooks.append(hook)
+
+    def _endpoint(self, name: str) -> EndpointMetrics:
+        """Get the counters of an endpoint, creating them on first use.
+
+        Args:
+            name (str): The endpoint name.
+
+        Returns:
+            EndpointMetrics: The counters.
+        """
+        endpoint = self.endpoints.get(name)
+        if endpoint is None:
+            endpoint = self.endpoints[name] = EndpointMetrics(self.buckets)
+        return endpoint
+
+    def _emit(self, event: MetricEvent) -> None:
+        """Pass a measurement to the hooks.
+
+        Args:
+            event (MetricEvent): The measurement.
+
+        Returns:
+            None
+        """
+        for hook in self._hooks:
+            hook(event)
+
+    def record_request(
+        self,
+        url: URL,
+        method: str,
+        duration: float,
+        status: int | None = None,
+        error: str | None = None,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+    ) -> None:
+        """Record an attempt sent to Overseerr.
+
+        Args:
+            url (URL): The URL of the request.
+            method (str): The HTTP method of the request.
+            duration (float): Seconds until the response was read or the attempt failed.
+            status (int, optional): The response status, None if there was no response.
+            error (str, optional): "timeout" or "connection" if there was no response.
+            bytes_in (int): Size of the response body (default is 0).
+            bytes_out (int): Size of the request body (default is 0).
+
+        Returns:
+            None
+        """
+        name = endpoint_name(url)
+        endpoint = self._endpoint(name)
+        endpoint.requests += 1
+        endpoint.latency.observe(duration)
+        endpoint.bytes_in += bytes_in
+        endpoint.bytes_out += bytes_out
+        if status is not None:
+            endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+        if error is not None:
+            endpoint.errors[error] = endpoint.errors.get(error, 0) + 1
+        if self._hooks:
+            self._emit(
+                MetricEvent("request", name, duration, method, status, error, bytes_in, bytes_out)
+            )
+
+    def record_retry(self, url: URL) -> None:
+        """Record that an attempt is retried.
+
+        Args:
+            url (URL): The URL of the request.
+
+        Returns:
+            None
+        """
+        name = endpoint_name(url)
+        self._endpoint(name).retries += 1
+        if self._hooks:
+            self._emit(MetricEvent("retry", name))
+
+    def record_parse(self, model: str, duration: float) -> None:
+        """Record the time spent validating a response into a model.
+
+        Args:
+            model (str): The model name.
+            duration (float): Seconds spent.
+
+        Returns:
+            None
+        """
+        histogram = self.parse.get(model)
+        if histogram is None:
+            histogram = self.parse[model] = Histogram(self.buckets)
+        histogram.observe(duration)
+        if self._hooks:
+            self._emit(MetricEvent("parse", model, duration))
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Copy of every counter.
+
+        Returns:
+            MetricsSnapshot: The counters of each endpoint and parse times of each model.
+        """
+        return MetricsSnapshot(
+            endpoints={name: endpoint.snapshot() for name, endpoint in self.endpoints.items()},
+            parse={model: histogram.snapshot() for model, histogram in self.parse.items()},
+        )
+
+    def reset(self) -> None:
+        """Reset every counter, the hooks are kept.
+
+        Returns:
+            None
+        """
+        self.endpoints.clear()
+        self.parse.clear()
+
+
+def _label(value: object) -> str:
+    """Escape a Prometheus label value.
+
+    Args:
+        value (object): The value.
+
+    Returns:
+        str: The quoted value.
+    """
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def _histogram_lines(name: str, labels: str, histogram: HistogramSnapshot) -> list[str]:
+    """Render a histogram in the Prometheus text format.
+
+    Args:
+        name (str): The metric name.
+        labels (str): The rendered labels, without braces.
+        histogram (HistogramSnapshot): The histogram.
+
+    Returns:
+        list[str]: The bucket, sum and count lines.
+    """
+    lines = []
+    cumulative = 0
+    bounds = [*(f"{bound:g}" for bound in histogram.buckets), "+Inf"]
+    for bound, count in zip(bounds, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def to_prometheus(snapshot: MetricsSnapshot, prefix: str = "asyncpow") -> str:
+    """Render a snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot (MetricsSnapshot): The snapshot, see Metrics.snapshot.
+        prefix (str): Prefix of the metric names (default is "asyncpow").
+
+    Returns:
+        str: The metrics, ready to be served on a /metrics endpoint.
+    """
+    families: dict[str, tuple[str, list[str]]] = {
+        "request_duration_seconds": ("histogram", []),
+        "requests_total": ("counter", []),
+        "request_errors_total": ("counter", []),
+        "retries_total": ("counter", []),
+        "received_bytes_total": ("counter", []),
+        "sent_bytes_total": ("counter", []),
+        "parse_duration_seconds": ("histogram", []),
+    }
+
+    def add(family: str, labels: str, value: float) -> None:
+        """Add a sample to a family."""
+        families[family][1].append(f"{prefix}_{family}{{{labels}}} {value}")
+
+    for name, endpoint in sorted(snapshot.endpoints.items()):
+        labels = f"endpoint={_label(name)}"
+        families["request_duration_seconds"][1].extend(
+            _histogram_lines(f"{prefix}_request_duration_seconds", labels, endpoint.latency)
+        )
+        for status, count in sorted(endpoint.statuses.items()):
+            add("requests_total", f"{labels},status={_label(status)}", count)
+        for error, count in sorted(endpoint.errors.items()):
+            add("request_errors_total", f"{labels},error={_label(error)}", count)
+        add("retries_total", labels, endpoint.retries)
+        add("received_bytes_total", labels, endpoint.bytes_in)
+        add("sent_bytes_total", labels, endpoint.bytes_out)
+    for model, histogram in sorted(snapshot.parse.items()):
+        families["parse_duration_seconds"][1].extend(
+            _histogram_lines(
+                f"{prefix}_parse_duration_seconds", f"model={_label(model)}", histogram
+            )
+        )
+
+    lines = []
+    for family, (kind, samples) in families.items():
+        if samples:
+            lines.append(f"# TYPE {prefix}_{family} {kind}")
+            lines.extend(samples)
+    return "\n".join(lines) + "\n"
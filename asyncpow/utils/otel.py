@@ -0,0 +1,105 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from typing import Any
+
+from asyncpow.utils.metrics import MetricEvent
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover
+    otel_metrics = None  # type: ignore[assignment]
+
+
+class OpenTelemetryHook:
+    """
+    Metrics hook that forwards measurements to OpenTelemetry instruments.
+
+    Requires the opentelemetry-api package, install it with ``pip install
+    opentelemetry-api``.
+
+    Examples:
+        metrics = Metrics()
+        metrics.add_hook(OpenTelemetryHook())
+    """
+
+    def __init__(self, meter: Any | None = None) -> None:
+        """
+        Initialize the OpenTelemetryHook and create its instruments.
+
+        Args:
+            meter (Meter, optional): Meter to create the instruments with. Defaults to the
+                "asyncpow" meter of the global meter provider.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+
+        Returns:
+            None
+        """
+        if otel_metrics is None:
+            raise ImportError("opentelemetry-api is not installed")
+        if meter is None:
+            meter = otel_metrics.get_meter("asyncpow")
+        self.duration = meter.create_histogram(
+            "asyncpow.client.request.duration", unit="s", description="Duration of requests"
+        )
+        self.retries = meter.create_counter(
+            "asyncpow.client.request.retries", description="Requests retried"
+        )
+        self.received = meter.create_counter(
+            "asyncpow.client.response.body.size", unit="By", description="Bytes received"
+        )
+        self.sent = meter.create_counter(
+            "asyncpow.client.request.body.size", unit="By", description="Bytes sent"
+        )
+        self.parse = meter.create_histogram(
+            "asyncpow.client.parse.duration", unit="s", description="Time spent in validation"
+        )
+
+    def __call__(self, event: MetricEvent) -> None:
+        """Record a measurement.
+
+        Args:
+            event (MetricEvent): The measurement.
+
+        Returns:
+            None
+        """
+        if event.kind == "parse":
+            self.parse.record(event.duration, {"model": event.name})
+            return
+
+        attributes: dict[str, str | int] = {"endpoint": event.name}
+        if event.kind == "retry":
+            self.retries.add(1, attributes)
+            return
+
+        if event.method is not None:
+            attributes["http.request.method"] = event.method
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.error is not None:
+            attributes["error.type"] = event.error
+        self.duration.record(event.duration, attributes)
+        self.received.add(event.bytes_in, attributes)
+        self.sent.add(event.bytes_out, attributes)
@@ -0,0 +1,123 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import asyncio
+from functools import partial
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+from asyncpow.utils.concurrency import gather_bounded
+
+
+async def paginate(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]], take: int, skip: int = 0
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Iterate over the pages of a take/skip endpoint.
+
+    The next page is requested while the current one is being consumed, so at most two
+    pages are held in memory at any time.
+
+    Args:
+        fetch_page (Callable[[int], Awaitable[dict[str, Any]]]): Fetches the raw page
+            starting at the given skip.
+        take (int): The number of items per page.
+        skip (int): The number of items to skip before the first page (default is 0).
+
+    Yields:
+        dict[str, Any]: The raw pages, in order.
+    """
+    next_page: asyncio.Future | None = asyncio.ensure_future(fetch_page(skip))
+    try:
+        while next_page is not None:
+            page = await next_page
+            next_page = None
+            skip += take
+            if len(page["results"]) >= take and skip < page["pageInfo"]["results"]:
+                next_page = asyncio.ensure_future(fetch_page(skip))
+            yield page
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+def page_info_pages(first: dict[str, Any]) -> int:
+    """Read the number of pages of a take/skip endpoint, such as media or request.
+
+    Args:
+        first (dict[str, Any]): The raw first page.
+
+    Returns:
+        int: The number of pages.
+    """
+    return first["pageInfo"]["pages"]
+
+
+def total_pages(first: dict[str, Any]) -> int:
+    """Read the number of pages of a page numbered endpoint, such as search.
+
+    Args:
+        first (dict[str, Any]): The raw first page.
+
+    Returns:
+        int: The number of pages.
+    """
+    return first["totalPages"]
+
+
+async def fetch_all_pages(
+    fetch_page: Callable[[int], Awaitable[Any]],
+    page_count: Callable[[dict[str, Any]], int],
+    concurrency: int = 4,
+    max_pages: int | None = None,
+    return_exceptions: bool = False,
+    parse: Callable[[dict[str, Any]], Any] | None = None,
+) -> list[Any]:
+    """Fetch the first page, then all remaining pages concurrently.
+
+    Args:
+        fetch_page (Callable[[int], Awaitable[Any]]): Fetches the raw page with the given
+            zero based index.
+        page_count (Callable[[dict[str, Any]], int]): Reads the number of pages from the
+            first page, see page_info_pages and total_pages.
+        concurrency (int): The maximum number of pages fetched at once (default is 4).
+        max_pages (int, optional): Stop after this many pages. Defaults to None, all pages.
+        return_exceptions (bool): Return the exception of a failed page in its place
+            instead of raising it (default is False).
+        parse (Callable[[dict[str, Any]], Any], optional): Validates each page that was
+            fetched. Defaults to None, the raw pages are returned.
+
+    Returns:
+        list[Any]: The pages in order, or exceptions for the pages that failed.
+    """
+    first = await fetch_page(0)
+    pages = page_count(first)
+    if max_pages is not None:
+        pages = min(pages, max_pages)
+
+    rest = await gather_bounded(
+        (partial(fetch_page, index) for index in range(1, pages)),
+        concurrency,
+        return_exceptions=return_exceptions,
+    )
+    results = [first, *rest]
+    if parse is None:
+        return results
+    return [result if isinstance(result, BaseException) else parse(result) for result in results]
@@ -0,0 +1,219 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import asyncio
+import time
+from typing import Mapping
+
+from yarl import URL
+
+from asyncpow.utils.endpoint import endpoint_name, match_endpoint
+
+
+class TokenBucket:
+    """
+    Token bucket that adapts its rate when the server throttles.
+
+    The rate is halved every time the server responds with 429 or 503 and grows back
+    by a small step after each successful response, up to the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        min_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1,
+    ) -> None:
+        """
+        Initialize the TokenBucket with a full bucket.
+
+        Args:
+            rate (float): Requests per second allowed.
+            burst (int, optional): Size of the bucket. Defaults to the rate rounded up.
+            min_rate (float): Lowest rate the bucket slows down to (default is 0.5).
+            decrease_factor (float): Rate multiplier applied when throttled (default is 0.5).
+            increase_step (float): Rate added after each success (default is 0.1).
+
+        Raises:
+            ValueError: If the rate is not positive.
+
+        Returns:
+            None
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst or max(1, int(rate + 0.999))
+        self.min_rate = min(min_rate, rate)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.throttled = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill.
+
+        Args:
+            now (float): The current monotonic time.
+
+        Returns:
+            None
+        """
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it.
+
+        Waiters are served in arrival order.
+
+        Returns:
+            None
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        """Slow down after the server throttled a request.
+
+        Args:
+            retry_after (float, optional): Seconds the server asked to wait before retrying.
+
+        Returns:
+            None
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.throttled += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._tokens = min(self._tokens, 0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def success(self) -> None:
+        """Speed back up after a successful request.
+
+        Returns:
+            None
+        """
+        if self.rate < self.max_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
+class RateLimiter:
+    """
+    Client side rate limiter with a token bucket per endpoint group.
+
+    Requests to an endpoint matching a group, such as "search" or "discover", take
+    their tokens from the bucket of that group, all other requests share the default
+    bucket.
+
+    .. code-block:: python
+
+        limiter = RateLimiter(rate=20, groups={"search": (2, 4), "discover": (5, 5)})
+    """
+
+    def __init__(
+        self,
+        rate: float = 10,
+        burst: int | None = None,
+        groups: Mapping[str, tuple[float, int | None]] | None = None,
+    ) -> None:
+        """
+        Initialize the RateLimiter with a default rate and optional endpoint groups.
+
+        Args:
+            rate (float): Requests per second for endpoints without a group (default is 10).
+            burst (int, optional): Size of the default bucket. Defaults to the rate.
+            groups (Mapping[str, tuple[float, int | None]], optional): Rate and burst keyed
+                on endpoint prefix. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.default = TokenBucket(rate, burst)
+        self.groups = {
+            prefix: TokenBucket(group_rate, group_burst)
+            for prefix, (group_rate, group_burst) in (groups or {}).items()
+        }
+
+    def bucket_for(self, url: URL) -> TokenBucket:
+        """Get the bucket that applies to a request.
+
+        Args:
+            url (URL): The URL of the request.
+
+        Returns:
+            TokenBucket: The bucket of the endpoint group, or the default bucket.
+        """
+        return match_endpoint(self.groups, endpoint_name(url)) or self.default
+
+    async def acquire(self, url: URL) -> None:
+        """Wait until a request to the URL is allowed.
+
+        Args:
+            url (URL): The URL of the request.
+
+        Returns:
+            None
+        """
+        await self.bucket_for(url).acquire()
+
+    def throttle(self, url: URL, retry_after: float | None = None) -> None:
+        """Slow down the bucket of a throttled request.
+
+        Args:
+            url (URL): The URL of the request.
+            retry_after (float, optional): Seconds the server asked to wait before retrying.
+
+        Returns:
+            None
+        """
+        self.bucket_for(url).throttle(retry_after)
+
+    def success(self, url: URL) -> None:
+        """Record a successful request.
+
+        Args:
+            url (URL): The URL of the request.
+
+        Returns:
+            None
+        """
+        self.bucket_for(url).success()
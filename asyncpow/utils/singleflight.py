@@ -0,0 +1,123 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class _Call:
+    """A shared call and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        """
+        Initialize the _Call with its first caller.
+
+        Args:
+            task (asyncio.Task): The task running the call.
+
+        Returns:
+            None
+        """
+        self.task = task
+        self.waiters = 1
+
+
+class SingleFlight:
+    """
+    Coalesce identical in-flight calls so that only one of them does the work.
+
+    Callers that arrive while a call with the same key is running await the result of
+    that call instead of starting their own. The shared call runs in its own task, so
+    cancelling one caller does not cancel it for the others. When a copy function is
+    given, every caller of a call that was shared gets its own copy of the result.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the SingleFlight with no calls in flight.
+
+        Returns:
+            None
+        """
+        self.calls = 0
+        self.shared = 0
+        self._inflight: dict[str, _Call] = {}
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        copy: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Run func, or join the in-flight call with the same key.
+
+        Args:
+            key (str): Key identifying identical calls.
+            func (Callable[[], Awaitable[Any]]): Starts the call when none is in flight.
+            copy (Callable[[Any], Any], optional): Copies the result for each caller when
+                the call was shared, so no two callers get the same object. Defaults to
+                None, every caller gets the same result.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+        call = self._inflight.get(key)
+        if call is None:
+            self.calls += 1
+            call = _Call(asyncio.ensure_future(func()))
+            self._inflight[key] = call
+            call.task.add_done_callback(lambda done: self._done(key, done))
+        else:
+            self.shared += 1
+            call.waiters += 1
+        result = await asyncio.shield(call.task)
+        # The call is forgotten before its callers resume, so no caller can join any more
+        if copy is None or call.waiters == 1:
+            return result
+        return copy(result)
+
+    def _done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished call.
+
+        Args:
+            key (str): Key of the call.
+            task (asyncio.Task): The finished task.
+
+        Returns:
+            None
+        """
+        call = self._inflight.get(key)
+        if call is not None and call.task is task:
+            del self._inflight[key]
+        # Retrieve the exception so it is not reported when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        """Number of calls in flight.
+
+        Returns:
+            int: The number of calls in flight.
+        """
+        return len(self._inflight)
@@ -0,0 +1,226 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import codecs
+import json
+import re
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def _skip_whitespace(buffer: str, position: int) -> int:
+    """Find the first character from a position that is not JSON whitespace.
+
+    Args:
+        buffer (str): The buffer.
+        position (int): Index to start at.
+
+    Returns:
+        int: Index of the character, the length of the buffer if there is none.
+    """
+    match = _WHITESPACE.match(buffer, position)
+    return position if match is None else match.end()
+
+
+class ResultsParser:
+    """
+    Incremental parser extracting the items of an array in a JSON object as bytes arrive.
+
+    Feed it the body in chunks of any size, each call returns the items of the array that
+    are complete so far. The other members of the object, such as pageInfo, are collected
+    in envelope. Only the item being received is buffered, so memory stays flat however
+    long the array is.
+
+    Items are decoded with the json module, whose raw_decode can resume part way through
+    a buffer, rather than the codec of the transport.
+    """
+
+    __slots__ = ("key", "envelope", "_decoder", "_buffer", "_state", "_member")
+
+    def __init__(self, key: str = "results") -> None:
+        """
+        Initialize the ResultsParser.
+
+        Args:
+            key (str): Member of the top level object holding the array (default is
+                "results").
+
+        Returns:
+            None
+        """
+        self.key = key
+        self.envelope: dict[str, Any] = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # start, member, items, next or done
+        self._state = "start"
+        self._member: str | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole object has been parsed.
+
+        Returns:
+            bool: True once the closing brace of the object was read.
+        """
+        return self._state == "done"
+
+    def feed(self, data: bytes, final: bool = False) -> list[Any]:
+        """Parse the next chunk of the body.
+
+        Args:
+            data (bytes): The chunk.
+            final (bool): Whether this is the last chunk (default is False).
+
+        Raises:
+            ValueError: If the body is not a JSON object, or ends before the object does.
+
+        Returns:
+            list[Any]: The array items completed by this chunk.
+        """
+        self._buffer += self._decoder.decode(data, final)
+        items: list[Any] = []
+        position = self._parse(0, final, items)
+        self._buffer = self._buffer[position:]
+        if final and not self.done:
+            raise ValueError("Response ended before the end of the JSON object")
+        return items
+
+    def _parse(self, position: int, final: bool, items: list[Any]) -> int:
+        """Parse as much of the buffer as is complete.
+
+        Args:
+            position (int): Index in the buffer to start at.
+            final (bool): Whether the buffer holds the rest of the body.
+            items (list[Any]): Completed array items are appended to it.
+
+        Raises:
+            ValueError: If the body is not a JSON object.
+
+        Returns:
+            int: Index of the first character not consumed.
+        """
+        buffer = self._buffer
+        while self._state != "done":
+            position = _skip_whitespace(buffer, position)
+            if position == len(buffer):
+                return position
+            char = buffer[position]
+
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError("Response is not a JSON object")
+                self._state = "member"
+                position += 1
+            elif self._state == "next":
+                if char not in ",}":
+                    raise ValueError(f"Expected ',' or '}}' at {char!r}")
+                self._state = "member" if char == "," else "done"
+                position += 1
+            elif self._state == "member":
+                if char == "}":
+                    self._state = "done"
+                    position += 1
+                    continue
+                value = self._member_value(buffer, position, final)
+                if value is None:
+                    return position
+                position = value
+            else:
+                if char == "]":
+                    self._state = "next"
+                    position += 1
+                    continue
+                if char == ",":
+                    position += 1
+                    continue
+                decoded = self._decode(buffer, position, final)
+                if decoded is None:
+                    return position
+                item, position = decoded
+                items.append(item)
+        return position
+
+    def _member_value(self, buffer: str, position: int, final: bool) -> int | None:
+        """Parse a member of the object, or the start of the array.
+
+        Args:
+            buffer (str): The buffer.
+            position (int): Index of the member name.
+            final (bool): Whether the buffer holds the rest of the body.
+
+        Raises:
+            ValueError: If the member is not a name followed by a colon.
+
+        Returns:
+            int | None: Index after the member, None if it is not complete yet.
+        """
+        decoded = self._decode(buffer, position, final)
+        if decoded is None:
+            return None
+        name, position = decoded
+        position = _skip_whitespace(buffer, position)
+        if position == len(buffer):
+            return None
+        if not isinstance(name, str) or buffer[position] != ":":
+            raise ValueError("Expected a member name followed by ':'")
+        position = _skip_whitespace(buffer, position + 1)
+        if position == len(buffer):
+            return None
+        if name == self.key and buffer[position] == "[":
+            self._state = "items"
+            return position + 1
+        decoded = self._decode(buffer, position, final)
+        if decoded is None:
+            return None
+        self.envelope[name], position = decoded
+        self._state = "next"
+        return position
+
+    @staticmethod
+    def _decode(buffer: str, position: int, final: bool) -> tuple[Any, int] | None:
+        """Decode the JSON value at a position.
+
+        Args:
+            buffer (str): The buffer.
+            position (int): Index of the value.
+            final (bool): Whether the buffer holds the rest of the body.
+
+        Raises:
+            ValueError: If the value is invalid and no more of the body will arrive.
+
+        Returns:
+            tuple[Any, int] | None: The value and the index after it, None if the value
+            may continue in the next chunk.
+        """
+        try:
+            value, end = _DECODER.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        # A number at the end of the buffer may have more digits to come
+        if end == len(buffer) and not final and isinstance(value, (int, float)):
+            return None
+        return value, end
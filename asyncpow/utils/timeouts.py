@@ -0,0 +1,124 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from typing import Iterator
+
+from aiohttp import ClientTimeout
+from pydantic import BaseModel
+from yarl import URL
+
+from asyncpow.utils.endpoint import endpoint_name, match_endpoint
+
+# Monotonic time by which the current logical call must complete
+_deadline: ContextVar[float | None] = ContextVar("asyncpow_deadline", default=None)
+
+
+class TimeoutConfig(BaseModel):
+    """
+    Data class representing the timeouts of a request, in seconds.
+
+    total bounds a single attempt from sending the request to reading the body, connect
+    and sock_read bound connecting and each read from the socket. endpoints overrides
+    the timeouts of the endpoints matching a prefix, such as "search" or "tv".
+    """
+
+    total: float | None = 10
+    connect: float | None = None
+    sock_read: float | None = None
+    endpoints: dict[str, "TimeoutConfig"] = {}
+
+    def for_url(self, url: URL) -> "TimeoutConfig":
+        """Get the timeouts that apply to a request.
+
+        Args:
+            url (URL): The URL of the request.
+
+        Returns:
+            TimeoutConfig: The endpoint override, or this config.
+        """
+        if not self.endpoints:
+            return self
+        return match_endpoint(self.endpoints, endpoint_name(url)) or self
+
+    def client_timeout(self) -> ClientTimeout:
+        """Build the aiohttp timeout of an attempt, the total is enforced separately.
+
+        Returns:
+            ClientTimeout: Timeout with the connect and sock_read limits.
+        """
+        return ClientTimeout(total=None, connect=self.connect, sock_read=self.sock_read)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bound every request made inside the block, retries included, by a shared budget.
+
+    The deadline follows the call into the coroutines and tasks it starts, so composite
+    calls such as request.async_post_request share it. Nested deadlines can only shorten
+    the budget.
+
+    .. code-block:: python
+
+        with deadline(2.0):
+            await api.request.async_post_request(id=1399, type="tv")
+
+    Args:
+        seconds (float): The budget of the block.
+
+    Yields:
+        None
+    """
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Get the time left before the current deadline.
+
+    Returns:
+        float | None: Seconds left, possibly negative, or None without a deadline.
+    """
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def budget(timeout: float | None) -> float | None:
+    """Clamp a timeout to the time left before the current deadline.
+
+    Args:
+        timeout (float | None): The timeout, None for no timeout.
+
+    Returns:
+        float | None: The smaller of the timeout and the time left.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    return max(0.0, left if timeout is None else min(timeout, left))
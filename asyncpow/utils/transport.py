@@ -0,0 +1,263 @@
+# AsyncPOW - https://github.com/totaldebug/asyncpow
+#
+# Copyright (c) 2024 Steven Marks, Total Debug
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import time
+from typing import Any, AsyncGenerator, Iterable, Mapping, Optional, TypeVar
+
+from aiohttp import BaseConnector, ClientSession, TCPConnector, hdrs
+from pydantic import BaseModel
+from yarl import URL
+
+from asyncpow.utils.breaker import CircuitBreaker
+from asyncpow.utils.cache import ResponseCache
+from asyncpow.utils.codec import DEFAULT_CODEC, JsonCodec
+from asyncpow.utils.http import request, stream
+from asyncpow.utils.metrics import Metrics
+from asyncpow.utils.ratelimit import RateLimiter
+from asyncpow.utils.singleflight import SingleFlight
+from asyncpow.utils.timeouts import TimeoutConfig
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class TransportConfig(BaseModel):
+    """
+    Data class representing the connection pool settings of a client.
+
+    aiohttp always enables TCP_NODELAY on the sockets it opens, so there is no
+    setting for it here.
+    """
+
+    limit: int = 100  # Total simultaneous connections, 0 is unlimited
+    limit_per_host: int = 0  # Simultaneous connections to one host, 0 is unlimited
+    keepalive_timeout: float | None = 15.0  # Seconds an idle connection is kept open
+    force_close: bool = False  # Close the connection after each request
+    use_dns_cache: bool = True
+    ttl_dns_cache: int | None = 10  # Seconds resolved hosts are cached, None is forever
+    enable_cleanup_closed: bool = False
+
+    def create_connector(self) -> TCPConnector:
+        """Create a connector using the pool settings.
+
+        Returns:
+            TCPConnector: A new connector, owned by the caller.
+        """
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=None if self.force_close else self.keepalive_timeout,
+            force_close=self.force_close,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
+
+
+class Transport:
+    """
+    HTTP transport shared by all of the API classes of a client.
+
+    The transport owns the ClientSession unless one is passed in, a connector that is
+    passed in is never closed so it can be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        config: TransportConfig | None = None,
+        session: ClientSession | None = None,
+        connector: BaseConnector | None = None,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        timeouts: TimeoutConfig | None = None,
+        codec: JsonCodec = DEFAULT_CODEC,
+        metrics: Metrics | None = None,
+    ) -> None:
+        """
+        Initialize the Transport with a config, an existing session or a connector.
+
+        Args:
+            config (TransportConfig, optional): Pool settings used when a connector is created.
+            session (ClientSession, optional): Existing session to use, it is not closed.
+            connector (BaseConnector, optional): Existing connector to use, it is not closed.
+            cache (ResponseCache, optional): Cache for GET responses, disabled if None.
+            coalesce_requests (bool): Share one upstream request between identical GET
+                requests in flight at the same time, each caller still gets its own result
+                (default is True).
+            rate_limiter (RateLimiter, optional): Limits the rate of requests, disabled if None.
+            circuit_breaker (CircuitBreaker, optional): Fails fast while the instance is
+                unhealthy, disabled if None.
+            timeouts (TimeoutConfig, optional): Timeouts per attempt, 10 seconds in total if
+                None.
+            codec (JsonCodec): JSON codec for request and response bodies, defaults to the
+                fastest one installed.
+            metrics (Metrics, optional): Records requests, retries and parse times, disabled
+                if None.
+
+        Raises:
+            ValueError: If both a session and a connector are provided.
+
+        Returns:
+            None
+        """
+        if session is not None and connector is not None:
+            raise ValueError("Provide either a session or a connector, not both")
+
+        self.config = config or TransportConfig()
+        self.cache = cache
+        self.singleflight = SingleFlight() if coalesce_requests else None
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts
+        self.codec = codec
+        self.metrics = metrics
+        self._owns_session = session is None
+        if session is None:
+            if connector is None:
+                session = ClientSession(
+                    connector=self.config.create_connector(), json_serialize=codec.dumps_str
+                )
+            else:
+                session = ClientSession(
+                    connector=connector, connector_owner=False, json_serialize=codec.dumps_str
+                )
+        self.session = session
+
+    async def request(
+        self,
+        url: URL,
+        method: str = hdrs.METH_GET,
+        data: Any | None = None,
+        json_data: dict[str, Any] | None = None,
+        params: Mapping[str, str] | None = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """Make an HTTP request using the session and cache of this transport.
+
+        Args:
+            url (URL): The URL to sent the request to
+            method (str, optional): The HTTP method to use for the request. Defaults to hdrs.METH_GET.
+            data (Any | None, optional): data to include in the request. Defaults to None.
+            json_data (dict[str, Any] | None, optional): JSON data to include in the request. Defaults to None.
+            params (Mapping[str, str] | None, optional): parameters required for the request. Defaults to None.
+            headers (Optional[dict], optional): headers required for the request. Defaults to None.
+
+        Returns:
+            Any: Response in JSON or text
+        """
+        return await request(
+            self.session,
+            url,
+            method=method,
+            data=data,
+            json_data=json_data,
+            params=params,
+            headers=headers,
+            cache=self.cache,
+            singleflight=self.singleflight,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            timeouts=self.timeouts,
+            codec=self.codec,
+            metrics=self.metrics,
+        )
+
+    def invalidate(self, *urls: URL, endpoints: Iterable[str] = ()) -> int:
+        """Remove the cached responses made stale by a write.
+
+        Args:
+            *urls (URL): URLs to remove, whatever their query.
+            endpoints (Iterable[str], optional): Endpoint prefixes to remove, such as
+                "request". Defaults to ().
+
+        Returns:
+            int: The number of responses removed, 0 without a cache.
+        """
+        if self.cache is None:
+            return 0
+        count = sum(self.cache.invalidate_url(url) for url in urls)
+        return count + sum(self.cache.invalidate(endpoint) for endpoint in endpoints)
+
+    def stream(
+        self,
+        url: URL,
+        params: Mapping[str, str] | None = None,
+        headers: Optional[dict] = None,
+        key: str = "results",
+        envelope: dict[str, Any] | None = None,
+    ) -> AsyncGenerator[Any, None]:
+        """Make a GET request and yield the items of an array in the response as they arrive.
+
+        The cache and request coalescing of this transport are bypassed.
+
+        Args:
+            url (URL): The URL to sent the request to
+            params (Mapping[str, str] | None, optional): parameters required for the request. Defaults to None.
+            headers (Optional[dict], optional): headers required for the request. Defaults to None.
+            key (str, optional): Member of the response holding the array. Defaults to "results".
+            envelope (dict[str, Any] | None, optional): filled with the other members of the
+                response once it has been read. Defaults to None.
+
+        Returns:
+            AsyncGenerator[Any, None]: The decoded items of the array.
+        """
+        return stream(
+            self.session,
+            url,
+            params=params,
+            headers=headers,
+            key=key,
+            envelope=envelope,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            timeouts=self.timeouts,
+            codec=self.codec,
+            metrics=self.metrics,
+        )
+
+    def parse(self, model: type[ModelT], data: Any) -> ModelT:
+        """Validate a response into a model, timing it when metrics are enabled.
+
+        Args:
+            model (type[ModelT]): The model.
+            data (Any): The decoded response.
+
+        Returns:
+            ModelT: The validated model.
+        """
+        if self.metrics is None:
+            return model(**data)
+        started = time.perf_counter()
+        try:
+            return model(**data)
+        finally:
+            self.metrics.record_parse(model.__name__, time.perf_counter() - started)
+
+    async def close(self) -> None:
+        """Close the session if it is owned by this transport.
+
+        Returns:
+            None
+        """
+        if self._owns_session:
+            await self.session.close()
@@ -0,0 +1,238 @@
+"""Measure end to end throughput and latency of the client against the local mock server.
+
+Run from the repository root with ``python -m benchmarks.bench_client`` or ``nox -s
+benchmark``. Each run is compared with the newest baseline in ``benchmarks/baselines``
+and exits with status 1 when throughput or median latency regressed by more than the
+threshold. Pass ``--save`` to store the run as the new baseline.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from asyncpow import Overseerr
+from benchmarks.server import API_KEY, TOTAL_RESULTS, StubProcess
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+CONCURRENCY = (1, 8, 32)
+# Results compared against the baseline, and whether a higher value is better.
+CHECKED = {"throughput": True, "p50": False}
+
+Scenario = Callable[[Overseerr, int], Awaitable[Any]]
+
+PAGE_SIZE = 100
+
+
+def page_skip(n: int) -> int:
+    """Offset of the nth page, wrapped around the items of the mock so every page is full.
+
+    Args:
+        n (int): The call number.
+
+    Returns:
+        int: The number of items to skip.
+    """
+    return (n * PAGE_SIZE) % (TOTAL_RESULTS - TOTAL_RESULTS % PAGE_SIZE)
+
+
+# Parameters vary with the call number so identical requests are not coalesced.
+SCENARIOS: dict[str, Scenario] = {
+    "get_media": lambda client, n: client.media.async_get_media(take=PAGE_SIZE, skip=page_skip(n)),
+    "get_requests": lambda client, n: client.request.async_get_requests(
+        take=PAGE_SIZE, skip=page_skip(n)
+    ),
+    "get_search": lambda client, n: client.search.async_get_search(f"query {n}"),
+    "get_tv": lambda client, n: client.tv.async_get_tv(1000 + n),
+    "post_request": lambda client, n: client.request.async_post_request(1000 + n, "movie"),
+    # Looks up the seasons of the show first, see Tv.async_get_tv_seasons
+    "post_request_tv": lambda client, n: client.request.async_post_request(1000 + n, "tv"),
+}
+
+
+async def run_scenario(
+    client: Overseerr, scenario: Scenario, concurrency: int, requests: int
+) -> dict[str, float]:
+    """Run a scenario with a fixed number of workers.
+
+    Args:
+        client (Overseerr): The client.
+        scenario (Scenario): The call to make.
+        concurrency (int): Number of calls in flight at once.
+        requests (int): Total number of calls.
+
+    Returns:
+        dict[str, float]: Throughput in calls per second and latency percentiles in
+            milliseconds.
+    """
+    latencies: list[float] = []
+    calls = iter(range(requests))
+
+    async def worker() -> None:
+        """Make calls until all have been made."""
+        for n in calls:
+            start = time.perf_counter()
+            await scenario(client, n)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    for n in range(min(requests, 10)):
+        await scenario(client, requests + n)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": requests,
+        "throughput": round(requests / elapsed, 1),
+        "p50": round(quantiles[49], 3),
+        "p90": round(quantiles[89], 3),
+        "p99": round(quantiles[98], 3),
+        "max": round(max(latencies), 3),
+    }
+
+
+async def run(
+    scenarios: list[str], concurrency: list[int], requests: int
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Run every scenario at every concurrency level against a fresh mock server.
+
+    Args:
+        scenarios (list[str]): Names of the scenarios to run.
+        concurrency (list[int]): Concurrency levels.
+        requests (int): Number of calls per scenario and level.
+
+    Returns:
+        dict[str, dict[str, dict[str, float]]]: Results by scenario and concurrency.
+    """
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    with StubProcess() as stub:
+        async with Overseerr(stub.host, API_KEY, port=stub.port, tls=False) as client:
+            for name in scenarios:
+                results[name] = {}
+                for level in concurrency:
+                    result = await run_scenario(client, SCENARIOS[name], level, requests)
+                    results[name][str(level)] = result
+                    print(
+                        f"{name:<16} c={level:<4} {result['throughput']:>9.1f}/s "
+                        f"p50 {result['p50']:>8.3f}ms p90 {result['p90']:>8.3f}ms "
+                        f"p99 {result['p99']:>8.3f}ms"
+                    )
+    return results
+
+
+def package_version() -> str:
+    """Get the installed asyncpow version.
+
+    Returns:
+        str: The version, or "unknown" when the package is not installed.
+    """
+    try:
+        return version("asyncpow")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def latest_baseline(directory: Path) -> Path | None:
+    """Find the newest stored baseline.
+
+    Args:
+        directory (Path): The baseline directory.
+
+    Returns:
+        Path | None: The newest baseline, or None when there is none.
+    """
+    baselines = sorted(directory.glob("*.json"))
+    return baselines[-1] if baselines else None
+
+
+def compare(
+    baseline: dict[str, Any], results: dict[str, dict[str, dict[str, float]]], threshold: float
+) -> list[str]:
+    """Compare results with a baseline.
+
+    Scenarios or concurrency levels missing from the baseline are skipped.
+
+    Args:
+        baseline (dict[str, Any]): The stored baseline.
+        results (dict[str, dict[str, dict[str, float]]]): The results of this run.
+        threshold (float): Allowed relative change, e.g. 0.2 for 20%.
+
+    Returns:
+        list[str]: A description of every regression.
+    """
+    regressions = []
+    for name, levels in results.items():
+        for level, result in levels.items():
+            previous = baseline["results"].get(name, {}).get(level)
+            if previous is None:
+                continue
+            for key, higher_is_better in CHECKED.items():
+                change = (result[key] - previous[key]) / previous[key]
+                if not higher_is_better:
+                    change = -change
+                if change < -threshold:
+                    regressions.append(
+                        f"{name} c={level} {key}: {previous[key]} -> {result[key]} "
+                        f"({abs(change):.0%} worse)"
+                    )
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmarks, compare them with the last baseline and optionally save them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario", nargs="+", choices=SCENARIOS, default=list(SCENARIOS), dest="scenarios"
+    )
+    parser.add_argument("--concurrency", nargs="+", type=int, default=list(CONCURRENCY))
+    parser.add_argument("--requests", type=int, default=500, help="calls per scenario and level")
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed relative regression (0.2)"
+    )
+    parser.add_argument("--save", action="store_true", help="store this run as a baseline")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.scenarios, args.concurrency, args.requests))
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "requests": args.requests,
+        "results": results,
+    }
+
+    regressions = []
+    previous = latest_baseline(args.baseline_dir)
+    if previous is None:
+        print("No baseline to compare with.")
+    else:
+        baseline = json.loads(previous.read_text())
+        regressions = compare(baseline, results, args.threshold)
+        print(f"Compared with {previous.name} ({baseline['version']}):")
+        print("\n".join(regressions) if regressions else "no regressions")
+
+    if args.save:
+        args.baseline_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = args.baseline_dir / f"{stamp}.json"
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Saved baseline {path}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
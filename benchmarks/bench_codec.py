@@ -0,0 +1,55 @@
+"""Compare the JSON codecs on Overseerr sized payloads.
+
+Run from the repository root with ``python -m benchmarks.bench_codec``.
+"""
+
+from functools import partial
+import json
+import timeit
+from typing import Any, Callable
+
+from asyncpow.utils.codec import available_codecs, get_codec
+from benchmarks import payloads
+
+PAYLOADS: dict[str, Callable[[], dict[str, Any]]] = {
+    "media take=500": lambda: payloads.media_page(500),
+    "request take=500": lambda: payloads.request_page(500),
+    "search page": lambda: payloads.search_page(20),
+    "tv details": lambda: payloads.tv_details(),
+}
+
+
+def measure(func: Callable[[], Any]) -> float:
+    """Time a function, taking the best of five runs of at least 0.2 seconds each.
+
+    Args:
+        func (Callable[[], Any]): The function to time.
+
+    Returns:
+        float: The best time per call in milliseconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1000
+
+
+def main() -> None:
+    """Print decode and encode times of every installed codec for each payload."""
+    codecs = {name: get_codec(name) for name in available_codecs()}
+    header = f"{'payload':<18} {'size':>10} " + " ".join(
+        f"{name + ' loads':>14} {name + ' dumps':>14}" for name in codecs
+    )
+    print(header)
+    for label, build in PAYLOADS.items():
+        body = json.dumps(build()).encode()
+        row = f"{label:<18} {len(body) / 1024:>8.0f}kB "
+        for codec in codecs.values():
+            value = codec.loads(body)
+            loads = measure(partial(codec.loads, body))
+            dumps = measure(partial(codec.dumps, value))
+            row += f"{loads:>12.3f}ms {dumps:>12.3f}ms "
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
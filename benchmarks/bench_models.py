@@ -0,0 +1,138 @@
+"""Measure how model validation scales with page size and nesting depth.
+
+Payloads are generated from the OpenAPI schemas by ``asyncpow.testing.generator``. List
+models are scaled by the number of results on the page, detail models by the number of cast
+and crew members. Run from the repository root with ``python -m benchmarks.bench_models``.
+"""
+
+import argparse
+from functools import partial
+import json
+import tracemalloc
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from asyncpow.models.media import MediaModel
+from asyncpow.models.movie import MovieDetailsModel
+from asyncpow.models.request import RequestResultsResponseModel
+from asyncpow.models.search import SearchResultModel
+from asyncpow.models.tv import TvDetailsModel
+from asyncpow.testing.generator import PayloadGenerator
+from benchmarks.bench_codec import measure
+
+SIZES = (10, 100, 1000, 10000)
+DEPTHS = (1, 3)
+
+Build = Callable[[PayloadGenerator, int], dict[str, Any]]
+
+
+def _details(schema: str) -> Build:
+    """Build a details payload with the given number of cast and crew members.
+
+    Args:
+        schema (str): The details schema, e.g. "TvDetails".
+
+    Returns:
+        Build: The payload builder.
+    """
+
+    def build(generator: PayloadGenerator, size: int) -> dict[str, Any]:
+        """Build the payload.
+
+        Args:
+            generator (PayloadGenerator): The generator.
+            size (int): Number of cast and crew members.
+
+        Returns:
+            dict[str, Any]: The payload.
+        """
+        generator.lengths |= {f"{schema}.credits.cast": size, f"{schema}.credits.crew": size}
+        return generator.schema(schema)
+
+    return build
+
+
+MODELS: dict[str, tuple[type[BaseModel], Build]] = {
+    "MediaModel": (MediaModel, lambda generator, size: generator.response("/media", size)),
+    "RequestResultsResponseModel": (
+        RequestResultsResponseModel,
+        lambda generator, size: generator.response("/request", size),
+    ),
+    "SearchResultModel": (
+        SearchResultModel,
+        lambda generator, size: generator.response("/search", size),
+    ),
+    "TvDetailsModel": (TvDetailsModel, _details("TvDetails")),
+    "MovieDetailsModel": (MovieDetailsModel, _details("MovieDetails")),
+}
+
+
+def parse(model: type[BaseModel], payload: dict[str, Any]) -> BaseModel:
+    """Validate a payload the way the API classes do.
+
+    Args:
+        model (type[BaseModel]): The model.
+        payload (dict[str, Any]): The decoded payload.
+
+    Returns:
+        BaseModel: The validated model.
+    """
+    return model(**payload)
+
+
+def memory(model: type[BaseModel], payload: dict[str, Any]) -> tuple[int, int, int]:
+    """Trace the allocations made while validating a payload.
+
+    Args:
+        model (type[BaseModel]): The model.
+        payload (dict[str, Any]): The decoded payload.
+
+    Returns:
+        tuple[int, int, int]: Number of memory blocks and bytes held by the validated
+            model, and the peak bytes allocated during validation.
+    """
+    tracemalloc.start()
+    parsed = parse(model, payload)
+    size, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del parsed
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return blocks, size, peak
+
+
+def main() -> None:
+    """Print parse time, allocations and peak memory of each model by size and depth."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", nargs="+", choices=MODELS, default=list(MODELS), dest="models")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument(
+        "--depths", nargs="+", type=int, default=list(DEPTHS), help="schema nesting levels"
+    )
+    parser.add_argument(
+        "--items", type=int, default=2, help="length of nested arrays, e.g. MediaInfo.requests"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'model':<28} {'size':>6} {'depth':>5} {'payload':>10} {'parse':>11} "
+        f"{'blocks':>9} {'retained':>10} {'peak':>10}"
+    )
+    for name in args.models:
+        model, build = MODELS[name]
+        for depth in args.depths:
+            for size in args.sizes:
+                payload = build(PayloadGenerator(depth=depth, items=args.items), size)
+                body = len(json.dumps(payload))
+                parse_time = measure(partial(parse, model, payload))
+                blocks, retained, peak = memory(model, payload)
+                print(
+                    f"{name:<28} {size:>6} {depth:>5} {body / 1024:>8.0f}kB "
+                    f"{parse_time:>9.3f}ms {blocks:>9} {retained / 1024:>8.0f}kB "
+                    f"{peak / 1024:>8.0f}kB"
+                )
+
+
+if __name__ == "__main__":
+    main()
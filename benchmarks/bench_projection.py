@@ -0,0 +1,65 @@
+"""Compare full and projected models on a large /media page.
+
+Run from the repository root with ``python -m benchmarks.bench_projection``.
+"""
+
+from functools import partial
+import tracemalloc
+from typing import Any
+
+from pydantic import BaseModel
+
+from asyncpow.models.media import MediaInfoModel, MediaModel
+from asyncpow.models.projection import projection_page
+from benchmarks import payloads
+from benchmarks.bench_codec import measure
+
+FIELDS = ["id", "tmdbId", "status"]
+
+
+def parse(model: type[BaseModel], page: dict[str, Any]) -> BaseModel:
+    """Validate a page the way the API classes do.
+
+    Args:
+        model (type[BaseModel]): The page model.
+        page (dict[str, Any]): The decoded page.
+
+    Returns:
+        BaseModel: The validated page.
+    """
+    return model(**page)
+
+
+def retained(model: type[BaseModel], page: dict[str, Any]) -> int:
+    """Measure the memory held by a validated page.
+
+    Args:
+        model (type[BaseModel]): The page model.
+        page (dict[str, Any]): The decoded page.
+
+    Returns:
+        int: The bytes still allocated while the page is alive.
+    """
+    tracemalloc.start()
+    parsed = parse(model, page)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return size
+
+
+def main() -> None:
+    """Print parse time and retained memory of a full and a projected page."""
+    page = payloads.media_page(500, requests=2)
+    models: dict[str, type[BaseModel]] = {
+        "MediaModel": MediaModel,
+        f"projection {FIELDS}": projection_page(MediaInfoModel, FIELDS),
+    }
+    print(f"{'model':<40} {'parse':>10} {'retained':>10}")
+    for label, model in models.items():
+        parse_time = measure(partial(parse, model, page))
+        print(f"{label:<40} {parse_time:>8.3f}ms {retained(model, page) / 1024:>8.0f}kB")
+
+
+if __name__ == "__main__":
+    main()
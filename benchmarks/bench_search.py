@@ -0,0 +1,69 @@
+"""Compare parsing search and trending pages with and without the mediaType discriminator.
+
+The untagged models validate each result against every member of the union until one
+fits, the tagged models in asyncpow.models.search go straight to the model named by the
+mediaType of the result.
+
+Run from the repository root with ``python -m benchmarks.bench_search``.
+"""
+
+from functools import partial
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from asyncpow.models.search import (
+    MovieResultModel,
+    PersonResultModel,
+    SearchResultModel,
+    TvResultModel,
+)
+from benchmarks import payloads
+from benchmarks.bench_codec import measure
+
+
+class UntaggedPersonResultModel(PersonResultModel):
+    """Person result whose knownFor is a plain union."""
+
+    knownFor: list[MovieResultModel | TvResultModel]
+
+
+class UntaggedSearchResultModel(SearchResultModel):
+    """Search page whose results are a plain union."""
+
+    results: list[MovieResultModel | TvResultModel | UntaggedPersonResultModel]  # type: ignore[assignment]
+
+
+PAYLOADS: dict[str, Callable[[], dict[str, Any]]] = {
+    "search page": lambda: payloads.search_page(20),
+    "search x 500": lambda: payloads.search_page(500),
+    "trending page": lambda: payloads.search_page(20, "/discover/trending"),
+    "trending x 500": lambda: payloads.search_page(500, "/discover/trending"),
+}
+
+
+def parse(model: type[BaseModel], page: dict[str, Any]) -> BaseModel:
+    """Validate a page the way the API classes do.
+
+    Args:
+        model (type[BaseModel]): The page model.
+        page (dict[str, Any]): The decoded page.
+
+    Returns:
+        BaseModel: The validated page.
+    """
+    return model(**page)
+
+
+def main() -> None:
+    """Print the parse time of each payload with the untagged and the tagged models."""
+    print(f"{'payload':<16} {'untagged':>12} {'tagged':>12} {'speedup':>8}")
+    for label, build in PAYLOADS.items():
+        page = build()
+        untagged = measure(partial(parse, UntaggedSearchResultModel, page))
+        tagged = measure(partial(parse, SearchResultModel, page))
+        print(f"{label:<16} {untagged:>10.3f}ms {tagged:>10.3f}ms {untagged / tagged:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Compare peak memory and time to the first item of streamed and buffered list pages.
+
+Both modes read the same page from the local mock server, which runs in a child process so
+only the allocations of the client are traced. Run from the repository root with ``python
+-m benchmarks.bench_stream``.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Any, AsyncIterator, Callable, cast
+
+from asyncpow import Overseerr
+from asyncpow.models.media import MediaModel
+from asyncpow.models.request import RequestResultsResponseModel
+from benchmarks.server import API_KEY, StubProcess
+
+SIZES = (100, 1000, 5000)
+
+Mode = Callable[[Overseerr, int], AsyncIterator[Any]]
+
+
+async def _buffered_media(client: Overseerr, take: int) -> AsyncIterator[Any]:
+    """Yield the results of a page read with async_get_media.
+
+    Args:
+        client (Overseerr): The client.
+        take (int): The page size.
+
+    Yields:
+        Any: The media items.
+    """
+    page = cast(MediaModel, await client.media.async_get_media(take=take))
+    for item in page.results:
+        yield item
+
+
+async def _buffered_requests(client: Overseerr, take: int) -> AsyncIterator[Any]:
+    """Yield the results of a page read with async_get_requests.
+
+    Args:
+        client (Overseerr): The client.
+        take (int): The page size.
+
+    Yields:
+        Any: The requests.
+    """
+    page = cast(RequestResultsResponseModel, await client.request.async_get_requests(take=take))
+    for item in page.results:
+        yield item
+
+
+MODES: dict[str, dict[str, Mode]] = {
+    "media": {
+        "buffered": _buffered_media,
+        "streamed": lambda client, take: client.media.async_stream_media(take=take),
+    },
+    "request": {
+        "buffered": _buffered_requests,
+        "streamed": lambda client, take: client.request.async_stream_requests(take=take),
+    },
+}
+
+
+async def measure(
+    client: Overseerr, mode: Mode, take: int, trace: bool = False
+) -> tuple[float, float, int]:
+    """Consume a page item by item, dropping each item before the next arrives.
+
+    Tracing slows allocations down, so times should come from a run without it.
+
+    Args:
+        client (Overseerr): The client.
+        mode (Mode): Yields the items of the page.
+        take (int): The page size.
+        trace (bool): Trace the peak memory allocated (default is False).
+
+    Returns:
+        tuple[float, float, int]: Time to the first item and to the last in milliseconds,
+            and the peak bytes allocated, 0 when not traced.
+    """
+    first, peak = 0.0, 0
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    async for _ in mode(client, take):
+        first = first or time.perf_counter() - start
+    total = time.perf_counter() - start
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return first * 1000, total * 1000, peak
+
+
+async def run(endpoints: list[str], sizes: list[int]) -> None:
+    """Print the results of both modes for every endpoint and page size.
+
+    Args:
+        endpoints (list[str]): The endpoints to read.
+        sizes (list[int]): The page sizes.
+
+    Returns:
+        None
+    """
+    print(f"{'endpoint':<8} {'size':>6} {'mode':<8} {'first':>10} {'total':>10} {'peak':>10}")
+    for size in sizes:
+        with StubProcess(total_results=size) as stub:
+            async with Overseerr(stub.host, API_KEY, port=stub.port, tls=False) as client:
+                for endpoint in endpoints:
+                    for name, mode in MODES[endpoint].items():
+                        await measure(client, mode, size)
+                        first, total, _ = await measure(client, mode, size)
+                        peak = (await measure(client, mode, size, trace=True))[2]
+                        print(
+                            f"{endpoint:<8} {size:>6} {name:<8} {first:>8.2f}ms "
+                            f"{total:>8.2f}ms {peak / 1024:>8.0f}kB"
+                        )
+
+
+def main() -> None:
+    """Run the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--endpoint", nargs="+", choices=MODES, default=list(MODES), dest="endpoints"
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    args = parser.parse_args()
+    asyncio.run(run(args.endpoints, args.sizes))
+
+
+if __name__ == "__main__":
+    main()
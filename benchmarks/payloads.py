@@ -0,0 +1,100 @@
+"""Payloads shaped after the Overseerr API schemas, used by the benchmarks.
+
+They are generated from the OpenAPI spec by ``asyncpow.testing.generator``, with array
+lengths close to what a real instance returns.
+"""
+
+from typing import Any
+
+from asyncpow.testing.generator import PayloadGenerator
+
+# Array lengths of the responses, by path. Media rows leave out their nested requests,
+# pass a length for MediaInfo.requests to add them.
+LENGTHS = {
+    "MediaInfo.requests": 0,
+    "/search.results": 20,
+    "/discover/trending.results": 20,
+    "TvDetails.seasons": 8,
+    "TvDetails.credits.cast": 50,
+    "TvDetails.credits.crew": 50,
+    "MovieDetails.credits.cast": 50,
+    "MovieDetails.credits.crew": 50,
+}
+
+
+def generator(**lengths: int) -> PayloadGenerator:
+    """Create a generator using LENGTHS, two levels of nesting deep.
+
+    Args:
+        **lengths (int): Array lengths overriding LENGTHS, by path.
+
+    Returns:
+        PayloadGenerator: The generator.
+    """
+    return PayloadGenerator(depth=2, lengths=LENGTHS | lengths)
+
+
+# Shared by the builders below, so the spec is parsed once
+_GENERATOR = generator()
+
+
+def _response(path: str, items: int | None = None, **lengths: int) -> Any:
+    """Build a response with the shared generator.
+
+    Args:
+        path (str): The API path as written in the spec.
+        items (int, optional): Number of results. Defaults to LENGTHS.
+        **lengths (int): Array lengths overriding LENGTHS, by path.
+
+    Returns:
+        Any: The response body.
+    """
+    _GENERATOR.lengths = LENGTHS | lengths
+    return _GENERATOR.response(path, items)
+
+
+def media_page(items: int, requests: int = 0) -> dict[str, Any]:
+    """Build a /media page.
+
+    Args:
+        items (int): Number of media rows.
+        requests (int): Number of nested requests per row (default is 0).
+
+    Returns:
+        dict[str, Any]: The page.
+    """
+    return _response("/media", items, **{"MediaInfo.requests": requests})
+
+
+def request_page(items: int) -> dict[str, Any]:
+    """Build a /request page.
+
+    Args:
+        items (int): Number of request rows.
+
+    Returns:
+        dict[str, Any]: The page.
+    """
+    return _response("/request", items)
+
+
+def search_page(items: int = 20, path: str = "/search") -> dict[str, Any]:
+    """Build a /search or /discover/trending page of movies, shows and people in turn.
+
+    Args:
+        items (int): Number of results (default is 20).
+        path (str): "/search" or "/discover/trending" (default is "/search").
+
+    Returns:
+        dict[str, Any]: The page.
+    """
+    return _response(path, items, **{"PersonResult.knownFor": 3})
+
+
+def tv_details() -> dict[str, Any]:
+    """Build a /tv/{tvId} response with 8 seasons and 50 cast and crew members.
+
+    Returns:
+        dict[str, Any]: The TV details.
+    """
+    return _response("/tv/{tvId}")
@@ -0,0 +1,150 @@
+"""Local mock of the Overseerr API serving the benchmark payloads.
+
+Runs ``asyncpow.testing.mock_server.MockOverseerr`` without faults, with the array lengths
+of ``benchmarks.payloads``. Bodies are generated and encoded once per route and page size,
+so the server spends as little time as possible per request and the benchmarks measure the
+client rather than the server. Run it on its own with ``python -m benchmarks.server``.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+from typing import Any
+
+from asyncpow.testing.mock_server import MockOverseerr
+from benchmarks import payloads
+
+# Base64 of a millisecond timestamp and a UUID, the format Overseerr issues keys in.
+API_KEY = "MTcwMDAwMDAwMDAwMDAwMDAwMDAwLTAwMDAtNDAwMC04MDAwLTAwMDAwMDAwMDAwMA=="
+# Enough items behind the paginated endpoints that every benchmark page is full
+TOTAL_RESULTS = 1_000_000
+
+
+def create_mock(total_results: int = TOTAL_RESULTS) -> MockOverseerr:
+    """Create the mock server.
+
+    Args:
+        total_results (int): Number of items behind the paginated endpoints
+            (default is TOTAL_RESULTS).
+
+    Returns:
+        MockOverseerr: The server, not started.
+    """
+    return MockOverseerr(
+        api_key=API_KEY, total_results=total_results, generator=payloads.generator()
+    )
+
+
+async def _serve(host: str, port: int, total_results: int, queue: Any = None) -> None:
+    """Run the mock server until cancelled.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on, 0 picks a free one.
+        total_results (int): Number of items behind the paginated endpoints.
+        queue (multiprocessing.Queue, optional): Queue to put the bound port on once the
+            server is listening.
+
+    Returns:
+        None
+    """
+    mock = create_mock(total_results)
+    url = await mock.start(host, port)
+    if queue is not None:
+        queue.put(mock.port)
+    else:
+        print(f"Serving on {url} with API key {API_KEY!r}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await mock.stop()
+
+
+def _run(host: str, port: int, total_results: int, queue: Any = None) -> None:
+    """Run the mock server in a new event loop.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on, 0 picks a free one.
+        total_results (int): Number of items behind the paginated endpoints.
+        queue (multiprocessing.Queue, optional): Queue to put the bound port on.
+
+    Returns:
+        None
+    """
+    try:
+        asyncio.run(_serve(host, port, total_results, queue))
+    except KeyboardInterrupt:
+        pass
+
+
+class StubProcess:
+    """
+    Run the mock server in a child process, so it does not compete with the client for
+    the event loop.
+
+    Examples:
+        with StubProcess() as stub:
+            client = Overseerr(stub.host, API_KEY, port=stub.port, tls=False)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", total_results: int = TOTAL_RESULTS) -> None:
+        """
+        Initialize the StubProcess.
+
+        Args:
+            host (str): Interface to listen on (default is 127.0.0.1).
+            total_results (int): Number of items behind the paginated endpoints
+                (default is TOTAL_RESULTS).
+
+        Returns:
+            None
+        """
+        self.host = host
+        self.total_results = total_results
+        self.port = 0
+        self._process: multiprocessing.Process | None = None
+
+    def __enter__(self) -> "StubProcess":
+        """Start the server and wait until it listens.
+
+        Returns:
+            StubProcess: The running server.
+        """
+        queue: multiprocessing.Queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_run, args=(self.host, 0, self.total_results, queue), daemon=True
+        )
+        self._process.start()
+        self.port = queue.get(timeout=30)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server.
+
+        Args:
+            *exc_info: The exception raised in the block, if any.
+
+        Returns:
+            None
+        """
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+
+def main() -> None:
+    """Serve the mock until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument(
+        "--total-results", type=int, default=TOTAL_RESULTS, help="items behind each list"
+    )
+    args = parser.parse_args()
+    _run(args.host, args.port, args.total_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,13 @@ def format(session: Session) -> None:
     session.run("autoflake", "--in-place", ".")
 
 
+@nox.session(reuse_venv=True)
+def tests(session: Session) -> None:
+    """Run the test suite"""
+    session.run("poetry", "install", external=True)
+    session.run("pytest", *session.posargs)
+
+
 @nox.session(reuse_venv=True)
 def test_types(session: Session) -> None:
     """Check that typing is working as expected"""
@@ -36,6 +43,13 @@ def test_style(session: Session) -> None:
     session.run("bandit", ".")
 
 
+@nox.session(reuse_venv=True)
+def benchmark(session: Session) -> None:
+    """Run the client benchmarks and compare them with the last baseline"""
+    session.run("poetry", "install", "--extras", "testing", external=True)
+    session.run("python", "-m", "benchmarks.bench_client", *session.posargs)
+
+
 @nox.session(reuse_venv=True)
 def serve_docs(session: Session) -> None:
     """Create local copy of docs for testing"""
@@ -0,0 +1,156 @@
+"""Minimal aiohttp server answering the client in tests, counting the requests it gets."""
+
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+from aiohttp import web
+
+from asyncpow import Overseerr
+
+# Base64 of a millisecond timestamp and a UUID, the format Overseerr issues keys in.
+API_KEY = "MTcwMDAwMDAwMDAwMDAwMDAwMDAwLTAwMDAtNDAwMC04MDAwLTAwMDAwMDAwMDAwMA=="
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def json_handler(body: Any, status: int = 200, delay: float = 0.05) -> Handler:
+    """Build a handler returning a JSON body after a delay, so requests overlap.
+
+    Args:
+        body (Any): The body to return.
+        status (int): The response status (default is 200).
+        delay (float): Seconds to wait before answering (default is 0.05).
+
+    Returns:
+        Handler: The request handler.
+    """
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        """Return the body.
+
+        Args:
+            request (web.Request): The incoming request.
+
+        Returns:
+            web.StreamResponse: The response.
+        """
+        await asyncio.sleep(delay)
+        return web.json_response(body, status=status)
+
+    return handle
+
+
+def chunked_handler(body: bytes, size: int) -> Handler:
+    """Build a handler writing a raw body in chunks of a few bytes, flushing each one.
+
+    Args:
+        body (bytes): The body to write, sent as is even if it is not valid JSON.
+        size (int): Number of bytes per chunk.
+
+    Returns:
+        Handler: The request handler.
+    """
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        """Write the body chunk by chunk.
+
+        Args:
+            request (web.Request): The incoming request.
+
+        Returns:
+            web.StreamResponse: The response.
+        """
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for start in range(0, len(body), size):
+            await response.write(body[start : start + size])
+            await asyncio.sleep(0)
+        await response.write_eof()
+        return response
+
+    return handle
+
+
+class StubServer:
+    """
+    Serve a few routes on a free local port and count the requests to each path.
+
+    Routes are GET unless their key starts with a method, such as "POST /api/v1/request".
+
+    Examples:
+        async with StubServer({"/api/v1/tv/1399": json_handler({"id": 1399})}) as stub:
+            async with stub.client() as client:
+                await client.tv.async_get_tv(1399, raw_response=True)
+    """
+
+    def __init__(self, routes: dict[str, Handler]) -> None:
+        """
+        Initialize the StubServer.
+
+        Args:
+            routes (dict[str, Handler]): Handlers keyed on path, or on method and path.
+
+        Returns:
+            None
+        """
+        self.routes = routes
+        self.hits: Counter[str] = Counter()
+        self.port = 0
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> "StubServer":
+        """Start the server.
+
+        Returns:
+            StubServer: The running server.
+        """
+
+        @web.middleware
+        async def count(request: web.Request, handler: Handler) -> web.StreamResponse:
+            """Count the request before handling it.
+
+            Args:
+                request (web.Request): The incoming request.
+                handler (Handler): The route handler.
+
+            Returns:
+                web.StreamResponse: The response.
+            """
+            self.hits[request.path] += 1
+            return await handler(request)
+
+        app = web.Application(middlewares=[count])
+        for route, handler in self.routes.items():
+            method, _, path = route.rpartition(" ")
+            app.router.add_route(method or "GET", path, handler)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop the server.
+
+        Args:
+            *exc_info: The exception raised in the block, if any.
+
+        Returns:
+            None
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def client(self, **kwargs: Any) -> Overseerr:
+        """Create a client talking to the server.
+
+        Args:
+            **kwargs: Options passed to Overseerr.
+
+        Returns:
+            Overseerr: The client.
+        """
+        return Overseerr("127.0.0.1", API_KEY, port=self.port, tls=False, **kwargs)
@@ -0,0 +1,221 @@
+"""The circuit breaker fails fast while probing and never stays half-open after a lost trial."""
+
+import asyncio
+import time
+
+from aiohttp import ClientSession, web
+import pytest
+from yarl import URL
+
+from asyncpow.exceptions import POWCircuitOpenException, POWException, POWTimeoutException
+from asyncpow.utils.breaker import CircuitBreaker
+from asyncpow.utils.cache import ResponseCache
+from asyncpow.utils.http import request
+from asyncpow.utils.ratelimit import RateLimiter
+from asyncpow.utils.timeouts import deadline
+
+from tests.stub import StubServer, json_handler
+
+TV_PATH = "/api/v1/tv/1399"
+STATUS_PATH = "/api/v1/status"
+STATUS_BODY = {
+    "version": "1.33.2",
+    "commitTag": "v1.33.2",
+    "updateAvailable": False,
+    "commitsBehind": 0,
+    "restartRequired": False,
+}
+
+
+def test_cancelled_probe_reopens_the_circuit() -> None:
+    """A probe cancelled by wait_for leaves the circuit open, and a later probe closes it."""
+
+    async def scenario() -> None:
+        """Open the circuit, cancel the probe, then let the next probe succeed."""
+        status_delay = {"seconds": 0.5}
+
+        async def status(request: web.Request) -> web.Response:
+            """Answer the probe after the current delay.
+
+            Args:
+                request (web.Request): The incoming request.
+
+            Returns:
+                web.Response: The status.
+            """
+            await asyncio.sleep(status_delay["seconds"])
+            return web.json_response(STATUS_BODY)
+
+        routes = {TV_PATH: json_handler({"message": "down"}, status=500), STATUS_PATH: status}
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        async with StubServer(routes) as stub:
+            # Without coalescing the probe runs in the caller's task and is cancelled with it
+            async with stub.client(circuit_breaker=breaker, coalesce_requests=False) as client:
+                with pytest.raises(POWException):
+                    await client.tv.async_get_tv(1399)
+                assert breaker.state == "open"
+
+                await asyncio.sleep(0.1)
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(client.tv.async_get_tv(1399), 0.1)
+                assert breaker.state == "open"
+
+                status_delay["seconds"] = 0
+                await asyncio.sleep(0.1)
+                await client.status.async_get_status()
+                assert breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_probe_timeout_counts_as_failure() -> None:
+    """A probe that hangs is abandoned after trial_timeout and the circuit opens again."""
+
+    async def scenario() -> None:
+        """Probe with a check that never returns."""
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=0,
+            probe=lambda: asyncio.sleep(10),
+            trial_timeout=0.05,
+        )
+        breaker.record_failure(POWTimeoutException())
+        with pytest.raises(POWCircuitOpenException):
+            await breaker.before_request()
+        assert breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_trial_failing_before_it_is_sent_reopens_the_circuit() -> None:
+    """A trial request that times out waiting for the rate limiter releases the trial."""
+
+    async def scenario() -> None:
+        """Send the trial with a deadline shorter than the rate limiter wait."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        limiter = RateLimiter(rate=0.1, burst=1)
+        async with StubServer({TV_PATH: json_handler({"message": "down"}, 500)}) as stub:
+            url = URL.build(scheme="http", host="127.0.0.1", port=stub.port, path=TV_PATH)
+            async with ClientSession() as session:
+                with pytest.raises(POWException):
+                    await request(session, url, rate_limiter=limiter, circuit_breaker=breaker)
+                assert breaker.state == "open"
+
+                await asyncio.sleep(0.1)
+                with pytest.raises(POWTimeoutException), deadline(0.05):
+                    await request(session, url, rate_limiter=limiter, circuit_breaker=breaker)
+                assert breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_trial_reopens_the_circuit() -> None:
+    """Cancelling the trial request releases it instead of blocking every later request."""
+
+    async def scenario() -> None:
+        """Cancel a trial request while it waits for the response."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        async with StubServer({TV_PATH: json_handler({"id": 1399}, delay=1)}) as stub:
+            url = URL.build(scheme="http", host="127.0.0.1", port=stub.port, path=TV_PATH)
+            breaker.record_failure(POWTimeoutException())
+            await asyncio.sleep(0.1)
+            async with ClientSession() as session:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        request(session, url, circuit_breaker=breaker), timeout=0.1
+                    )
+            assert breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_trial_without_outcome_expires() -> None:
+    """A half-open trial that never reports back is replaced after trial_timeout."""
+
+    async def scenario() -> None:
+        """Start a trial and never record its outcome."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, trial_timeout=0.05)
+        breaker.record_failure(POWTimeoutException())
+        await breaker.before_request()
+        assert breaker.state == "half_open"
+        with pytest.raises(POWCircuitOpenException):
+            await breaker.before_request()
+
+        await asyncio.sleep(0.1)
+        await breaker.before_request()
+        assert breaker.state == "half_open"
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_half_open_requests_fail_fast() -> None:
+    """Requests arriving while the probe runs are rejected at once, not queued behind it."""
+
+    async def scenario() -> float:
+        """Start a slow probe and time a request made while it runs."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0, probe=lambda: asyncio.sleep(0.5)
+        )
+        breaker.record_failure(POWTimeoutException())
+        probe = asyncio.create_task(breaker.before_request())
+        await asyncio.sleep(0.05)
+        assert breaker.state == "half_open"
+
+        started = time.monotonic()
+        with pytest.raises(POWCircuitOpenException):
+            await breaker.before_request()
+        elapsed = time.monotonic() - started
+        await probe
+        assert breaker.state == "closed"
+        return elapsed
+
+    assert asyncio.run(scenario()) < 0.1
+
+
+@pytest.mark.parametrize("cache", [None, ResponseCache(ttl=60)])
+def test_probe_bypasses_the_cache_and_coalescing(cache: ResponseCache | None) -> None:
+    """The probe reaches the instance even if a status is cached or already in flight.
+
+    Args:
+        cache (ResponseCache | None): The response cache of the client.
+    """
+
+    async def scenario() -> None:
+        """Cache a status, open the circuit and get the status again."""
+        tv = {"status": 500}
+
+        async def show(request: web.Request) -> web.Response:
+            """Fail until the instance recovers.
+
+            Args:
+                request (web.Request): The incoming request.
+
+            Returns:
+                web.Response: The show, or an error.
+            """
+            return web.json_response({"id": 1399}, status=tv["status"])
+
+        routes = {TV_PATH: show, STATUS_PATH: json_handler(STATUS_BODY, delay=0)}
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05, trial_timeout=1)
+        async with StubServer(routes) as stub:
+            async with stub.client(circuit_breaker=breaker, cache=cache) as client:
+                await client.status.async_get_status()
+                with pytest.raises(POWException):
+                    await client.tv.async_get_tv(1399, raw_response=True)
+                assert breaker.state == "open"
+
+                tv["status"] = 200
+                await asyncio.sleep(0.1)
+                started = time.monotonic()
+                if cache is None:
+                    # The probe runs inside the shared status request it would join
+                    await client.status.async_get_status()
+                else:
+                    await client.tv.async_get_tv(1399, raw_response=True)
+                assert time.monotonic() - started < 0.5
+                assert breaker.state == "closed"
+            assert stub.hits[STATUS_PATH] == (3 if cache is None else 2)
+
+    asyncio.run(scenario())
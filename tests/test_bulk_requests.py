@@ -0,0 +1,170 @@
+"""Bulk requests record an outcome per item and skip what is already requested."""
+
+import asyncio
+from typing import Any
+
+from aiohttp import web
+import pytest
+
+from asyncpow.indexes.media import MediaIndex
+from asyncpow.models.request import BulkRequestResultModel
+from asyncpow.utils.cache import ResponseCache
+
+from tests.stub import Handler, StubServer
+
+REQUEST_ROUTE = "POST /api/v1/request"
+TV_ROUTE = "/api/v1/tv/{id}"
+TV_BODY = {
+    "id": 1399,
+    "externalIds": {"tvdbId": 121361},
+    "seasons": [{"seasonNumber": number} for number in (0, 1, 2, 3)],
+}
+CONFLICT_ID = 409
+FAILING_ID = 500
+# TMDB ID and status of the media already known to the index
+INDEXED = {20: 2, 30: 3, 50: 5, 40: 4}
+
+
+async def show(request: web.Request) -> web.StreamResponse:
+    """Answer the details of any show, with three seasons and specials.
+
+    Args:
+        request (web.Request): The incoming request.
+
+    Returns:
+        web.StreamResponse: The response.
+    """
+    return web.json_response({**TV_BODY, "id": int(request.match_info["id"])})
+
+
+async def created(request: web.Request) -> web.StreamResponse:
+    """Answer a request like Overseerr.
+
+    Args:
+        request (web.Request): The incoming request.
+
+    Returns:
+        web.StreamResponse: The response.
+    """
+    body = await request.json()
+    return web.json_response({"id": 1, "media": {"tmdbId": body["mediaId"]}})
+
+
+def index() -> MediaIndex:
+    """Build an index of the INDEXED movies."""
+    media_index = MediaIndex(api=None)  # type: ignore[arg-type]
+    for tmdb_id, status in INDEXED.items():
+        media = {"id": tmdb_id, "mediaType": "movie", "tmdbId": tmdb_id}
+        media_index.add({**media, "status": status, "status4k": 1})
+    return media_index
+
+
+def test_outcome_of_each_item() -> None:
+    """Items are requested, skipped or failed, in order, each with its reason."""
+    posted: list[dict[str, Any]] = []
+
+    async def create(request: web.Request) -> web.StreamResponse:
+        """Answer a request like Overseerr, with a conflict or an error for some media.
+
+        Args:
+            request (web.Request): The incoming request.
+
+        Returns:
+            web.StreamResponse: The response.
+        """
+        body = await request.json()
+        posted.append(body)
+        if body["mediaId"] == CONFLICT_ID:
+            return web.json_response({"message": "Request already exists"}, status=409)
+        if body["mediaId"] == FAILING_ID:
+            return web.json_response({"message": "Internal error"}, status=500)
+        return web.json_response({"id": len(posted), "media": {"tmdbId": body["mediaId"]}})
+
+    items: list[Any] = [
+        (1, "movie"),
+        (20, "movie"),
+        (30, "movie"),
+        (50, "movie"),
+        (40, "movie"),
+        (CONFLICT_ID, "movie"),
+        (FAILING_ID, "movie"),
+        (1, "movie"),
+        (1399, "tv"),
+        (1399, "tv", "first"),
+        (20, "tv", "latest"),
+    ]
+
+    async def scenario() -> list[BulkRequestResultModel]:
+        """Submit the items against the stub."""
+        routes: dict[str, Handler] = {REQUEST_ROUTE: create, TV_ROUTE: show}
+        async with StubServer(routes) as stub:
+            async with stub.client() as client:
+                results = await client.request.async_post_requests(
+                    items, concurrency=2, media_index=index(), raw_response=True
+                )
+            # The seasons of a show are read once for the whole batch
+            assert stub.hits["/api/v1/tv/1399"] == stub.hits["/api/v1/tv/20"] == 1
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, BulkRequestResultModel) for result in results)
+    assert [(result.id, result.type, result.series) for result in results] == [
+        (item[0], item[1], item[2] if len(item) > 2 else "all") for item in items
+    ]
+    assert [result.outcome for result in results] == [
+        "requested",
+        "skipped",
+        "skipped",
+        "skipped",
+        "requested",
+        "skipped",
+        "failed",
+        "skipped",
+        "requested",
+        "skipped",
+        "requested",
+    ]
+    assert [result.reason for result in results[1:4]] == [
+        f"Media status is {status}" for status in (2, 3, 5)
+    ]
+    assert results[5].reason is not None and "409" in results[5].reason
+    assert results[6].reason is not None and "500" in results[6].reason
+    assert results[7].reason == results[9].reason == "Duplicate item"
+    for result in results:
+        if result.outcome == "requested":
+            assert isinstance(result.request, dict)
+            assert result.request["media"] == {"tmdbId": result.id}
+        else:
+            assert result.request is None
+
+    assert sorted(body["mediaId"] for body in posted) == sorted(
+        [1, 40, CONFLICT_ID, FAILING_ID, 1399, 20]
+    )
+    shows = {body["mediaId"]: body for body in posted if body["mediaType"] == "tv"}
+    assert (shows[1399]["seasons"], shows[1399]["tvdbId"]) == ([1, 2, 3], 121361)
+    assert shows[20]["seasons"] == [3]
+
+
+@pytest.mark.parametrize("cache, fetches", [(None, 2), (ResponseCache(), 1)])
+def test_seasons_come_from_the_response_cache(cache: ResponseCache | None, fetches: int) -> None:
+    """Details already in the response cache are not fetched again to read the seasons.
+
+    Args:
+        cache (ResponseCache | None): The response cache of the client.
+        fetches (int): The number of times the show is fetched.
+    """
+
+    async def scenario() -> list[BulkRequestResultModel]:
+        """Get the show, then request it."""
+        routes: dict[str, Handler] = {REQUEST_ROUTE: created, TV_ROUTE: show}
+        async with StubServer(routes) as stub:
+            async with stub.client(cache=cache) as client:
+                await client.tv.async_get_tv(1399, raw_response=True)
+                results = await client.request.async_post_requests(
+                    [(1399, "tv")], raw_response=True
+                )
+            assert stub.hits["/api/v1/tv/1399"] == fetches
+        return results
+
+    assert [result.outcome for result in asyncio.run(scenario())] == ["requested"]
@@ -0,0 +1,143 @@
+"""Identical GET requests in flight at the same time share one upstream request."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from asyncpow.exceptions import POWException
+
+from tests.stub import StubServer, json_handler
+
+TV_PATH = "/api/v1/tv/1399"
+TV_BODY = {"id": 1399, "name": "Game of Thrones", "seasons": [{"seasonNumber": 1}]}
+CALLERS = 50
+
+
+def test_concurrent_callers_share_one_request() -> None:
+    """N concurrent callers cause a single request and all get the response."""
+
+    async def scenario() -> None:
+        """Run the callers against the stub."""
+        async with StubServer({TV_PATH: json_handler(TV_BODY)}) as stub:
+            async with stub.client() as client:
+                results = await asyncio.gather(
+                    *(client.tv.async_get_tv(1399, raw_response=True) for _ in range(CALLERS))
+                )
+            assert stub.hits[TV_PATH] == 1
+            assert all(result == TV_BODY for result in results)
+
+    asyncio.run(scenario())
+
+
+def test_coalesced_callers_get_their_own_result() -> None:
+    """Changing the result of one caller does not change the others."""
+
+    async def scenario() -> None:
+        """Run the callers against the stub and mutate the first result."""
+        async with StubServer({TV_PATH: json_handler(TV_BODY)}) as stub:
+            async with stub.client() as client:
+                results = await asyncio.gather(
+                    *(client.tv.async_get_tv(1399, raw_response=True) for _ in range(CALLERS))
+                )
+            assert stub.hits[TV_PATH] == 1
+            assert len({id(result) for result in results}) == CALLERS
+            results[0]["name"] = "changed"
+            results[0]["seasons"].clear()
+            assert all(result == TV_BODY for result in results[1:])
+
+    asyncio.run(scenario())
+
+
+def test_different_requests_are_not_coalesced() -> None:
+    """Requests differing in their query are sent separately."""
+
+    async def scenario() -> None:
+        """Request the same show in two languages."""
+        async with StubServer({TV_PATH: json_handler(TV_BODY)}) as stub:
+            async with stub.client() as client:
+                await asyncio.gather(
+                    *(
+                        client.tv.async_get_tv(1399, lang=lang, raw_response=True)
+                        for lang in ("en", "de", "en", "de")
+                    )
+                )
+            assert stub.hits[TV_PATH] == 2
+
+    asyncio.run(scenario())
+
+
+def test_coalescing_disabled() -> None:
+    """Every caller sends its own request when coalescing is disabled."""
+
+    async def scenario() -> None:
+        """Run the callers with coalesce_requests=False."""
+        async with StubServer({TV_PATH: json_handler(TV_BODY)}) as stub:
+            async with stub.client(coalesce_requests=False) as client:
+                await asyncio.gather(
+                    *(client.tv.async_get_tv(1399, raw_response=True) for _ in range(CALLERS))
+                )
+            assert stub.hits[TV_PATH] == CALLERS
+
+    asyncio.run(scenario())
+
+
+def test_failure_is_shared() -> None:
+    """A failed shared request is raised to every caller."""
+
+    async def scenario() -> None:
+        """Run the callers against a failing stub."""
+        handler = json_handler({"message": "Internal error"}, status=500)
+        async with StubServer({TV_PATH: handler}) as stub:
+            async with stub.client() as client:
+                results = await asyncio.gather(
+                    *(client.tv.async_get_tv(1399, raw_response=True) for _ in range(CALLERS)),
+                    return_exceptions=True,
+                )
+            assert stub.hits[TV_PATH] == 1
+            assert all(isinstance(result, POWException) for result in results)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_caller_does_not_cancel_the_others() -> None:
+    """Cancelling the caller that started the request leaves it running for the rest."""
+
+    async def scenario() -> None:
+        """Cancel the first caller while the request is in flight."""
+        async with StubServer({TV_PATH: json_handler(TV_BODY, delay=0.2)}) as stub:
+            async with stub.client() as client:
+                tasks = [
+                    asyncio.create_task(client.tv.async_get_tv(1399, raw_response=True))
+                    for _ in range(CALLERS)
+                ]
+                await asyncio.sleep(0.05)
+                tasks[0].cancel()
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            assert stub.hits[TV_PATH] == 1
+            assert isinstance(results[0], asyncio.CancelledError)
+            assert all(result == TV_BODY for result in results[1:])
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("body", [["a", "b"], "plain text"])
+def test_coalesced_bodies_of_other_types(body: Any) -> None:
+    """Lists are copied for each caller, strings are immutable and returned as is.
+
+    Args:
+        body (Any): The response body.
+    """
+
+    async def scenario() -> None:
+        """Run two callers against the stub."""
+        async with StubServer({TV_PATH: json_handler(body)}) as stub:
+            async with stub.client() as client:
+                first, second = await asyncio.gather(
+                    *(client.tv.async_get_tv(1399, raw_response=True) for _ in range(2))
+                )
+            assert first == second == body
+            if isinstance(body, list):
+                assert first is not second
+
+    asyncio.run(scenario())
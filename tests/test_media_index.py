@@ -0,0 +1,54 @@
+"""The media index finds its rows by every ID, whatever the form of the string IDs."""
+
+from typing import Any
+
+import pytest
+
+from asyncpow.indexes.media import AVAILABLE, MediaIndex, _IdColumn
+
+
+def media(id: int, **fields: Any) -> dict[str, Any]:
+    """Build a raw media item, as returned by /media."""
+    return {
+        "id": id,
+        "mediaType": "movie",
+        "tmdbId": 1000 + id,
+        "status": AVAILABLE,
+        "status4k": 1,
+        **fields,
+    }
+
+
+@pytest.mark.parametrize("value", ["tt0111161", "tt12345678", "tt01234567", "tt", "nm1", "x"])
+def test_imdb_ids_round_trip(value: str) -> None:
+    """Padded, long and malformed IMDb IDs are all read back as they were stored."""
+    column = _IdColumn("tt", 7)
+    column.append()
+    column[0] = value
+
+    assert column[0] == value
+
+
+def test_string_ids_are_looked_up() -> None:
+    """IMDb IDs and rating keys are found both when stored as numbers and as strings."""
+    index = MediaIndex(api=None)  # type: ignore[arg-type]
+    index.add(media(1, imdbId="tt1375666", ratingKey="4567"))
+    index.add(media(2, imdbId="tt-odd", ratingKey="plex://movie/5d7768"))
+
+    assert index.by_imdb_id("tt1375666").id == 1  # type: ignore[union-attr]
+    assert index.by_rating_key("4567").ratingKey == "4567"  # type: ignore[union-attr]
+    assert index.by_imdb_id("tt-odd").id == 2  # type: ignore[union-attr]
+    assert index.by_rating_key("plex://movie/5d7768").id == 2  # type: ignore[union-attr]
+    assert index.by_rating_key("04567") is None
+
+
+def test_update_moves_the_lookups() -> None:
+    """Updating an item drops the lookups of its old IDs."""
+    index = MediaIndex(api=None)  # type: ignore[arg-type]
+    index.add(media(1, imdbId="tt-odd", ratingKey="12"))
+    index.add(media(1, imdbId="tt0000042", ratingKey=None))
+
+    assert len(index) == 1
+    assert index.by_imdb_id("tt-odd") is None
+    assert index.by_rating_key("12") is None
+    assert index.get(1).imdbId == "tt0000042"  # type: ignore[union-attr]
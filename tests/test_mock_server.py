@@ -0,0 +1,38 @@
+"""The mock server serves payloads generated from the spec shipped with the package."""
+
+import asyncio
+
+import pytest
+
+from asyncpow import Overseerr
+from asyncpow.models.media import MediaModel
+from asyncpow.models.search import SearchResultModel
+from asyncpow.models.tv import TvDetailsModel
+
+from tests.stub import API_KEY
+
+pytest.importorskip("yaml")
+
+from asyncpow.testing.mock_server import MockOverseerr  # noqa: E402
+
+
+def test_pages_and_details_follow_the_request() -> None:
+    """The pageInfo, page and ID of a response match the request, whatever is cached."""
+
+    async def scenario() -> tuple:
+        """Read two pages of media, a search page and two TV shows from the mock."""
+        async with MockOverseerr(api_key=API_KEY, total_results=250) as mock:
+            async with Overseerr(mock.host, API_KEY, port=mock.port, tls=False) as client:
+                first = await client.media.async_get_media(take=100)
+                last = await client.media.async_get_media(take=100, skip=200)
+                search = await client.search.async_get_search("query", page=3)
+                shows = [await client.tv.async_get_tv(id) for id in (1399, 7)]
+                return first, last, search, shows
+
+    first, last, search, shows = asyncio.run(scenario())
+
+    assert isinstance(first, MediaModel) and isinstance(last, MediaModel)
+    assert (first.pageInfo.page, len(first.results)) == (1, 100)
+    assert (last.pageInfo.page, last.pageInfo.pages, len(last.results)) == (3, 3, 50)
+    assert isinstance(search, SearchResultModel) and search.page == 3
+    assert [show.id for show in shows if isinstance(show, TvDetailsModel)] == [1399, 7]
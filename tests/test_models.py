@@ -0,0 +1,115 @@
+"""Projections keep only the requested fields, lazy lists validate rows on access."""
+
+from typing import Any
+
+from pydantic import BaseModel, ValidationError, field_validator
+import pytest
+
+from asyncpow.models.lazy import LazyList, LazyPageModel
+from asyncpow.models.media import MediaInfoModel
+from asyncpow.models.projection import projection, projection_page
+
+PAGE_INFO = {"page": 1, "pages": 1, "results": 3, "pageSize": 3}
+MEDIA = {
+    "id": 1,
+    "mediaType": "movie",
+    "tmdbId": 27205,
+    "status": 5,
+    "status4k": 1,
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "updatedAt": "2024-01-01T00:00:00.000Z",
+    "lastSeasonChange": "2024-01-01T00:00:00.000Z",
+}
+
+
+# IDs of the rows validated, cleared by each test
+VALIDATED: list[int] = []
+
+
+class Row(BaseModel):
+    """Row recording its validations in VALIDATED."""
+
+    id: int
+
+    @field_validator("id")
+    @classmethod
+    def count(cls, value: int) -> int:
+        """Record the validation of a row.
+
+        Args:
+            value (int): The ID of the row.
+
+        Returns:
+            int: The ID, unchanged.
+        """
+        VALIDATED.append(value)
+        return value
+
+
+def test_projection_keeps_only_the_requested_fields() -> None:
+    """Other keys are dropped without being validated, even if they are invalid."""
+    MediaIds = projection(MediaInfoModel, ["tmdbId", "id", "status", "id"])
+    item = MediaIds(**{**MEDIA, "mediaType": "not a media type", "requests": "not a list"})
+
+    assert list(MediaIds.model_fields) == ["tmdbId", "id", "status"]
+    assert item.model_dump() == {"tmdbId": 27205, "id": 1, "status": 5}
+    assert projection(MediaInfoModel, ("tmdbId", "id", "status")) is MediaIds
+
+
+def test_projection_validates_the_requested_fields() -> None:
+    """A requested field is still validated, and an unknown one is refused."""
+    MediaIds = projection(MediaInfoModel, ["id", "status"])
+    with pytest.raises(ValidationError):
+        MediaIds(**{**MEDIA, "status": "available"})
+    with pytest.raises(ValueError, match="no field title"):
+        projection(MediaInfoModel, ["id", "title"])
+
+
+def test_projection_page() -> None:
+    """The results of a projection page are compact models."""
+    Page = projection_page(MediaInfoModel, ["id"])
+    page: Any = Page.model_validate({"pageInfo": PAGE_INFO, "results": [MEDIA] * 3})
+
+    assert page.pageInfo.pageSize == 3
+    assert [result.model_dump() for result in page.results] == [{"id": 1}] * 3
+
+
+def test_lazy_list_validates_rows_on_access() -> None:
+    """Each row is validated the first time it is accessed, and only once."""
+    VALIDATED.clear()
+    rows = LazyList(Row, [{"id": 1}, {"id": 2}, {"id": 3}])
+
+    assert len(rows) == 3 and VALIDATED == []
+    assert rows[1].id == 2 and rows[1] is rows[1]
+    assert VALIDATED == [2]
+    assert [row.id for row in rows[::2]] == [1, 3]
+    assert [row.id for row in rows] == [1, 2, 3]
+    assert VALIDATED == [2, 1, 3]
+    assert repr(rows) == "LazyList[Row](3/3 validated)"
+
+
+def test_iter_models_does_not_keep_the_models() -> None:
+    """iter_models validates rows not yet accessed on every pass."""
+    VALIDATED.clear()
+    rows = LazyList(Row, [{"id": 1}, {"id": 2}])
+    rows[0]
+
+    assert [row.id for row in rows.iter_models()] == [1, 2]
+    assert [row.id for row in rows.iter_models()] == [1, 2]
+    assert VALIDATED == [1, 2, 2]
+    assert repr(rows) == "LazyList[Row](1/2 validated)"
+
+
+def test_invalid_row_raises_when_accessed() -> None:
+    """An invalid row does not fail the page, only the access to that row."""
+    page = LazyPageModel.from_response(
+        MediaInfoModel, {"pageInfo": PAGE_INFO, "results": [MEDIA, {"id": "x"}, MEDIA]}
+    )
+
+    assert page.pageInfo.results == 3
+    assert page.results[0].tmdbId == page.results[2].tmdbId == 27205
+    with pytest.raises(ValidationError):
+        page.results[1]
+    assert page.results.raw[1] == {"id": "x"}
+    with pytest.raises(ValidationError):
+        list(page.results)
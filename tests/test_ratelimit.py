@@ -0,0 +1,119 @@
+"""The rate limiter slows down when throttled and holds requests for the Retry-After delay."""
+
+import asyncio
+import time
+
+from aiohttp import hdrs, web
+import pytest
+from yarl import URL
+
+from asyncpow.utils.ratelimit import RateLimiter
+
+from tests.stub import Handler, StubServer
+
+BASE = URL("http://127.0.0.1/api/v1")
+TV_PATH = "/api/v1/tv/1399"
+MOVIE_PATH = "/api/v1/movie/550"
+RETRY_AFTER = 0.3
+
+
+def throttled_once(arrivals: list[float]) -> Handler:
+    """Build a handler answering 429 with a Retry-After to the first request only.
+
+    Args:
+        arrivals (list[float]): The monotonic time of each request is appended to it.
+
+    Returns:
+        Handler: The request handler.
+    """
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        """Throttle the first request and return a body to the others.
+
+        Args:
+            request (web.Request): The incoming request.
+
+        Returns:
+            web.StreamResponse: The response.
+        """
+        arrivals.append(time.monotonic())
+        if len(arrivals) == 1:
+            headers = {hdrs.RETRY_AFTER: str(RETRY_AFTER)}
+            return web.json_response({"message": "Too many requests"}, status=429, headers=headers)
+        return web.json_response({"id": 1399})
+
+    return handle
+
+
+def test_throttling_drops_the_rate() -> None:
+    """Each 429 halves the rate down to min_rate, successes bring it back up."""
+    limiter = RateLimiter(rate=8)
+    url = BASE / "tv" / "1399"
+
+    limiter.throttle(url)
+    assert limiter.default.rate == 4
+    for _ in range(10):
+        limiter.throttle(url)
+    assert limiter.default.rate == limiter.default.min_rate == 0.5
+    limiter.success(url)
+    assert limiter.default.rate == pytest.approx(0.6)
+    assert limiter.default.throttled == 11
+
+
+def test_wait_respects_retry_after() -> None:
+    """A throttled bucket holds its requests for Retry-After, other groups are not held."""
+    limiter = RateLimiter(rate=100, groups={"search": (100, None)})
+
+    async def scenario() -> tuple[float, float]:
+        """Throttle the default bucket and time a request to each bucket."""
+        limiter.throttle(BASE / "tv" / "1399", RETRY_AFTER)
+        started = time.monotonic()
+        await limiter.acquire(BASE / "search")
+        search = time.monotonic() - started
+        await limiter.acquire(BASE / "movie" / "550")
+        return search, time.monotonic() - started
+
+    search, movie = asyncio.run(scenario())
+
+    assert search < RETRY_AFTER / 2
+    assert movie >= RETRY_AFTER * 0.9
+
+
+def test_429_holds_other_requests_of_the_client() -> None:
+    """After a 429, the retry and the other requests wait for Retry-After."""
+    limiter = RateLimiter(rate=10)
+    arrivals: list[float] = []
+    movie_arrivals: list[float] = []
+
+    async def scenario() -> None:
+        """Get a throttled show, and a movie while the show waits to be retried."""
+
+        async def movie_handler(request: web.Request) -> web.StreamResponse:
+            """Record the arrival of the movie request.
+
+            Args:
+                request (web.Request): The incoming request.
+
+            Returns:
+                web.StreamResponse: The response.
+            """
+            movie_arrivals.append(time.monotonic())
+            return web.json_response({"id": 550})
+
+        routes = {TV_PATH: throttled_once(arrivals), MOVIE_PATH: movie_handler}
+        async with StubServer(routes) as stub:
+            async with stub.client(rate_limiter=limiter) as client:
+                show = asyncio.create_task(client.tv.async_get_tv(1399, raw_response=True))
+                while not arrivals:
+                    await asyncio.sleep(0.01)
+                await asyncio.sleep(0.05)
+                await client.movie.async_get_movie(550, raw_response=True)
+                assert await show == {"id": 1399}
+
+    asyncio.run(scenario())
+
+    assert len(arrivals) == 2
+    assert arrivals[1] - arrivals[0] >= RETRY_AFTER * 0.9
+    assert movie_arrivals[0] - arrivals[0] >= RETRY_AFTER * 0.9
+    assert limiter.default.throttled == 1
+    assert limiter.default.rate < limiter.default.max_rate
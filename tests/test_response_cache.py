@@ -0,0 +1,100 @@
+"""Cached responses are served to each caller as their own copy and revalidated once stale."""
+
+import asyncio
+
+from aiohttp import hdrs, web
+import pytest
+
+from asyncpow.utils.cache import ResponseCache
+
+from tests.stub import Handler, StubServer, json_handler
+
+TV_PATH = "/api/v1/tv/1399"
+TV_BODY = {"id": 1399, "name": "Game of Thrones", "seasons": [{"seasonNumber": 1}]}
+
+
+def test_changing_a_response_does_not_change_the_cache() -> None:
+    """Mutating the body of the fetch or of a hit leaves the next hit untouched."""
+
+    async def scenario() -> None:
+        """Fetch the show, mutate it, and read it back from the cache twice."""
+        async with StubServer({TV_PATH: json_handler(TV_BODY)}) as stub:
+            async with stub.client(cache=ResponseCache()) as client:
+                fetched = await client.tv.async_get_tv(1399, raw_response=True)
+                fetched["seasons"].clear()
+                hit = await client.tv.async_get_tv(1399, raw_response=True)
+                hit["name"] = "changed"
+                assert await client.tv.async_get_tv(1399, raw_response=True) == TV_BODY
+            assert stub.hits[TV_PATH] == 1
+
+    asyncio.run(scenario())
+
+
+def conditional_handler(validator: str, value: str, requests: list[dict]) -> Handler:
+    """Build a handler answering 304 to a request carrying the matching validator.
+
+    Args:
+        validator (str): ETag or Last-Modified.
+        value (str): The validator of the body.
+        requests (list[dict]): The conditional headers of each request are appended to it.
+
+    Returns:
+        Handler: The request handler.
+    """
+    conditional: dict[str, str] = {
+        hdrs.ETAG: hdrs.IF_NONE_MATCH,
+        hdrs.LAST_MODIFIED: hdrs.IF_MODIFIED_SINCE,
+    }
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        """Return the body, or 304 if the client already has it.
+
+        Args:
+            request (web.Request): The incoming request.
+
+        Returns:
+            web.StreamResponse: The response.
+        """
+        headers = {
+            name: request.headers[name] for name in conditional.values() if name in request.headers
+        }
+        requests.append(headers)
+        if headers.get(conditional[validator]) == value:
+            return web.Response(status=304, headers={validator: value})
+        return web.json_response(TV_BODY, headers={validator: value})
+
+    return handle
+
+
+@pytest.mark.parametrize(
+    "validator, value",
+    [(hdrs.ETAG, '"v1"'), (hdrs.LAST_MODIFIED, "Wed, 21 Oct 2015 07:28:00 GMT")],
+)
+def test_stale_response_is_revalidated(validator: str, value: str) -> None:
+    """An expired response is requested with its validator and served again on a 304.
+
+    Args:
+        validator (str): ETag or Last-Modified.
+        value (str): The validator of the body.
+    """
+    requests: list[dict] = []
+
+    async def scenario() -> tuple:
+        """Fetch the show, let it expire, and fetch it twice more."""
+        cache = ResponseCache(policies={"tv": 0.3})
+        async with StubServer({TV_PATH: conditional_handler(validator, value, requests)}) as stub:
+            async with stub.client(cache=cache) as client:
+                first = await client.tv.async_get_tv(1399, raw_response=True)
+                first["seasons"].clear()
+                await asyncio.sleep(0.4)
+                revalidated = await client.tv.async_get_tv(1399, raw_response=True)
+                hit = await client.tv.async_get_tv(1399, raw_response=True)
+        return revalidated, hit, cache.stats
+
+    revalidated, hit, stats = asyncio.run(scenario())
+
+    conditional = hdrs.IF_NONE_MATCH if validator == hdrs.ETAG else hdrs.IF_MODIFIED_SINCE
+    assert requests == [{}, {conditional: value}]
+    assert revalidated == hit == TV_BODY
+    assert (stats.revalidations, stats.not_modified) == (1, 1)
+    assert (stats.hits, stats.misses) == (1, 2)
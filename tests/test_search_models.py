@@ -0,0 +1,57 @@
+"""Search results are validated as the model named by their mediaType."""
+
+import pytest
+
+from asyncpow.exceptions import POWMediaTypeException
+from asyncpow.models.search import MovieResultModel, PersonResultModel, SearchResultModel
+
+MOVIE = {
+    "id": 603,
+    "mediaType": "movie",
+    "popularity": 80.5,
+    "voteCount": 24000,
+    "voteAverage": 8.2,
+    "genreIds": [28, 878],
+    "overview": "A hacker learns the truth about his reality.",
+    "originalLanguage": "en",
+    "title": "The Matrix",
+    "originalTitle": "The Matrix",
+    "releaseDate": "1999-03-30",
+    "adult": False,
+    "video": False,
+}
+PERSON = {
+    "id": 6384,
+    "name": "Keanu Reeves",
+    "popularity": 40.1,
+    "adult": False,
+    "mediaType": "person",
+    "knownFor": [MOVIE],
+}
+
+
+def page(*results: dict) -> dict:
+    """Wrap results in a single search page."""
+    return {"page": 1, "totalPages": 1, "totalResults": len(results), "results": list(results)}
+
+
+def test_results_are_parsed_by_media_type() -> None:
+    """Each result, and each knownFor item of a person, becomes the model of its mediaType."""
+    results = SearchResultModel(**page(MOVIE, PERSON)).results
+
+    assert isinstance(results[0], MovieResultModel)
+    assert isinstance(results[1], PersonResultModel)
+    assert isinstance(results[1].knownFor[0], MovieResultModel)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        page({**MOVIE, "mediaType": "collection"}),
+        page({**PERSON, "knownFor": [{**MOVIE, "mediaType": "person"}]}),
+    ],
+)
+def test_unknown_media_type_raises(body: dict) -> None:
+    """A result or knownFor item with an unsupported mediaType raises POWMediaTypeException."""
+    with pytest.raises(POWMediaTypeException):
+        SearchResultModel(**body)
@@ -0,0 +1,76 @@
+"""The SQLite response cache keeps its file bounded and consistent with invalidations."""
+
+import asyncio
+from pathlib import Path
+import sqlite3
+
+from yarl import URL
+
+from asyncpow.utils.cache import SqliteResponseCache
+
+BASE = URL("http://127.0.0.1/api/v1")
+
+
+def movie(index: int) -> tuple[str, URL]:
+    """Key and URL of a movie details request."""
+    url = BASE / "movie" / str(index)
+    return f"GET {url}", url
+
+
+def rows(path: Path) -> int:
+    """Count the responses in a cache file."""
+    with sqlite3.connect(path) as db:
+        return db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def test_file_is_evicted_in_batches(tmp_path: Path) -> None:
+    """Going over max_entries evicts the oldest responses down to evict_ratio of it."""
+    path = tmp_path / "cache.sqlite"
+    cache = SqliteResponseCache(path, maxsize=8, ttl=60, max_entries=100, evict_ratio=0.5)
+    for index in range(101):
+        cache.set(*movie(index), {"id": index}, 60)
+    cache.flush()
+
+    assert rows(path) == 50
+    cache.set(*movie(0), {"id": 0}, 60)
+    cache.flush()
+    assert rows(path) == 51
+    cache.close()
+
+    reopened = SqliteResponseCache(path, maxsize=8, ttl=60, warm_start=False)
+    assert asyncio.run(reopened.async_get(movie(100)[0])) == {"id": 100}
+    assert asyncio.run(reopened.async_get(movie(1)[0])) is None
+    reopened.close()
+
+
+def test_replacing_a_response_keeps_the_count(tmp_path: Path) -> None:
+    """Storing a key again does not count as a new response."""
+    path = tmp_path / "cache.sqlite"
+    cache = SqliteResponseCache(path, ttl=60, max_entries=3, evict_ratio=1)
+    for _ in range(5):
+        for index in range(3):
+            cache.set(*movie(index), {"id": index}, 60)
+    cache.flush()
+
+    assert rows(path) == 3
+    assert cache.get(movie(0)[0]) == {"id": 0}
+    cache.close()
+
+
+def test_invalidation_reaches_the_file(tmp_path: Path) -> None:
+    """A read from the file after an invalidation never sees the removed response."""
+    path = tmp_path / "cache.sqlite"
+    cache = SqliteResponseCache(path, maxsize=1, ttl=60)
+    key, url = movie(1)
+    cache.set(key, url, {"id": 1}, 60)
+    cache.set(*movie(2), {"id": 2}, 60)
+
+    async def scenario() -> tuple:
+        """Read the response back from the file, invalidate it and read it again."""
+        before = await cache.async_get(key)
+        cache.invalidate_url(url)
+        return before, await cache.async_get(key)
+
+    assert asyncio.run(scenario()) == ({"id": 1}, None)
+    cache.close()
+    assert rows(path) == 1
@@ -0,0 +1,113 @@
+"""The results parser yields the same items however the body is split into chunks."""
+
+import asyncio
+import json
+
+import pytest
+
+from asyncpow.exceptions import POWException
+from asyncpow.utils.stream import ResultsParser
+
+from tests.stub import StubServer, chunked_handler
+
+MEDIA_PATH = "/api/v1/media"
+RESULTS = [
+    {"id": 1, "title": 'Say "hi"\\\n', "tags": ["a,b", "]}"], "score": 12345.5},
+    {"id": 2, "title": "Amélie ☃ 🎬", "nested": {"deep": {"list": [[], {}]}}},
+    {"id": 3, "title": None, "seasons": [{"number": 10}, {"number": 200}], "ok": True},
+]
+ENVELOPE = {"pageInfo": {"page": 1, "pages": 1, "results": 3}, "note": "\\u007d"}
+BODY = json.dumps(
+    {"pageInfo": ENVELOPE["pageInfo"], "results": RESULTS, "note": ENVELOPE["note"]},
+    ensure_ascii=False,
+    indent=1,
+).encode()
+
+
+def parse(body: bytes, size: int) -> tuple[list, dict]:
+    """Feed a body to a parser in chunks of a number of bytes."""
+    parser = ResultsParser()
+    items = []
+    for start in range(0, len(body), size):
+        items += parser.feed(body[start : start + size])
+    items += parser.feed(b"", final=True)
+    return items, parser.envelope
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_chunk_boundaries(size: int) -> None:
+    """Strings, escapes, multibyte characters, numbers and nested objects survive any split.
+
+    Args:
+        size (int): Number of bytes per chunk.
+    """
+    assert parse(BODY, size) == (RESULTS, ENVELOPE)
+
+
+def test_items_are_yielded_as_they_complete() -> None:
+    """An item is returned by the chunk that completes it, not at the end of the body."""
+    parser = ResultsParser()
+    assert parser.feed(b'{"results": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b": 2}, 3") == [{"id": 2}]
+    assert parser.feed(b"4]") == [34]
+    assert not parser.done
+    assert parser.feed(b"}", final=True) == [] and parser.done
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        BODY[:-1],
+        BODY[: len(BODY) // 2],
+        b'{"results": [{"id": 1}, {"id": 2',
+        b'{"results": [{"id": 1}, {"id": ]}',
+        b'{"results": [1] "pageInfo": {}}',
+        b'{"results" [1]}',
+        b'["results"]',
+        b"",
+    ],
+)
+def test_truncated_or_invalid_body(body: bytes) -> None:
+    """A body that is cut short or is not a JSON object raises ValueError.
+
+    Args:
+        body (bytes): The body.
+    """
+    with pytest.raises(ValueError):
+        parse(body, 5)
+
+
+def test_stream_over_http() -> None:
+    """Items written a few bytes at a time by the server come out whole."""
+
+    async def scenario() -> tuple[list, dict]:
+        """Stream the media of the stub."""
+        envelope: dict = {}
+        async with StubServer({MEDIA_PATH: chunked_handler(BODY, 3)}) as stub:
+            async with stub.client() as client:
+                items = [
+                    item
+                    async for item in client.media.async_stream_media(
+                        raw_response=True, envelope=envelope
+                    )
+                ]
+        return items, envelope
+
+    assert asyncio.run(scenario()) == (RESULTS, ENVELOPE)
+
+
+def test_truncated_stream_over_http() -> None:
+    """A response ending part way through the object raises POWException."""
+
+    async def scenario() -> list:
+        """Stream a truncated body from the stub."""
+        items = []
+        truncated = BODY[: BODY.index(b'"id": 3')]
+        async with StubServer({MEDIA_PATH: chunked_handler(truncated, 16)}) as stub:
+            async with stub.client() as client:
+                with pytest.raises(POWException):
+                    async for item in client.media.async_stream_media(raw_response=True):
+                        items.append(item)
+        return items
+
+    assert asyncio.run(scenario()) == RESULTS[:2]
@@ -0,0 +1,118 @@
+"""Deadlines bound a whole call, nested blocks and retries included."""
+
+import asyncio
+import time
+from typing import Any
+
+from aiohttp import hdrs, web
+import pytest
+
+from asyncpow.exceptions import (
+    POWConnectionException,
+    POWRateLimitException,
+    POWTimeoutException,
+)
+from asyncpow.utils.timeouts import budget, deadline, remaining
+
+from tests.stub import Handler, StubServer
+
+TV_PATH = "/api/v1/tv/1399"
+DEADLINE = 0.3
+
+
+async def reset(request: web.Request) -> web.StreamResponse:
+    """Drop the connection without answering, so the client retries.
+
+    Args:
+        request (web.Request): The incoming request.
+
+    Returns:
+        web.StreamResponse: Never sent.
+    """
+    if request.transport is not None:
+        request.transport.abort()
+    return web.Response(status=499)
+
+
+async def throttle(request: web.Request) -> web.StreamResponse:
+    """Answer 429 with a Retry-After longer than the deadline.
+
+    Args:
+        request (web.Request): The incoming request.
+
+    Returns:
+        web.StreamResponse: The response.
+    """
+    return web.json_response({}, status=429, headers={hdrs.RETRY_AFTER: "5"})
+
+
+def test_nested_deadlines_only_shorten_the_budget() -> None:
+    """An inner deadline cannot extend the outer one, and leaving it restores the outer."""
+    assert remaining() is None and budget(None) is None and budget(3) == 3
+
+    with deadline(1):
+        outer = remaining()
+        assert outer is not None and 0.9 < outer <= 1
+        with deadline(5):
+            inner = remaining()
+            assert inner is not None and inner <= outer
+        with deadline(0.1):
+            shortest = budget(10)
+            assert shortest is not None and shortest <= 0.1
+        assert budget(0.5) == 0.5
+        with deadline(-1):
+            expired = remaining()
+            assert expired is not None and expired < 0
+            assert budget(None) == budget(10) == 0
+
+    assert remaining() is None
+
+
+def test_deadline_follows_tasks() -> None:
+    """Tasks started inside a deadline share it, tasks started outside do not."""
+
+    async def left() -> float | None:
+        """Read the time left from inside a task."""
+        return remaining()
+
+    async def scenario() -> tuple:
+        """Start a task inside and outside a deadline."""
+        with deadline(1):
+            inside = asyncio.create_task(left())
+        outside = asyncio.create_task(left())
+        return await inside, await outside
+
+    inside, outside = asyncio.run(scenario())
+    assert inside is not None and inside <= 1
+    assert outside is None
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+@pytest.mark.parametrize(
+    "handler, exception",
+    [
+        (reset, (POWConnectionException, POWTimeoutException)),
+        (throttle, POWRateLimitException),
+    ],
+)
+def test_deadline_expires_during_retry_backoff(
+    handler: Handler, exception: Any, coalesce: bool
+) -> None:
+    """A call failing over and over gives up by its deadline instead of backing off past it.
+
+    Args:
+        handler (Handler): Handler failing every request.
+        exception (Any): The exception, or exceptions, the call may end with.
+        coalesce (bool): Whether the call goes through request coalescing.
+    """
+
+    async def scenario() -> float:
+        """Call the failing stub under a deadline and time it."""
+        async with StubServer({TV_PATH: handler}) as stub:
+            async with stub.client(coalesce_requests=coalesce) as client:
+                started = time.monotonic()
+                with pytest.raises(exception), deadline(DEADLINE):
+                    await client.tv.async_get_tv(1399, raw_response=True)
+                return time.monotonic() - started
+
+    assert asyncio.run(scenario()) < DEADLINE + 0.2